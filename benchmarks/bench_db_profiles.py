@@ -0,0 +1,93 @@
+"""
+Benchmark of the SQLite PRAGMA profiles defined in `config.py`.
+
+For every profile a fresh database is created in a temporary directory and
+two workloads are measured through the regular repository layer:
+
+- Commit latency: one `VenueRepository.save` (one commit) per row.
+- Read throughput: repeated `VenueRepository.get_all` over the inserted rows.
+
+Usage:
+    uv run python benchmarks/bench_db_profiles.py [--rows N] [--reads N]
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from config import DB_PRAGMA_PROFILES
+from core.models.venue import Venue
+from data.database import DatabaseConnector
+from repository.venue_repo import VenueRepository
+
+
+def bench_profile(profile: str, rows: int, reads: int) -> dict[str, float]:
+    """
+    Runs both workloads against a fresh database using the given profile.
+
+    Args:
+        profile (str): Name of the PRAGMA profile.
+        rows (int): Number of single-row commits to measure (at least 1).
+        reads (int): Number of full-table reads to measure (at least 1).
+
+    Returns:
+        dict[str, float]: Latency percentiles (ms) and read throughput (rows/s).
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseConnector(db_path=Path(tmp) / "bench.db", profile=profile)
+        repo = VenueRepository(db)
+
+        latencies = []
+        for i in range(rows):
+            venue = Venue(venue_name=f"Local {i}", supervisor_name="Supervisor")
+            start = time.perf_counter()
+            repo.save(venue)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        for _ in range(reads):
+            repo.get_all()
+        elapsed = time.perf_counter() - start
+
+        db.close()
+
+    latencies.sort()
+    return {
+        "commit_p50_ms": statistics.median(latencies),
+        "commit_p95_ms": latencies[max(int(len(latencies) * 0.95) - 1, 0)],
+        "read_rows_per_s": rows * reads / elapsed,
+    }
+
+
+def positive_int(value: str) -> int:
+    """argparse type accepting only integers >= 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=positive_int, default=500)
+    parser.add_argument("--reads", type=positive_int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'profile':<12} {'commit p50':>12} {'commit p95':>12} {'read rows/s':>14}")
+    for profile in DB_PRAGMA_PROFILES:
+        result = bench_profile(profile, args.rows, args.reads)
+        print(
+            f"{profile:<12} "
+            f"{result['commit_p50_ms']:>10.3f}ms "
+            f"{result['commit_p95_ms']:>10.3f}ms "
+            f"{result['read_rows_per_s']:>14,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
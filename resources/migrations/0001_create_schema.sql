@@ -1,3 +1,5 @@
+-- Migration 0001: initial schema.
+
 -- CREATE VENUE TABLE
 CREATE TABLE IF NOT EXISTS venues (
     venue_id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -0,0 +1,27 @@
+-- Migration 0002: secondary indexes for foreign keys and hot lookups.
+
+-- INTERNS
+CREATE INDEX IF NOT EXISTS idx_interns_venue_id ON interns(venue_id);
+CREATE INDEX IF NOT EXISTS idx_interns_name_nocase ON interns(name COLLATE NOCASE);
+
+-- VENUES
+CREATE INDEX IF NOT EXISTS idx_venues_name_nocase ON venues(venue_name COLLATE NOCASE);
+
+-- DOCUMENTS
+CREATE INDEX IF NOT EXISTS idx_documents_intern_id ON documents(intern_id);
+CREATE INDEX IF NOT EXISTS idx_documents_status ON documents(status);
+CREATE INDEX IF NOT EXISTS idx_documents_pending ON documents(intern_id)
+    WHERE status = 'Pendente';
+
+-- OBSERVATIONS
+CREATE INDEX IF NOT EXISTS idx_observations_intern_id
+    ON observations(intern_id, last_update);
+
+-- MEETINGS
+CREATE INDEX IF NOT EXISTS idx_meetings_intern_id
+    ON meetings(intern_id, meeting_date);
+CREATE INDEX IF NOT EXISTS idx_meetings_meeting_date ON meetings(meeting_date);
+
+-- GRADES
+-- (intern_id, criteria_id) is already covered by the UNIQUE constraint.
+CREATE INDEX IF NOT EXISTS idx_grades_criteria_id ON grades(criteria_id);
@@ -0,0 +1,13 @@
+-- Migration 0003: index adjustments found by checking the query plans.
+
+-- DOCUMENTS
+-- The only status lookup is the pending count, which the partial index
+-- idx_documents_pending answers alone; the full status index only cost writes.
+DROP INDEX IF EXISTS idx_documents_status;
+
+-- GRADES / OBSERVATIONS
+-- The full listings are ordered by last_update; without an index SQLite
+-- sorts the whole table in a temporary B-tree on every call.
+CREATE INDEX IF NOT EXISTS idx_grades_last_update ON grades(last_update);
+CREATE INDEX IF NOT EXISTS idx_observations_last_update
+    ON observations(last_update);
@@ -0,0 +1,12 @@
+-- Migration 0004: history of the database maintenance tasks.
+
+CREATE TABLE IF NOT EXISTS maintenance_runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    task TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    duration_ms REAL NOT NULL,
+    result TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_maintenance_runs_task
+    ON maintenance_runs(task, started_at);
@@ -0,0 +1,167 @@
+-- Migration 0005: change feed.
+--
+-- Every insert, update and delete on the application tables appends one row
+-- to `change_log`, so views can refresh only what changed since the sequence
+-- number they last saw. `operation` is 'I' (insert), 'U' (update) or
+-- 'D' (delete). Cascaded deletes fire the triggers of the child tables too.
+
+CREATE TABLE IF NOT EXISTS change_log (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    table_name TEXT NOT NULL,
+    row_id INTEGER NOT NULL,
+    operation TEXT NOT NULL CHECK (operation IN ('I', 'U', 'D'))
+);
+
+-- venues
+CREATE TRIGGER IF NOT EXISTS trg_venues_change_insert
+AFTER INSERT ON venues
+BEGIN
+    INSERT INTO change_log (table_name, row_id, operation)
+    VALUES ('venues', NEW.venue_id, 'I');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_venues_change_update
+AFTER UPDATE ON venues
+BEGIN
+    INSERT INTO change_log (table_name, row_id, operation)
+    VALUES ('venues', NEW.venue_id, 'U');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_venues_change_delete
+AFTER DELETE ON venues
+BEGIN
+    INSERT INTO change_log (table_name, row_id, operation)
+    VALUES ('venues', OLD.venue_id, 'D');
+END;
+
+-- interns
+CREATE TRIGGER IF NOT EXISTS trg_interns_change_insert
+AFTER INSERT ON interns
+BEGIN
+    INSERT INTO change_log (table_name, row_id, operation)
+    VALUES ('interns', NEW.intern_id, 'I');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_interns_change_update
+AFTER UPDATE ON interns
+BEGIN
+    INSERT INTO change_log (table_name, row_id, operation)
+    VALUES ('interns', NEW.intern_id, 'U');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_interns_change_delete
+AFTER DELETE ON interns
+BEGIN
+    INSERT INTO change_log (table_name, row_id, operation)
+    VALUES ('interns', OLD.intern_id, 'D');
+END;
+
+-- documents
+CREATE TRIGGER IF NOT EXISTS trg_documents_change_insert
+AFTER INSERT ON documents
+BEGIN
+    INSERT INTO change_log (table_name, row_id, operation)
+    VALUES ('documents', NEW.document_id, 'I');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_documents_change_update
+AFTER UPDATE ON documents
+BEGIN
+    INSERT INTO change_log (table_name, row_id, operation)
+    VALUES ('documents', NEW.document_id, 'U');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_documents_change_delete
+AFTER DELETE ON documents
+BEGIN
+    INSERT INTO change_log (table_name, row_id, operation)
+    VALUES ('documents', OLD.document_id, 'D');
+END;
+
+-- observations
+CREATE TRIGGER IF NOT EXISTS trg_observations_change_insert
+AFTER INSERT ON observations
+BEGIN
+    INSERT INTO change_log (table_name, row_id, operation)
+    VALUES ('observations', NEW.observation_id, 'I');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_observations_change_update
+AFTER UPDATE ON observations
+BEGIN
+    INSERT INTO change_log (table_name, row_id, operation)
+    VALUES ('observations', NEW.observation_id, 'U');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_observations_change_delete
+AFTER DELETE ON observations
+BEGIN
+    INSERT INTO change_log (table_name, row_id, operation)
+    VALUES ('observations', OLD.observation_id, 'D');
+END;
+
+-- meetings
+CREATE TRIGGER IF NOT EXISTS trg_meetings_change_insert
+AFTER INSERT ON meetings
+BEGIN
+    INSERT INTO change_log (table_name, row_id, operation)
+    VALUES ('meetings', NEW.meeting_id, 'I');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_meetings_change_update
+AFTER UPDATE ON meetings
+BEGIN
+    INSERT INTO change_log (table_name, row_id, operation)
+    VALUES ('meetings', NEW.meeting_id, 'U');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_meetings_change_delete
+AFTER DELETE ON meetings
+BEGIN
+    INSERT INTO change_log (table_name, row_id, operation)
+    VALUES ('meetings', OLD.meeting_id, 'D');
+END;
+
+-- evaluation_criteria
+CREATE TRIGGER IF NOT EXISTS trg_evaluation_criteria_change_insert
+AFTER INSERT ON evaluation_criteria
+BEGIN
+    INSERT INTO change_log (table_name, row_id, operation)
+    VALUES ('evaluation_criteria', NEW.criteria_id, 'I');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_evaluation_criteria_change_update
+AFTER UPDATE ON evaluation_criteria
+BEGIN
+    INSERT INTO change_log (table_name, row_id, operation)
+    VALUES ('evaluation_criteria', NEW.criteria_id, 'U');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_evaluation_criteria_change_delete
+AFTER DELETE ON evaluation_criteria
+BEGIN
+    INSERT INTO change_log (table_name, row_id, operation)
+    VALUES ('evaluation_criteria', OLD.criteria_id, 'D');
+END;
+
+-- grades
+CREATE TRIGGER IF NOT EXISTS trg_grades_change_insert
+AFTER INSERT ON grades
+BEGIN
+    INSERT INTO change_log (table_name, row_id, operation)
+    VALUES ('grades', NEW.grade_id, 'I');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_grades_change_update
+AFTER UPDATE ON grades
+BEGIN
+    INSERT INTO change_log (table_name, row_id, operation)
+    VALUES ('grades', NEW.grade_id, 'U');
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_grades_change_delete
+AFTER DELETE ON grades
+BEGIN
+    INSERT INTO change_log (table_name, row_id, operation)
+    VALUES ('grades', OLD.grade_id, 'D');
+END;
@@ -0,0 +1,71 @@
+-- Migration 0006: full-text search over the free-text notes.
+--
+-- External-content FTS5 indexes over `observations.observation` and
+-- `documents.feedback`; the text itself is stored only once, in the original
+-- tables. Accents are ignored, so 'avaliacao' matches 'avaliação'.
+
+CREATE VIRTUAL TABLE IF NOT EXISTS observations_fts USING fts5(
+    observation,
+    content = 'observations',
+    content_rowid = 'observation_id',
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+    feedback,
+    content = 'documents',
+    content_rowid = 'document_id',
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+
+-- observations
+CREATE TRIGGER IF NOT EXISTS trg_observations_fts_insert
+AFTER INSERT ON observations
+BEGIN
+    INSERT INTO observations_fts (rowid, observation)
+    VALUES (NEW.observation_id, NEW.observation);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_observations_fts_delete
+AFTER DELETE ON observations
+BEGIN
+    INSERT INTO observations_fts (observations_fts, rowid, observation)
+    VALUES ('delete', OLD.observation_id, OLD.observation);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_observations_fts_update
+AFTER UPDATE OF observation ON observations
+BEGIN
+    INSERT INTO observations_fts (observations_fts, rowid, observation)
+    VALUES ('delete', OLD.observation_id, OLD.observation);
+    INSERT INTO observations_fts (rowid, observation)
+    VALUES (NEW.observation_id, NEW.observation);
+END;
+
+-- documents
+CREATE TRIGGER IF NOT EXISTS trg_documents_fts_insert
+AFTER INSERT ON documents
+BEGIN
+    INSERT INTO documents_fts (rowid, feedback)
+    VALUES (NEW.document_id, NEW.feedback);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_documents_fts_delete
+AFTER DELETE ON documents
+BEGIN
+    INSERT INTO documents_fts (documents_fts, rowid, feedback)
+    VALUES ('delete', OLD.document_id, OLD.feedback);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_documents_fts_update
+AFTER UPDATE OF feedback ON documents
+BEGIN
+    INSERT INTO documents_fts (documents_fts, rowid, feedback)
+    VALUES ('delete', OLD.document_id, OLD.feedback);
+    INSERT INTO documents_fts (rowid, feedback)
+    VALUES (NEW.document_id, NEW.feedback);
+END;
+
+-- Index the notes written before this migration.
+INSERT INTO observations_fts (observations_fts) VALUES ('rebuild');
+INSERT INTO documents_fts (documents_fts) VALUES ('rebuild');
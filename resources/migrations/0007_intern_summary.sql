@@ -0,0 +1,182 @@
+-- Migration 0007: per-intern summary.
+--
+-- One row per intern with the counters the dashboard, the main list and the
+-- report dialog used to recompute in Python. Triggers on documents, meetings,
+-- grades and observations keep it current; a document is pending until it is
+-- 'Aprovado'. `last_activity` is the time of the intern's latest change.
+
+CREATE TABLE IF NOT EXISTS intern_summary (
+    intern_id INTEGER PRIMARY KEY,
+    total_docs INTEGER NOT NULL DEFAULT 0,
+    pending_docs INTEGER NOT NULL DEFAULT 0,
+    total_meetings INTEGER NOT NULL DEFAULT 0,
+    present_meetings INTEGER NOT NULL DEFAULT 0,
+    grade_total REAL NOT NULL DEFAULT 0.0,
+    last_activity TEXT,
+    FOREIGN KEY (intern_id) REFERENCES interns(intern_id) ON DELETE CASCADE
+);
+
+-- interns (the summary row is removed by the cascade)
+CREATE TRIGGER IF NOT EXISTS trg_interns_summary_insert
+AFTER INSERT ON interns
+BEGIN
+    INSERT INTO intern_summary (intern_id) VALUES (NEW.intern_id);
+END;
+
+-- documents
+CREATE TRIGGER IF NOT EXISTS trg_documents_summary_insert
+AFTER INSERT ON documents
+BEGIN
+    UPDATE intern_summary
+    SET total_docs = total_docs + 1,
+        pending_docs = pending_docs + (NEW.status IS NOT 'Aprovado'),
+        last_activity = strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')
+    WHERE intern_id = NEW.intern_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_documents_summary_delete
+AFTER DELETE ON documents
+BEGIN
+    UPDATE intern_summary
+    SET total_docs = total_docs - 1,
+        pending_docs = pending_docs - (OLD.status IS NOT 'Aprovado'),
+        last_activity = strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')
+    WHERE intern_id = OLD.intern_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_documents_summary_update
+AFTER UPDATE OF intern_id, status ON documents
+BEGIN
+    UPDATE intern_summary
+    SET total_docs = total_docs - 1,
+        pending_docs = pending_docs - (OLD.status IS NOT 'Aprovado'),
+        last_activity = strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')
+    WHERE intern_id = OLD.intern_id;
+    UPDATE intern_summary
+    SET total_docs = total_docs + 1,
+        pending_docs = pending_docs + (NEW.status IS NOT 'Aprovado'),
+        last_activity = strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')
+    WHERE intern_id = NEW.intern_id;
+END;
+
+-- meetings
+CREATE TRIGGER IF NOT EXISTS trg_meetings_summary_insert
+AFTER INSERT ON meetings
+BEGIN
+    UPDATE intern_summary
+    SET total_meetings = total_meetings + 1,
+        present_meetings = present_meetings + NEW.is_intern_present,
+        last_activity = strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')
+    WHERE intern_id = NEW.intern_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_meetings_summary_delete
+AFTER DELETE ON meetings
+BEGIN
+    UPDATE intern_summary
+    SET total_meetings = total_meetings - 1,
+        present_meetings = present_meetings - OLD.is_intern_present,
+        last_activity = strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')
+    WHERE intern_id = OLD.intern_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_meetings_summary_update
+AFTER UPDATE OF intern_id, is_intern_present ON meetings
+BEGIN
+    UPDATE intern_summary
+    SET total_meetings = total_meetings - 1,
+        present_meetings = present_meetings - OLD.is_intern_present,
+        last_activity = strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')
+    WHERE intern_id = OLD.intern_id;
+    UPDATE intern_summary
+    SET total_meetings = total_meetings + 1,
+        present_meetings = present_meetings + NEW.is_intern_present,
+        last_activity = strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')
+    WHERE intern_id = NEW.intern_id;
+END;
+
+-- grades
+CREATE TRIGGER IF NOT EXISTS trg_grades_summary_insert
+AFTER INSERT ON grades
+BEGIN
+    UPDATE intern_summary
+    SET grade_total = grade_total + NEW.value,
+        last_activity = strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')
+    WHERE intern_id = NEW.intern_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_grades_summary_delete
+AFTER DELETE ON grades
+BEGIN
+    UPDATE intern_summary
+    SET grade_total = grade_total - OLD.value,
+        last_activity = strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')
+    WHERE intern_id = OLD.intern_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_grades_summary_update
+AFTER UPDATE OF intern_id, value ON grades
+BEGIN
+    UPDATE intern_summary
+    SET grade_total = grade_total - OLD.value,
+        last_activity = strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')
+    WHERE intern_id = OLD.intern_id;
+    UPDATE intern_summary
+    SET grade_total = grade_total + NEW.value,
+        last_activity = strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')
+    WHERE intern_id = NEW.intern_id;
+END;
+
+-- observations
+CREATE TRIGGER IF NOT EXISTS trg_observations_summary_insert
+AFTER INSERT ON observations
+BEGIN
+    UPDATE intern_summary
+    SET last_activity = strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')
+    WHERE intern_id = NEW.intern_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_observations_summary_delete
+AFTER DELETE ON observations
+BEGIN
+    UPDATE intern_summary
+    SET last_activity = strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')
+    WHERE intern_id = OLD.intern_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_observations_summary_update
+AFTER UPDATE OF intern_id, observation ON observations
+BEGIN
+    UPDATE intern_summary
+    SET last_activity = strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')
+    WHERE intern_id = OLD.intern_id;
+    UPDATE intern_summary
+    SET last_activity = strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')
+    WHERE intern_id = NEW.intern_id;
+END;
+
+-- Summaries of the interns registered before this migration.
+INSERT OR IGNORE INTO intern_summary (
+    intern_id, total_docs, pending_docs, total_meetings, present_meetings,
+    grade_total, last_activity
+)
+SELECT
+    i.intern_id,
+    (SELECT COUNT(*) FROM documents d WHERE d.intern_id = i.intern_id),
+    (SELECT COUNT(*) FROM documents d
+     WHERE d.intern_id = i.intern_id AND d.status IS NOT 'Aprovado'),
+    (SELECT COUNT(*) FROM meetings m WHERE m.intern_id = i.intern_id),
+    (SELECT COALESCE(SUM(m.is_intern_present), 0) FROM meetings m
+     WHERE m.intern_id = i.intern_id),
+    (SELECT COALESCE(SUM(g.value), 0.0) FROM grades g
+     WHERE g.intern_id = i.intern_id),
+    (SELECT MAX(t) FROM (
+        SELECT MAX(last_update) AS t FROM documents WHERE intern_id = i.intern_id
+        UNION ALL
+        SELECT MAX(last_update) FROM grades WHERE intern_id = i.intern_id
+        UNION ALL
+        SELECT MAX(last_update) FROM observations WHERE intern_id = i.intern_id
+        UNION ALL
+        SELECT MAX(meeting_date) FROM meetings WHERE intern_id = i.intern_id
+    ))
+FROM interns i;
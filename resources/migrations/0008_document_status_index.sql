@@ -0,0 +1,8 @@
+-- Migration 0008: index for the document status histogram.
+
+-- DOCUMENTS
+-- The dashboard counts documents per (document_name, status). With both
+-- columns in one index the GROUP BY reads the index in order, without
+-- touching the table or sorting.
+CREATE INDEX IF NOT EXISTS idx_documents_name_status
+    ON documents(document_name, status);
@@ -0,0 +1,18 @@
+-- Migration 0009: normalized names of interns and venues.
+--
+-- `normalized_name` holds the name casefolded, without accents and with
+-- single spaces (utils.text.normalize_name). The repositories write it
+-- together with the name; matching a name (e.g. on import) is then an
+-- equality on an indexed column instead of a LIKE over the whole table.
+-- `normalize_name()` is registered on the connection by the migration
+-- runner and is only needed to fill in the existing rows.
+
+ALTER TABLE interns ADD COLUMN normalized_name TEXT;
+UPDATE interns SET normalized_name = normalize_name(name);
+CREATE INDEX IF NOT EXISTS idx_interns_normalized_name
+    ON interns(normalized_name);
+
+ALTER TABLE venues ADD COLUMN normalized_name TEXT;
+UPDATE venues SET normalized_name = normalize_name(venue_name);
+CREATE INDEX IF NOT EXISTS idx_venues_normalized_name
+    ON venues(normalized_name);
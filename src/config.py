@@ -17,10 +17,34 @@ Attributes:
                            `APPDATA` or home directory.
     RESOURCES_DIR (Path): The location of static, read-only resources like
                           SQL scripts or images.
-    SQL_PATH (Path): The full path to the database schema creation script.
+    MIGRATIONS_DIR (Path): The directory holding the ordered schema migration
+                           scripts (`NNNN_description.sql`).
     DB_DIR (Path): The directory where the SQLite database is stored.
                    This is an alias for USER_DATA_ROOT.
     DB_PATH (Path): The full path to the SQLite database file (`interns.db`).
+    DB_PRAGMA_PROFILES (dict): Named sets of SQLite PRAGMA values applied by
+                               the `DatabaseConnector` on every connection.
+    DB_PROFILE (str): Name of the active PRAGMA profile. Can be overridden
+                      with the `INTERN_MANAGER_DB_PROFILE` environment variable.
+    DB_CACHED_STATEMENTS (int): Size of the per-connection prepared statement
+                                cache used by `sqlite3`.
+    DB_MAX_READERS (int): Maximum number of read-only connections leased to
+                          background worker threads.
+    LOG_DIR (Path): Directory for application logs (inside USER_DATA_ROOT).
+    DB_TRACE_ENABLED (bool): Whether SQL statement tracing starts enabled
+                             (`INTERN_MANAGER_DB_TRACE=1`).
+    SLOW_QUERY_THRESHOLD_MS (float): Statements at or above this latency are
+                                     written to `SLOW_QUERY_LOG_PATH`.
+    BACKUP_DIR (Path): Directory holding the timestamped database snapshots.
+    BACKUP_KEEP (int): Number of snapshots kept before the oldest are deleted.
+    BACKUP_PAGES_PER_STEP (int): Database pages copied per step of an online
+                                 backup.
+    ARCHIVE_DIR (Path): Directory holding one archive database per closed term.
+    MAINTENANCE_IDLE_MS (int): User inactivity that triggers idle maintenance.
+    MAINTENANCE_IDLE_BUDGET_MS (int): Time budget of an idle maintenance run.
+    MAINTENANCE_QUIT_BUDGET_MS (int): Time budget of the run on application exit.
+    CHANGE_LOG_KEEP (int): Entries of the change feed kept when it is pruned
+                           on exit.
 """
 
 import sys
@@ -81,21 +105,129 @@ APP_ROOT, USER_DATA_ROOT = get_app_paths()
 # Path to static resources (SQL scripts, images, etc.).
 # These are bundled with the app and are read-only.
 RESOURCES_DIR = APP_ROOT / "resources"
-SQL_PATH = RESOURCES_DIR / "create_db.sql"
+MIGRATIONS_DIR = RESOURCES_DIR / "migrations"
 
 # Path to dynamic user data (the database).
 # This location is writable and persistent.
 DB_DIR = USER_DATA_ROOT
 DB_PATH = DB_DIR / "interns.db"
 
+# --- Database Performance Profiles ---
+# Each profile maps a PRAGMA name to the value set right after connecting.
+# "performance" trades the fsync on every commit for a WAL checkpoint
+# (a power loss may drop the last transactions, never corrupt the file).
+# "safe" keeps WAL but fsyncs every commit. "legacy" mirrors SQLite's
+# defaults (rollback journal) and exists mostly for benchmarking.
+DB_PRAGMA_PROFILES: dict[str, dict[str, str | int]] = {
+    "performance": {
+        "busy_timeout": 5000,
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -16000,  # Negative = KiB (16 MiB)
+        "mmap_size": 64 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+    "safe": {
+        "busy_timeout": 5000,
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -16000,
+        "mmap_size": 0,
+        "temp_store": "MEMORY",
+    },
+    "legacy": {
+        "busy_timeout": 5000,
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "cache_size": -2000,
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+    },
+}
+
+DB_PROFILE = os.getenv("INTERN_MANAGER_DB_PROFILE", "performance")
+
+# Number of prepared statements kept per connection. The repositories issue a
+# few dozen distinct queries, so the sqlite3 default (128) is close to the
+# working set; keep some headroom for the ad-hoc queries.
+DB_CACHED_STATEMENTS = int(os.getenv("INTERN_MANAGER_DB_CACHED_STATEMENTS", "256"))
+
+# Read-only connections available to worker threads (dashboard, reports).
+DB_MAX_READERS = int(os.getenv("INTERN_MANAGER_DB_MAX_READERS", "4"))
+
+# --- Query Tracing ---
+# Opt-in: per-statement latency statistics plus a rotating slow-query log.
+LOG_DIR = USER_DATA_ROOT / "logs"
+SLOW_QUERY_LOG_PATH = LOG_DIR / "slow_queries.log"
+DB_TRACE_ENABLED = os.getenv("INTERN_MANAGER_DB_TRACE", "0") == "1"
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("INTERN_MANAGER_SLOW_QUERY_MS", "50"))
+
+# --- Backups ---
+# Online snapshots taken with the SQLite backup API, copied in small steps so
+# writers are never locked out for long.
+BACKUP_DIR = USER_DATA_ROOT / "backups"
+BACKUP_KEEP = int(os.getenv("INTERN_MANAGER_BACKUP_KEEP", "10"))
+BACKUP_PAGES_PER_STEP = int(os.getenv("INTERN_MANAGER_BACKUP_PAGES", "256"))
+
+# --- Archives ---
+# Closed terms are moved out of the main database into per-term files that
+# are attached only by historical queries.
+ARCHIVE_DIR = USER_DATA_ROOT / "archives"
+
+# --- Maintenance ---
+# ANALYZE and incremental vacuum run while the user is idle and on exit, each
+# run bounded by a time budget; the integrity check follows the idle run on a
+# reader thread.
+MAINTENANCE_IDLE_MS = int(os.getenv("INTERN_MANAGER_MAINTENANCE_IDLE_MS", "300000"))
+MAINTENANCE_IDLE_BUDGET_MS = int(
+    os.getenv("INTERN_MANAGER_MAINTENANCE_IDLE_BUDGET_MS", "250")
+)
+MAINTENANCE_QUIT_BUDGET_MS = int(
+    os.getenv("INTERN_MANAGER_MAINTENANCE_QUIT_BUDGET_MS", "2000")
+)
+
+# --- Change feed ---
+# Views only need the changes of the current session; older entries are
+# dropped on exit.
+CHANGE_LOG_KEEP = int(os.getenv("INTERN_MANAGER_CHANGE_LOG_KEEP", "5000"))
+
+
+def get_pragma_profile(name: str | None = None) -> dict[str, str | int]:
+    """
+    Resolves a PRAGMA profile, applying per-environment overrides.
+
+    Any individual PRAGMA of the profile can be overridden with an environment
+    variable named `INTERN_MANAGER_PRAGMA_<NAME>` (e.g.
+    `INTERN_MANAGER_PRAGMA_SYNCHRONOUS=FULL`).
+
+    Args:
+        name (str | None): Profile name. Defaults to `DB_PROFILE`.
+
+    Returns:
+        dict[str, str | int]: A copy of the profile with overrides applied.
+
+    Raises:
+        ValueError: If the profile name is unknown.
+    """
+    profile_name = name or DB_PROFILE
+    if profile_name not in DB_PRAGMA_PROFILES:
+        raise ValueError(
+            f"Unknown database profile '{profile_name}'. "
+            f"Available: {', '.join(DB_PRAGMA_PROFILES)}"
+        )
+
+    profile = dict(DB_PRAGMA_PROFILES[profile_name])
+    for pragma in profile:
+        override = os.getenv(f"INTERN_MANAGER_PRAGMA_{pragma.upper()}")
+        if override:
+            profile[pragma] = override
+    return profile
+
+
 # --- Debug ---
 
 # if getattr(sys, "frozen", False):
 #    print(f"DEBUG: Rodando Congelado (Frozen)")
 #    print(f"DEBUG: App Root (_internal): {APP_ROOT}")
 #    print(f"DEBUG: Resources esperados: {RESOURCES_DIR}")
-#    print(f"DEBUG: SQL esperado: {SQL_PATH}")
-
-# Ensure the directory for the database exists before the app tries to use it.
-# This is especially important on the first run.
-DB_DIR.mkdir(parents=True, exist_ok=True)
+#    print(f"DEBUG: Migrations esperadas: {MIGRATIONS_DIR}")
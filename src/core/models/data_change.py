@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class DataChange:
+    """
+    Domain model representing one entry of the change feed.
+
+    This class mirrors the structure of the `change_log` table, which is
+    filled by triggers on every application table.
+
+    Attributes:
+        seq (int): Sequence number; increases with every change.
+        table_name (str): Table of the changed row (e.g. 'interns').
+        row_id (int): Primary key of the changed row.
+        operation (str): 'I' (insert), 'U' (update) or 'D' (delete).
+    """
+
+    seq: int
+    table_name: str
+    row_id: int
+    operation: str
@@ -14,7 +14,7 @@ class Intern:
     start_date: Optional[str] = None
     end_date: Optional[str] = None
 
-    # Ordem igual ao create_db.sql para facilitar leitura, mas dataclass usa nome
+    # Ordem igual ao schema (resources/migrations) para facilitar leitura, mas dataclass usa nome
     working_days: Optional[str] = None
     working_hours: Optional[str] = None
 
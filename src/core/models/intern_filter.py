@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class InternFilter:
+    """
+    Criteria that restrict the paginated intern list.
+
+    Every attribute left as None matches all interns.
+
+    Attributes:
+        term (Optional[str]): Exact term (e.g. '2026.1').
+        venue_id (Optional[int]): Venue of the interns; 0 selects the interns
+            without a venue.
+        status (Optional[str]): 'Ativo' or 'Concluído', with the same rule as
+            `Intern.status` (an intern is 'Concluído' once the end date has
+            passed).
+        search (Optional[str]): Text contained in the name or the venue name
+            (ignoring case and accents) or in the RA.
+    """
+
+    term: Optional[str] = None
+    venue_id: Optional[int] = None
+    status: Optional[str] = None
+    search: Optional[str] = None
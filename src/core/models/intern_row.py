@@ -0,0 +1,33 @@
+import string
+from typing import NamedTuple, Optional, Tuple
+
+# SQLite's NOCASE folds the ASCII letters only.
+_NOCASE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+class InternRow(NamedTuple):
+    """
+    One line of the intern list, as shown by the main table.
+
+    A plain tuple with only the displayed columns, read in a single query
+    together with the venue name and the status (see
+    `InternRepository.list_rows`). Use `Intern` to view or edit the intern.
+
+    Attributes:
+        intern_id (int): The intern.
+        name (str): Name of the intern.
+        venue_name (Optional[str]): Name of the venue; None without a venue.
+        registration_number (str): The RA.
+        status (str): 'Ativo' or 'Concluído', as `Intern.status`.
+    """
+
+    intern_id: int
+    name: str
+    venue_name: Optional[str]
+    registration_number: str
+    status: str
+
+    @property
+    def list_key(self) -> Tuple[str, int]:
+        """Sorts like `intern_repo.LIST_ORDER` (name COLLATE NOCASE, ID)."""
+        return (self.name.translate(_NOCASE), self.intern_id)
@@ -0,0 +1,30 @@
+from typing import Optional
+from dataclasses import dataclass
+
+
+@dataclass
+class InternSummary:
+    """
+    Domain model representing the precomputed counters of one intern.
+
+    This class mirrors the structure of the `intern_summary` table, which is
+    maintained by triggers on documents, meetings, grades and observations.
+
+    Attributes:
+        intern_id (int): The intern.
+        total_docs (int): Number of documents.
+        pending_docs (int): Documents not yet 'Aprovado'.
+        total_meetings (int): Number of supervision meetings.
+        present_meetings (int): Meetings the intern attended.
+        grade_total (float): Sum of the intern's grades.
+        last_activity (Optional[str]): Time of the latest change to any of
+            the intern's records ('YYYY-MM-DD HH:MM:SS').
+    """
+
+    intern_id: int
+    total_docs: int = 0
+    pending_docs: int = 0
+    total_meetings: int = 0
+    present_meetings: int = 0
+    grade_total: float = 0.0
+    last_activity: Optional[str] = None
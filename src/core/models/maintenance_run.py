@@ -0,0 +1,25 @@
+from typing import Optional
+from dataclasses import dataclass
+
+
+@dataclass
+class MaintenanceRun:
+    """
+    Domain model representing one execution of a database maintenance task.
+
+    This class mirrors the structure of the `maintenance_runs` table.
+
+    Attributes:
+        task (str): Task name (e.g. 'optimize', 'analyze', 'quick_check').
+        started_at (str): Start timestamp (ISO format, local time).
+        duration_ms (float): Time spent on the task.
+        result (str): Outcome ('ok', 'skipped: ...', 'interrupted', error text
+            or the output of the check).
+        run_id (Optional[int]): Unique database identifier.
+    """
+
+    task: str
+    started_at: str
+    duration_ms: float
+    result: str
+    run_id: Optional[int] = None
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class SearchResult:
+    """
+    Domain model representing one match of a full-text search over the notes.
+
+    Attributes:
+        source_id (int): ID of the matching observation or document.
+        intern_id (int): Intern the note belongs to.
+        snippet (str): Excerpt of the note with the matched terms between
+            `[` and `]`.
+        rank (float): FTS5 rank (BM25); lower is more relevant.
+    """
+
+    source_id: int
+    intern_id: int
+    snippet: str
+    rank: float
@@ -1,7 +1,32 @@
+import re
 import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
 from sqlite3 import Connection, Cursor
-from typing import Optional
-from config import DB_PATH, SQL_PATH
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Union
+from config import (
+    DB_PATH,
+    DB_CACHED_STATEMENTS,
+    DB_MAX_READERS,
+    MIGRATIONS_DIR,
+    SLOW_QUERY_LOG_PATH,
+    SLOW_QUERY_THRESHOLD_MS,
+    get_pragma_profile,
+)
+from data.migrations import (
+    apply_migrations,
+    get_schema_version,
+    initialize_from_template,
+)
+from data.pool import ReaderPool
+from data.tracing import QueryTracer
+
+PRAGMA_VALUE_PATTERN = re.compile(r"^-?[\w]+$")
+
+MEMORY_DB = ":memory:"
 
 
 class DatabaseConnector:
@@ -9,70 +34,551 @@ class DatabaseConnector:
     Handles the SQLite database connection and schema initialization.
 
     This class manages the lifecycle of the SQLite connection, including
-    configuration (foreign keys, row factory) and initial schema execution
-    from an external SQL file.
+    configuration (foreign keys, row factory, performance PRAGMA profile) and
+    bringing the schema up to date through the versioned migrations in
+    `resources/migrations`.
+
+    Repositories never share a cursor: `execute` and `executemany` return a
+    fresh cursor per call, so a result set can be streamed while other
+    queries run on the same connection.
+
+    Writes can be grouped with `transaction()`. While a unit of work is open,
+    `commit()` calls issued by the repositories are deferred, so a multi-row
+    operation pays for a single commit.
+
+    The connection opened by `connect()` is the single writer and belongs to
+    the thread that created the connector (the GUI thread). Worker threads
+    run read-only work inside `reader()`, which leases a connection from a
+    pool of read-only connections configured with the same PRAGMA profile;
+    while a lease is held, `execute()` transparently uses it.
+
+    Statement tracing is opt-in (`enable_tracing()`): statements issued through
+    `execute()`/`executemany()` are then timed and aggregated by a
+    `QueryTracer`.
+
+    Online snapshots are taken with `backup_to()` (any thread, through a
+    pooled reader) and restored with `restore_from()` (writer thread).
+
+    Objects holding copies of rows (the services' `Session`) subscribe with
+    `add_reset_listener()`; they are told when those copies may be stale: a
+    `transaction()` block rolled back, a snapshot was restored, or a bulk
+    write called `notify_reset()`.
+
+    Besides a file path, the target may be `":memory:"` or an SQLite
+    `file:` URI. Each `":memory:"` connector gets its own private in-memory
+    database, shared by its writer and pooled readers, which makes it the
+    cheapest way to get an isolated database in tests and benchmarks.
 
     Attributes:
-        db_path (Path): Path to the SQLite database file.
-        conn (Optional[Connection]): Active SQLite connection object.
-        cursor (Optional[Cursor]): Active SQLite cursor object.
+        db_path (Union[Path, str]): Database file, `":memory:"` or `file:` URI.
+        profile (dict): PRAGMA values applied on connect (see `config.py`).
+        cached_statements (int): Size of the prepared statement cache.
+        max_readers (int): Maximum number of pooled reader connections.
+        conn (Optional[Connection]): Active SQLite connection object (writer).
+        pool (Optional[ReaderPool]): Read-only connections for worker threads.
+        tracer (Optional[QueryTracer]): Statement statistics, when tracing.
         _closed (bool): Internal flag to track connection status.
+        _tx_depth (int): Nesting level of the open `transaction()` blocks.
+        _reset_listeners (List[Callable[[], None]]): See `add_reset_listener`.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        db_path: Optional[Union[Path, str]] = None,
+        profile: Optional[str] = None,
+        cached_statements: Optional[int] = None,
+        max_readers: Optional[int] = None,
+    ):
         """
         Initializes the DatabaseConnector and establishes the connection immediately.
+
+        Args:
+            db_path (Optional[Union[Path, str]]): Database file, `":memory:"`
+                or a `file:` URI. Defaults to `config.DB_PATH`. The parent
+                directory of a file is created if needed.
+            profile (Optional[str]): Name of the PRAGMA profile to apply.
+                Defaults to `config.DB_PROFILE`.
+            cached_statements (Optional[int]): Prepared statement cache size;
+                0 disables the cache. Defaults to `config.DB_CACHED_STATEMENTS`.
+            max_readers (Optional[int]): Size of the reader pool.
+                Defaults to `config.DB_MAX_READERS`.
+
+        Raises:
+            ValueError: If the profile name is unknown or max_readers < 1.
         """
-        self.db_path = DB_PATH
+        self.db_path = db_path or DB_PATH
+        self.profile = get_pragma_profile(profile)
+        self.cached_statements = (
+            DB_CACHED_STATEMENTS if cached_statements is None else cached_statements
+        )
+        self.max_readers = DB_MAX_READERS if max_readers is None else max_readers
         self.conn: Optional[Connection] = None
-        self.cursor: Optional[Cursor] = None
+        self.pool: Optional[ReaderPool] = None
+        self.tracer: Optional[QueryTracer] = None
         self._closed = False
+        self._tx_depth = 0
+        self._owner_thread = threading.get_ident()
+        self._local = threading.local()
+        self._reset_listeners: List[Callable[[], None]] = []
+
+        # Readers reach a private in-memory database through a shared cache
+        # named after this connector.
+        self._uri = self._resolve_uri()
 
         self.connect()
 
+    @property
+    def is_memory(self) -> bool:
+        """Whether the database lives in memory (lost when closed)."""
+        if self.db_path == MEMORY_DB:
+            return True
+        return str(self.db_path).startswith("file:") and (
+            "mode=memory" in str(self.db_path)
+        )
+
+    def _resolve_uri(self) -> Optional[str]:
+        """
+        Returns the URI every connection opens, or None for a plain file path.
+        """
+        if self.db_path == MEMORY_DB:
+            return f"file:intern_manager_{uuid.uuid4().hex}?mode=memory&cache=shared"
+        if isinstance(self.db_path, str) and self.db_path.startswith("file:"):
+            return self.db_path
+        return None
+
     def connect(self):
         """
         Establish connection to the database and configure PRAGMA settings.
 
-        Sets the row_factory to sqlite3.Row for dictionary-like access and
-        enables foreign key constraints. Also triggers table creation.
+        Sets the row_factory to sqlite3.Row for dictionary-like access,
+        enables foreign key constraints and applies the PRAGMA profile.
+        Also applies pending schema migrations and prepares the reader pool.
         """
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.row_factory = sqlite3.Row
+        self._owner_thread = threading.get_ident()
+        if self._uri is None:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = self._open_connection()
 
-        self.cursor = self.conn.cursor()
-        self.cursor.execute("PRAGMA foreign_keys = ON")
+        self._migrate()
 
-        self._create_tables()
+        self.pool = ReaderPool(
+            lambda: self._open_connection(read_only=True), self.max_readers
+        )
 
-    def _create_tables(self):
+    def _open_connection(self, read_only: bool = False) -> Connection:
         """
-        Reads the SQL script from disk and executes it to initialize the schema.
+        Opens a connection configured like every other one in the application.
+
+        Args:
+            read_only (bool): If True, the connection may be used from any
+                thread and rejects writes (`PRAGMA query_only`).
+
+        Returns:
+            Connection: The configured connection.
+        """
+        conn = sqlite3.connect(
+            self._uri or self.db_path,
+            cached_statements=self.cached_statements,
+            check_same_thread=not read_only,
+            uri=self._uri is not None,
+        )
+        conn.row_factory = sqlite3.Row
+
+        conn.execute("PRAGMA foreign_keys = ON")
+        if not read_only:
+            # Only takes effect on a brand-new file (or at the next VACUUM), so
+            # it must come before the journal mode writes the header.
+            conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        self._apply_profile(conn)
+        if read_only:
+            conn.execute("PRAGMA query_only = ON")
+            if self.is_memory:
+                # A shared cache uses table locks instead of WAL snapshots;
+                # without this, readers would block on the writer.
+                conn.execute("PRAGMA read_uncommitted = ON")
+        return conn
+
+    @contextmanager
+    def reader(self) -> Iterator[Connection]:
+        """
+        Leases a read-only connection for the calling thread.
+
+        Inside the block, `execute()` and therefore every repository read issued
+        from this thread runs on the leased connection. Nested calls reuse the
+        same lease. Blocks while all pooled connections are in use.
+
+        Example:
+            with db.reader():
+                interns = intern_repo.get_all()
+
+        Yields:
+            Connection: The leased connection.
 
         Raises:
-            FileNotFoundError: If the SQL file at SQL_PATH does not exist.
-            RuntimeError: If the database connection or cursor is not active.
+            RuntimeError: If the database connection is not active.
+        """
+        leased = getattr(self._local, "conn", None)
+        if leased is not None:
+            yield leased
+            return
+
+        if self.pool is None or self._closed:
+            raise RuntimeError("Database connection not established.")
+
+        conn = self.pool.acquire()
+        self._local.conn = conn
+        try:
+            yield conn
+        finally:
+            self._local.conn = None
+            self.pool.release(conn)
+
+    def execute(self, sql: str, params: Iterable[Any] = ()) -> Cursor:
         """
-        if not SQL_PATH.exists():
-            raise FileNotFoundError(
-                f"CRITICAL: Arquivo SQL não encontrado em: {SQL_PATH}"
+        Executes a single statement on a new, short-lived cursor.
+
+        Args:
+            sql (str): The SQL statement.
+            params (Iterable[Any]): Positional or named parameters.
+
+        Returns:
+            Cursor: A cursor owned by the caller, positioned on the results.
+
+        Raises:
+            RuntimeError: If the database connection is not active.
+        """
+        conn = self._current_connection()
+        if self.tracer:
+            return self.tracer.execute(conn, sql, params)
+        return conn.execute(sql, params)  # type: ignore[arg-type]
+
+    def executemany(self, sql: str, seq_of_params: Iterable[Iterable[Any]]) -> Cursor:
+        """
+        Executes a statement once per parameter set on a new cursor.
+
+        Args:
+            sql (str): The SQL statement.
+            seq_of_params (Iterable[Iterable[Any]]): Parameter sets.
+
+        Returns:
+            Cursor: A cursor owned by the caller.
+
+        Raises:
+            RuntimeError: If the database connection is not active.
+        """
+        conn = self._current_connection()
+        if self.tracer:
+            return self.tracer.execute(conn, sql, seq_of_params, many=True)
+        return conn.executemany(sql, seq_of_params)  # type: ignore[arg-type]
+
+    def enable_tracing(
+        self,
+        slow_threshold_ms: Optional[float] = None,
+        log_path: Optional[Path] = SLOW_QUERY_LOG_PATH,
+    ) -> QueryTracer:
+        """
+        Starts collecting statement statistics. Idempotent.
+
+        Args:
+            slow_threshold_ms (Optional[float]): Latency above which statements
+                go to the slow-query log. Defaults to `SLOW_QUERY_THRESHOLD_MS`.
+            log_path (Optional[Path]): Slow-query log file, or None to disable
+                the log.
+
+        Returns:
+            QueryTracer: The active tracer.
+        """
+        if self.tracer is None:
+            self.tracer = QueryTracer(
+                slow_threshold_ms
+                if slow_threshold_ms is not None
+                else SLOW_QUERY_THRESHOLD_MS,
+                log_path,
             )
+        return self.tracer
+
+    def disable_tracing(self):
+        """Stops collecting statement statistics and discards them."""
+        if self.tracer:
+            self.tracer.close()
+            self.tracer = None
+
+    def backup_to(
+        self,
+        target: Path,
+        pages: int = -1,
+        progress: Optional[Callable[[int, int, int], object]] = None,
+    ):
+        """
+        Copies the database into a new file while it stays in use.
+
+        The copy runs on a pooled reader, so it can be called from a worker
+        thread. Under WAL the reader holds one read transaction for the whole
+        copy: the snapshot stays consistent while the writer keeps committing,
+        and the backup never has to restart. With a rollback journal that
+        transaction would block every commit until the copy ends, so the
+        shared lock is only taken per step and SQLite restarts the copy if
+        the database changes in between.
+
+        Args:
+            target (Path): Destination file. Existing content is overwritten.
+            pages (int): Pages copied per step; -1 copies everything at once.
+            progress (Optional[Callable[[int, int, int], object]]): Called after
+                each step with `(status, remaining, total)` pages.
+
+        Raises:
+            RuntimeError: If the database connection is not active.
+            sqlite3.Error: If the copy fails.
+        """
+        with self.reader() as source:
+            journal_mode = source.execute("PRAGMA journal_mode").fetchone()[0]
+            pinned = journal_mode.lower() == "wal" and not source.in_transaction
+            if pinned:
+                source.execute("BEGIN")
+                source.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchall()
+
+            destination = sqlite3.connect(target)
+            try:
+                source.backup(destination, pages=pages, progress=progress)
+            finally:
+                destination.close()
+                if pinned:
+                    source.rollback()
+
+    def restore_from(self, source: Path):
+        """
+        Replaces the whole database content with a snapshot.
+
+        The snapshot is checked with `PRAGMA quick_check` and copied in a
+        single step over the writer connection; pending migrations are then
+        applied, so snapshots taken by older versions can be restored.
+
+        Args:
+            source (Path): Snapshot file created by `backup_to()`.
+
+        Raises:
+            RuntimeError: If the connection is not active, a `transaction()`
+                block is open, or the snapshot is newer than the application.
+            ValueError: If the snapshot is damaged.
+            sqlite3.Error: If the snapshot cannot be read.
+        """
+        conn = self._require_connection()
+        if self._tx_depth:
+            raise RuntimeError("Cannot restore inside a transaction() block.")
+        if conn.in_transaction:
+            conn.commit()
+
+        snapshot = sqlite3.connect(f"{source.resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            result = snapshot.execute("PRAGMA quick_check").fetchone()[0]
+            if result != "ok":
+                raise ValueError(f"Snapshot {source.name} is damaged: {result}")
+            if get_schema_version(snapshot) > get_schema_version(conn):
+                raise RuntimeError(
+                    f"Snapshot {source.name} was created by a newer version."
+                )
+            snapshot.backup(conn)
+        finally:
+            snapshot.close()
+
+        self._migrate()
+        self.notify_reset()
+
+    @property
+    def in_transaction(self) -> bool:
+        """True while a `transaction()` block is open."""
+        return self._tx_depth > 0
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Opens a unit of work spanning any number of repository writes.
+
+        The outermost block starts a transaction and commits it on success;
+        nested blocks become savepoints, so an inner failure can be caught
+        without discarding the outer work. Any exception rolls back the block
+        it escapes from and is re-raised.
+
+        Example:
+            with db.transaction():
+                for grade in grades:
+                    grade_repo.save(grade)
+
+        Raises:
+            RuntimeError: If the database connection is not active.
+        """
+        conn = self._require_connection()
+        depth = self._tx_depth
+        savepoint = f"uow_{depth}"
+
+        if depth == 0:
+            if conn.in_transaction:
+                # Flush statements left pending by code outside any unit of work.
+                conn.commit()
+            conn.execute("BEGIN")
+        else:
+            conn.execute(f"SAVEPOINT {savepoint}")
+
+        self._tx_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._tx_depth = depth
+            if depth == 0:
+                conn.rollback()
+            else:
+                conn.execute(f"ROLLBACK TO {savepoint}")
+                conn.execute(f"RELEASE {savepoint}")
+            self.notify_reset()
+            raise
+
+        self._tx_depth = depth
+        if depth == 0:
+            conn.commit()
+        else:
+            conn.execute(f"RELEASE {savepoint}")
+
+    def add_reset_listener(self, listener: Callable[[], None]):
+        """
+        Registers a callback for when in-memory copies of rows may be stale.
+
+        Args:
+            listener (Callable[[], None]): Called on the writer thread after
+                a `transaction()` block rolls back, after `restore_from()`,
+                and on `notify_reset()`.
+        """
+        self._reset_listeners.append(listener)
+
+    def notify_reset(self):
+        """
+        Tells the reset listeners that rows changed behind their back.
+
+        Called by writes that bypass the services (e.g. archiving a term).
+        """
+        for listener in self._reset_listeners:
+            listener()
+
+    def executescript(self, script: str):
+        """
+        Runs a multi-statement script on the writer.
+
+        Needed for statements that `execute()` only steps once, such as
+        `PRAGMA incremental_vacuum(N)`. Pending changes are committed first.
+
+        Args:
+            script (str): The SQL script.
+
+        Raises:
+            RuntimeError: If the connection is not active or a `transaction()`
+                block is open.
+        """
+        conn = self._require_connection()
+        if self._tx_depth:
+            raise RuntimeError("Cannot run a script inside a transaction() block.")
+        conn.executescript(script)
+
+    @contextmanager
+    def time_limit(self, budget_ms: float) -> Iterator[None]:
+        """
+        Interrupts statements of the calling thread that exceed a time budget.
+
+        A SQLite progress handler checks the clock every few thousand virtual
+        machine instructions; once `budget_ms` has elapsed since entering the
+        block, the running statement fails with
+        `sqlite3.OperationalError("interrupted")`.
+
+        Args:
+            budget_ms (float): Time budget of the whole block.
 
-        if not self.cursor or not self.conn:
+        Raises:
+            RuntimeError: If the database connection is not active.
+        """
+        conn = self._current_connection()
+        deadline = time.perf_counter() + budget_ms / 1000
+
+        conn.set_progress_handler(lambda: time.perf_counter() > deadline, 10_000)
+        try:
+            yield
+        finally:
+            conn.set_progress_handler(None, 0)
+
+    def commit(self):
+        """
+        Commits pending changes, unless a `transaction()` block is open.
+
+        Inside a unit of work the commit is deferred to the end of the
+        outermost block.
+        """
+        if self._tx_depth == 0:
+            self._require_connection().commit()
+
+    def _require_connection(self) -> Connection:
+        """
+        Returns the writer connection.
+
+        Raises:
+            RuntimeError: If it is closed or the caller is not the owner thread.
+        """
+        if self.conn is None or self._closed:
             raise RuntimeError("Database connection not established.")
+        if threading.get_ident() != self._owner_thread:
+            raise RuntimeError(
+                "The writer connection belongs to the GUI thread. "
+                "Use DatabaseConnector.reader() for background reads."
+            )
+        return self.conn
+
+    def _current_connection(self) -> Connection:
+        """Returns the reader leased by this thread, or the writer."""
+        leased = getattr(self._local, "conn", None)
+        if leased is not None:
+            if self._closed:
+                raise RuntimeError("Database connection not established.")
+            return leased
+        return self._require_connection()
+
+    def _apply_profile(self, conn: Connection):
+        """
+        Applies the configured PRAGMA profile to a connection.
 
-        with open(SQL_PATH, "r", encoding="utf-8") as f:
-            sql_file = f.read()
+        Args:
+            conn (Connection): The connection to configure.
 
-        self.cursor.executescript(sql_file)
-        self.conn.commit()
+        Raises:
+            ValueError: If a PRAGMA value is not a plain identifier or number.
+        """
+        for pragma, value in self.profile.items():
+            if not PRAGMA_VALUE_PATTERN.match(str(value)):
+                raise ValueError(f"Invalid value for PRAGMA {pragma}: {value!r}")
+            conn.execute(f"PRAGMA {pragma} = {value}")
+
+    def _migrate(self):
+        """
+        Applies the migrations newer than the stored `PRAGMA user_version`.
+
+        When the database is already current, only the migrations directory is
+        listed; no SQL file is read or executed. An empty database receives a
+        copy of the cached, fully migrated schema template instead.
+
+        Raises:
+            FileNotFoundError: If the migrations directory does not exist.
+            RuntimeError: If the database connection is not active.
+        """
+        if not self.conn:
+            raise RuntimeError("Database connection not established.")
+
+        initialize_from_template(self.conn, MIGRATIONS_DIR)
+        apply_migrations(self.conn, MIGRATIONS_DIR)
 
     def rollback(self):
         """
         Rolls back the current transaction safely.
         Ignores sqlite3.Error if the connection is already in a bad state.
+
+        Inside a `transaction()` block this is a no-op: the exception that
+        triggered the rollback makes the enclosing block undo its work.
         """
-        if self.conn:
+        if self.conn and self._tx_depth == 0:
             try:
                 self.conn.rollback()
             except sqlite3.Error:
@@ -80,7 +586,7 @@ class DatabaseConnector:
 
     def close(self):
         """
-        Closes the cursor and connection, releasing resources.
+        Closes the connection, releasing resources.
 
         This method is idempotent and handles exceptions silently during closure
         to ensure the program doesn't crash while trying to exit.
@@ -88,13 +594,13 @@ class DatabaseConnector:
         if getattr(self, "_closed", False):
             return
 
+        self._tx_depth = 0
         self.rollback()
 
-        if self.cursor:
-            try:
-                self.cursor.close()
-            except Exception:
-                pass
+        if self.pool:
+            self.pool.close()
+
+        self.disable_tracing()
 
         if self.conn:
             try:
@@ -0,0 +1,199 @@
+"""
+Versioned schema migrations.
+
+The schema is described by an ordered set of SQL scripts stored in
+`resources/migrations`, each named `NNNN_description.sql`. The version of the
+schema applied to a database is tracked with `PRAGMA user_version`, so on a
+normal startup only the directory listing is read and no SQL is executed.
+
+Brand-new databases skip the scripts altogether: the migrations are applied
+once per process to an in-memory template, whose pages are then copied into
+each empty database with the backup API.
+"""
+
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from utils.text import normalize_name
+
+MIGRATION_FILE_PATTERN = re.compile(r"^(\d+)_([\w-]+)\.sql$")
+
+# In-memory databases holding the fully migrated schema, keyed by the
+# migrations directory and its latest version.
+_templates: Dict[Tuple[Path, int], sqlite3.Connection] = {}
+_templates_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class Migration:
+    """
+    A single schema migration step.
+
+    Attributes:
+        version (int): Target `user_version` once the step is applied.
+        name (str): Human-readable description taken from the file name.
+        path (Path): Location of the SQL script.
+    """
+
+    version: int
+    name: str
+    path: Path
+
+    def read_sql(self) -> str:
+        """Reads the SQL script of this migration from disk."""
+        return self.path.read_text(encoding="utf-8")
+
+
+def discover_migrations(directory: Path) -> List[Migration]:
+    """
+    Lists the migration scripts available in a directory, ordered by version.
+
+    Args:
+        directory (Path): Directory containing `NNNN_description.sql` files.
+
+    Returns:
+        List[Migration]: The migrations sorted by ascending version.
+
+    Raises:
+        FileNotFoundError: If the directory does not exist.
+        ValueError: If two scripts declare the same version.
+    """
+    if not directory.is_dir():
+        raise FileNotFoundError(
+            f"CRITICAL: Pasta de migrations não encontrada em: {directory}"
+        )
+
+    migrations: dict[int, Migration] = {}
+    for path in directory.iterdir():
+        match = MIGRATION_FILE_PATTERN.match(path.name)
+        if not match:
+            continue
+
+        version = int(match.group(1))
+        if version in migrations:
+            raise ValueError(f"Duplicate migration version {version}: {path.name}")
+        migrations[version] = Migration(version, match.group(2), path)
+
+    return [migrations[v] for v in sorted(migrations)]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Returns the schema version stored in the database header."""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def apply_migrations(conn: sqlite3.Connection, directory: Path) -> int:
+    """
+    Brings the database schema up to date.
+
+    Each pending migration runs in its own transaction together with the
+    `user_version` bump, so a failing script leaves the database at the
+    previous version instead of half-migrated.
+
+    The scripts may call `normalize_name()` (see `utils.text`) to fill in
+    derived columns of existing rows.
+
+    Args:
+        conn (sqlite3.Connection): Open connection to the target database.
+        directory (Path): Directory containing the migration scripts.
+
+    Returns:
+        int: The schema version after applying the pending migrations.
+
+    Raises:
+        RuntimeError: If the database is newer than the shipped migrations.
+        sqlite3.Error: If a migration script fails.
+    """
+    current = get_schema_version(conn)
+    migrations = discover_migrations(directory)
+    latest = migrations[-1].version if migrations else 0
+
+    if current > latest:
+        raise RuntimeError(
+            f"Database schema version {current} is newer than the application "
+            f"supports ({latest})."
+        )
+
+    conn.create_function("normalize_name", 1, normalize_name, deterministic=True)
+    for migration in migrations:
+        if migration.version <= current:
+            continue
+
+        script = (
+            "BEGIN;\n"
+            f"{migration.read_sql()}\n;\n"
+            f"PRAGMA user_version = {migration.version};\n"
+            "COMMIT;"
+        )
+        try:
+            conn.executescript(script)
+        except sqlite3.Error:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+
+        current = migration.version
+
+    return current
+
+
+def get_schema_template(directory: Path) -> sqlite3.Connection:
+    """
+    Returns an in-memory database with every migration applied.
+
+    The template is built on first use and cached for the lifetime of the
+    process; a new migration file produces a new template.
+
+    Args:
+        directory (Path): Directory containing the migration scripts.
+
+    Returns:
+        sqlite3.Connection: The template. Must only be used under the module
+        lock (see `initialize_from_template`).
+
+    Raises:
+        sqlite3.Error: If a migration script fails.
+    """
+    migrations = discover_migrations(directory)
+    key = (directory.resolve(), migrations[-1].version if migrations else 0)
+
+    with _templates_lock:
+        template = _templates.get(key)
+        if template is None:
+            template = sqlite3.connect(":memory:", check_same_thread=False)
+            # Same page layout as the databases created by DatabaseConnector.
+            template.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            apply_migrations(template, directory)
+            _templates[key] = template
+        return template
+
+
+def initialize_from_template(conn: sqlite3.Connection, directory: Path) -> bool:
+    """
+    Creates the schema of an empty database by copying the cached template.
+
+    Copying the template pages is much faster than parsing and executing the
+    migration scripts, which matters for tests and benchmarks that create
+    thousands of databases.
+
+    Args:
+        conn (sqlite3.Connection): Connection to the target database.
+        directory (Path): Directory containing the migration scripts.
+
+    Returns:
+        bool: True if the schema was copied, False if the database was not
+        empty (it is then left untouched).
+    """
+    if get_schema_version(conn) != 0:
+        return False
+    if conn.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchone():
+        return False
+
+    template = get_schema_template(directory)
+    with _templates_lock:
+        template.backup(conn)
+    return True
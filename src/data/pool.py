@@ -0,0 +1,109 @@
+"""
+Pool of read-only SQLite connections for worker threads.
+
+SQLite connections must not be shared between threads while in use. Under WAL
+any number of readers can run concurrently with the single writer, so worker
+threads lease a dedicated read-only connection from this pool while the GUI
+thread keeps the writer.
+"""
+
+import queue
+import threading
+from sqlite3 import Connection
+from typing import Callable, List
+
+
+class ReaderPool:
+    """
+    Bounded pool of read-only connections created on demand.
+
+    Connections are opened lazily up to `max_size`; when all of them are
+    leased, `acquire()` blocks until one is released.
+
+    Attributes:
+        max_size (int): Maximum number of reader connections.
+    """
+
+    def __init__(self, factory: Callable[[], Connection], max_size: int):
+        """
+        Initializes an empty pool.
+
+        Args:
+            factory (Callable[[], Connection]): Opens and configures a new
+                read-only connection usable from any thread.
+            max_size (int): Maximum number of reader connections.
+
+        Raises:
+            ValueError: If max_size is smaller than 1.
+        """
+        if max_size < 1:
+            raise ValueError("The reader pool needs at least one connection.")
+
+        self.max_size = max_size
+        self._factory = factory
+        self._idle: queue.LifoQueue[Connection] = queue.LifoQueue()
+        self._all: List[Connection] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def acquire(self, timeout: float | None = None) -> Connection:
+        """
+        Leases a reader connection, opening a new one if the pool allows.
+
+        Args:
+            timeout (float | None): Seconds to wait for a free connection.
+                None waits indefinitely.
+
+        Returns:
+            Connection: A read-only connection owned by the caller until released.
+
+        Raises:
+            RuntimeError: If the pool is closed or no connection frees up in time.
+        """
+        if self._closed:
+            raise RuntimeError("Reader pool is closed.")
+
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self._all) < self.max_size:
+                conn = self._factory()
+                self._all.append(conn)
+                return conn
+
+        try:
+            return self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise RuntimeError("Timed out waiting for a reader connection.")
+
+    def release(self, conn: Connection):
+        """
+        Returns a leased connection to the pool.
+
+        Any read transaction left open is ended so the connection does not pin
+        an old WAL snapshot.
+
+        Args:
+            conn (Connection): The connection obtained from `acquire()`.
+        """
+        if self._closed:
+            conn.close()
+            return
+
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle.put(conn)
+
+    def close(self):
+        """Closes every connection opened by the pool. Idempotent."""
+        self._closed = True
+        with self._lock:
+            for conn in self._all:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+            self._all.clear()
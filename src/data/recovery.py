@@ -0,0 +1,243 @@
+"""
+Salvage of a damaged database file.
+
+When the database is corrupted, `recover_database()` streams every row that
+can still be read into a brand-new database with the current schema, table by
+table and in batches. A damaged page only loses the rows stored on it: the
+copy skips ahead by rowid and carries on.
+
+Derived data (full-text indexes, per-intern summary, change feed) is not
+copied; the triggers of the new database rebuild it from the copied rows.
+"""
+
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from data.database import DatabaseConnector
+
+# Tables rebuilt by triggers in the new database instead of being copied.
+DERIVED_TABLES = ("intern_summary", "change_log")
+DERIVED_SUFFIXES = ("_fts", "_fts_config", "_fts_data", "_fts_docsize", "_fts_idx")
+
+# Parents first, so the summary triggers find the intern of every child row.
+COPY_ORDER = (
+    "venues",
+    "evaluation_criteria",
+    "interns",
+    "documents",
+    "observations",
+    "meetings",
+    "grades",
+)
+
+BATCH_SIZE = 500
+
+# After a read error the copy resumes this many rowids further on, doubling
+# on every consecutive failure, and gives up on the table after MAX_SKIPS.
+FIRST_SKIP = 1
+MAX_SKIPS = 32
+
+# SQLite primary result codes that mean the file itself is damaged.
+SQLITE_CORRUPT = 11
+SQLITE_NOTADB = 26
+
+
+@dataclass
+class RecoveryReport:
+    """
+    Outcome of a recovery.
+
+    Attributes:
+        target (Path): The recovered database.
+        rows (Dict[str, int]): Rows copied per table.
+        errors (List[str]): Read errors met (each may have lost some rows).
+        damaged_copy (Optional[Path]): Where the damaged file was moved to, for
+            `recover_in_place()`.
+    """
+
+    target: Path
+    rows: Dict[str, int] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+    damaged_copy: Optional[Path] = None
+
+    @property
+    def total_rows(self) -> int:
+        return sum(self.rows.values())
+
+
+def is_corruption_error(error: sqlite3.Error) -> bool:
+    """True if the error reports a damaged or non-SQLite file (not e.g. a lock)."""
+    code = getattr(error, "sqlite_errorcode", None)
+    if code is None:
+        return type(error) is sqlite3.DatabaseError
+    return code & 0xFF in (SQLITE_CORRUPT, SQLITE_NOTADB)
+
+
+def recovery_marker(db_path: Path) -> Path:
+    """Returns the file that flags a database for recovery at the next start."""
+    return db_path.with_name(db_path.name + ".recover")
+
+
+def request_recovery(db_path: Path):
+    """Flags a database for recovery at the next start of the application."""
+    recovery_marker(db_path).write_text(datetime.now().isoformat(timespec="seconds"))
+
+
+def recover_database(
+    source: Path,
+    target: Path,
+    on_progress: Optional[Callable[[int, int], object]] = None,
+) -> RecoveryReport:
+    """
+    Copies every readable row of a damaged database into a new one.
+
+    Args:
+        source (Path): The damaged database (opened read-only).
+        target (Path): The new database; must not exist.
+        on_progress (Optional[Callable[[int, int], object]]): Called after each
+            table with `(copied_tables, total_tables)`.
+
+    Returns:
+        RecoveryReport: Rows copied and errors met.
+
+    Raises:
+        FileExistsError: If `target` already exists.
+        sqlite3.DatabaseError: If not even the table list can be read.
+    """
+    if target.exists():
+        raise FileExistsError(f"{target} already exists.")
+
+    report = RecoveryReport(target=target)
+    src = sqlite3.connect(f"{source.resolve().as_uri()}?mode=ro", uri=True)
+    dst = DatabaseConnector(db_path=target)
+    try:
+        tables = _tables_to_copy(src)
+        # Rows of a damaged file may point at rows that were lost.
+        dst.execute("PRAGMA foreign_keys = OFF")
+
+        for done, table in enumerate(tables, start=1):
+            columns = _common_columns(src, dst.conn, table)
+            if columns:
+                report.rows[table] = _copy_table(src, dst, table, columns, report)
+            if on_progress:
+                on_progress(done, len(tables))
+
+        # The copy is not a change the views need to see.
+        dst.execute("DELETE FROM change_log")
+        dst.commit()
+    finally:
+        src.close()
+        dst.close()
+    return report
+
+
+def recover_in_place(
+    db_path: Path, on_progress: Optional[Callable[[int, int], object]] = None
+) -> RecoveryReport:
+    """
+    Replaces a damaged database file by a recovered copy.
+
+    The damaged file (and its `-wal`/`-shm` companions) is kept next to it as
+    `<name>.damaged-YYYYmmdd-HHMMSS` and the recovery marker is removed.
+
+    Args:
+        db_path (Path): The damaged database.
+        on_progress (Optional[Callable[[int, int], object]]): See
+            `recover_database`.
+
+    Returns:
+        RecoveryReport: The outcome, with `damaged_copy` set.
+    """
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    recovered = db_path.with_name(f"{db_path.name}.recovered-{stamp}")
+    report = recover_database(db_path, recovered, on_progress)
+
+    damaged = db_path.with_name(f"{db_path.name}.damaged-{stamp}")
+    for suffix in ("", "-wal", "-shm"):
+        companion = db_path.with_name(db_path.name + suffix)
+        if companion.exists():
+            companion.replace(damaged.with_name(damaged.name + suffix))
+    recovered.replace(db_path)
+
+    recovery_marker(db_path).unlink(missing_ok=True)
+    report.target = db_path
+    report.damaged_copy = damaged
+    return report
+
+
+def _tables_to_copy(src: sqlite3.Connection) -> List[str]:
+    names = [
+        row[0]
+        for row in src.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' "
+            "AND name NOT LIKE 'sqlite_%'"
+        )
+    ]
+    names = [
+        name
+        for name in names
+        if name not in DERIVED_TABLES and not name.endswith(DERIVED_SUFFIXES)
+    ]
+    ordered = [name for name in COPY_ORDER if name in names]
+    return ordered + sorted(name for name in names if name not in COPY_ORDER)
+
+
+def _common_columns(
+    src: sqlite3.Connection, dst: sqlite3.Connection, table: str
+) -> List[str]:
+    """Columns present in both files, so older or newer schemas still copy."""
+    source_columns = {row[1] for row in src.execute(f"PRAGMA table_info({table})")}
+    return [
+        row[1]
+        for row in dst.execute(f"PRAGMA table_info({table})")
+        if row[1] in source_columns
+    ]
+
+
+def _copy_table(src, dst, table: str, columns: List[str], report) -> int:
+    column_list = ", ".join(columns)
+    select = (
+        f"SELECT rowid, {column_list} FROM {table} "
+        f"WHERE rowid > ? ORDER BY rowid LIMIT {BATCH_SIZE}"
+    )
+    insert = (
+        f"INSERT OR IGNORE INTO {table} ({column_list}) "
+        f"VALUES ({', '.join('?' for _ in columns)})"
+    )
+
+    copied = 0
+    last_rowid = 0
+    skip = FIRST_SKIP
+    failures = 0
+    while True:
+        # Rows read before an error in the batch are kept.
+        rows = []
+        error = None
+        try:
+            for row in src.execute(select, (last_rowid,)):
+                rows.append(row)
+        except sqlite3.DatabaseError as e:
+            error = e
+
+        if rows:
+            with dst.transaction():
+                dst.executemany(insert, [tuple(row[1:]) for row in rows])
+            copied += len(rows)
+            last_rowid = rows[-1][0]
+
+        if error is not None:
+            report.errors.append(f"{table} (rowid > {last_rowid}): {error}")
+            failures += 1
+            if failures > MAX_SKIPS:
+                break
+            last_rowid += skip
+            skip *= 2
+        elif not rows:
+            break
+        else:
+            skip = FIRST_SKIP
+            failures = 0
+    return copied
@@ -0,0 +1,141 @@
+"""
+Identity map shared by the services of one database connection.
+
+Within a session, `get` returns the same in-memory instance for a given
+model and ID, so looking up the selected intern on every button press, or
+the venue of a report, reads the database only the first time. `query`
+keeps whole result lists (e.g. the evaluation criteria) the same way.
+
+The services keep the session in step with their own writes (see
+`BaseService`). Changes the services do not see are covered by the
+connector: a rolled back `transaction()` block, a restored snapshot or a
+bulk write (`DatabaseConnector.notify_reset()`) clears the session.
+"""
+
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from data.database import DatabaseConnector
+
+T = TypeVar("T")
+
+
+class Session:
+    """
+    Identity map of the entities loaded through the services.
+
+    Entries are keyed by (model, ID); query results by (model, key). Any
+    write to a model drops its query results. The session may be used from
+    worker threads (inside `reader()`): loads run outside the lock, and a
+    result loaded while the session changed is returned but not kept.
+
+    Attributes:
+        db (DatabaseConnector): The connector whose resets clear the session.
+    """
+
+    def __init__(self, db: DatabaseConnector):
+        """
+        Creates an empty session and subscribes it to the connector's resets.
+
+        Args:
+            db (DatabaseConnector): The connector the services write through.
+        """
+        self.db = db
+        self._entities: Dict[Tuple[type, int], Any] = {}
+        self._queries: Dict[Tuple[type, str], List[Any]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        db.add_reset_listener(self.clear)
+
+    def get(
+        self, model: type, entity_id: int, load: Callable[[int], Optional[T]]
+    ) -> Optional[T]:
+        """
+        Returns the session's instance of an entity, loading it on first use.
+
+        Args:
+            model (type): The model class.
+            entity_id (int): The ID of the entity.
+            load (Callable[[int], Optional[T]]): Reads the entity by ID.
+
+        Returns:
+            Optional[T]: The instance, or None if it does not exist (not kept).
+        """
+        key = (model, entity_id)
+        with self._lock:
+            entity = self._entities.get(key)
+            generation = self._generation
+        if entity is not None:
+            return entity
+
+        entity = load(entity_id)
+        if entity is None:
+            return None
+        with self._lock:
+            if self._generation == generation:
+                entity = self._entities.setdefault(key, entity)
+        return entity
+
+    def query(self, model: type, key: str, load: Callable[[], List[T]]) -> List[T]:
+        """
+        Returns a result list of `model`, running `load` on first use.
+
+        The list is kept until the next write to `model`. Callers get their
+        own copy of the list; the instances in it are shared.
+
+        Args:
+            model (type): The model class of the rows.
+            key (str): Names the query among those of the model.
+            load (Callable[[], List[T]]): Runs the query.
+
+        Returns:
+            List[T]: The rows.
+        """
+        with self._lock:
+            rows = self._queries.get((model, key))
+            generation = self._generation
+        if rows is None:
+            rows = load()
+            with self._lock:
+                if self._generation == generation:
+                    self._queries[(model, key)] = rows
+        return list(rows)
+
+    def put(self, model: type, entity_id: int, entity: Any) -> None:
+        """
+        Makes `entity` the session's instance for its ID (after a write).
+
+        Args:
+            model (type): The model class.
+            entity_id (int): The ID of the entity.
+            entity (Any): The instance holding the written values.
+        """
+        with self._lock:
+            self._entities[(model, entity_id)] = entity
+            self._invalidate(model)
+
+    def evict(self, model: type, entity_id: Optional[int] = None) -> None:
+        """
+        Forgets an entity (after a delete or a failed write).
+
+        Args:
+            model (type): The model class.
+            entity_id (Optional[int]): The ID of the entity; None only drops
+                the query results of the model (after an insert).
+        """
+        with self._lock:
+            if entity_id is not None:
+                self._entities.pop((model, entity_id), None)
+            self._invalidate(model)
+
+    def clear(self) -> None:
+        """Forgets every entity and query result."""
+        with self._lock:
+            self._entities.clear()
+            self._queries.clear()
+            self._generation += 1
+
+    def _invalidate(self, model: type) -> None:
+        for key in [k for k in self._queries if k[0] is model]:
+            del self._queries[key]
+        self._generation += 1
@@ -0,0 +1,271 @@
+"""
+Opt-in SQL statement instrumentation.
+
+When tracing is enabled on the `DatabaseConnector`, every statement issued
+through `execute()`/`executemany()` is timed and aggregated per SQL text
+(call count, rows, latency histogram). Statements slower than a threshold are
+written to a rotating slow-query log.
+
+SQLite produces result rows lazily: `execute()` only returns once the first
+row is ready, and the rest of the scan happens while rows are fetched. The
+latency of a query therefore includes the time spent in the fetch calls, and
+it is recorded when the cursor is exhausted, closed or discarded.
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import List, Optional
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open.
+LATENCY_BUCKETS_MS = (0.1, 0.5, 1.0, 5.0, 10.0, 50.0, 100.0, 500.0)
+
+# Single logger for the slow-query log; the active tracer owns its handler.
+SLOW_QUERY_LOGGER = "intern_manager.slow_queries"
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class StatementStats:
+    """
+    Aggregated metrics of one SQL statement.
+
+    Attributes:
+        sql (str): The statement text with whitespace collapsed.
+        calls (int): Number of executions.
+        rows (int): Rows fetched (SELECT) or affected (INSERT/UPDATE/DELETE).
+        total_ms (float): Accumulated execution time, fetches included.
+        max_ms (float): Slowest execution.
+        histogram (List[int]): Executions per `LATENCY_BUCKETS_MS` bucket, plus
+            a final bucket for anything slower.
+    """
+
+    sql: str
+    calls: int = 0
+    rows: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    histogram: List[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    )
+
+    @property
+    def avg_ms(self) -> float:
+        return self.total_ms / self.calls if self.calls else 0.0
+
+
+class TracingCursor(sqlite3.Cursor):
+    """
+    Cursor that times its fetches and reports the statement when done.
+
+    The execution is reported to the tracer once, with the time of
+    `execute()` plus every fetch, when the result set is exhausted, the
+    cursor is closed or it is garbage collected.
+    """
+
+    tracer: Optional["QueryTracer"] = None
+    sql: str = ""
+    elapsed_ms: float = 0.0
+    rows: int = 0
+    _pending: bool = False
+
+    def _timed(self, fetch, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fetch(*args, **kwargs)
+        finally:
+            self.elapsed_ms += (time.perf_counter() - start) * 1000
+
+    def _finish(self):
+        if self._pending and self.tracer:
+            self._pending = False
+            self.tracer.record(self.sql, self.elapsed_ms, self.rows)
+
+    def fetchone(self):
+        row = self._timed(super().fetchone)
+        if row is None:
+            self._finish()
+        else:
+            self.rows += 1
+        return row
+
+    def fetchmany(self, size=None):
+        size = self.arraysize if size is None else size
+        rows = self._timed(super().fetchmany, size)
+        self.rows += len(rows)
+        if len(rows) < size:
+            self._finish()
+        return rows
+
+    def fetchall(self):
+        rows = self._timed(super().fetchall)
+        self.rows += len(rows)
+        self._finish()
+        return rows
+
+    def __next__(self):
+        try:
+            row = self._timed(super().__next__)
+        except StopIteration:
+            self._finish()
+            raise
+        self.rows += 1
+        return row
+
+    def close(self):
+        self._finish()
+        super().close()
+
+    def __del__(self):
+        self._finish()
+
+
+class QueryTracer:
+    """
+    Collects per-statement metrics and logs slow statements.
+
+    Attributes:
+        slow_threshold_ms (float): Executions at or above this are logged.
+        log_path (Optional[Path]): File of the rotating slow-query log.
+    """
+
+    def __init__(self, slow_threshold_ms: float, log_path: Optional[Path] = None):
+        """
+        Initializes an empty tracer.
+
+        Args:
+            slow_threshold_ms (float): Latency threshold of the slow-query log.
+            log_path (Optional[Path]): Where to write the slow-query log. When
+                None, slow statements are only counted.
+        """
+        self.slow_threshold_ms = slow_threshold_ms
+        self.log_path = log_path
+        self._stats: dict[str, StatementStats] = {}
+        self._lock = threading.Lock()
+        self._logger: Optional[logging.Logger] = None
+
+        self._handler: Optional[logging.Handler] = None
+
+        if log_path is not None:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._logger = logging.getLogger(SLOW_QUERY_LOGGER)
+            self._logger.propagate = False
+            self._logger.setLevel(logging.INFO)
+
+            # Only the newest tracer writes the log.
+            for stale in list(self._logger.handlers):
+                stale.close()
+                self._logger.removeHandler(stale)
+
+            self._handler = RotatingFileHandler(
+                log_path, maxBytes=1_000_000, backupCount=3, encoding="utf-8"
+            )
+            self._handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            self._logger.addHandler(self._handler)
+
+    def execute(
+        self, conn: sqlite3.Connection, sql: str, params, many: bool = False
+    ) -> sqlite3.Cursor:
+        """
+        Executes a statement on a `TracingCursor`.
+
+        Statements without a result set are recorded immediately; queries are
+        recorded by the cursor once their rows have been fetched.
+
+        Args:
+            conn (sqlite3.Connection): Connection to execute on.
+            sql (str): The SQL statement.
+            params: Parameters (or sequence of parameter sets when `many`).
+            many (bool): Use `executemany` instead of `execute`.
+
+        Returns:
+            sqlite3.Cursor: The cursor positioned on the results.
+        """
+        cursor = conn.cursor(TracingCursor)
+        start = time.perf_counter()
+        if many:
+            cursor.executemany(sql, params)
+        else:
+            cursor.execute(sql, params)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        cursor.tracer = self
+        cursor.sql = sql
+        cursor.elapsed_ms = elapsed_ms
+        cursor.rows = cursor.rowcount if cursor.rowcount > 0 else 0
+        cursor._pending = True
+        if cursor.description is None:
+            cursor._finish()
+        return cursor
+
+    def record(self, sql: str, elapsed_ms: float, rows: int = 0) -> StatementStats:
+        """
+        Adds one execution to the statistics of a statement.
+
+        Args:
+            sql (str): The SQL statement.
+            elapsed_ms (float): Execution time, fetches included.
+            rows (int): Rows fetched or affected by the execution.
+
+        Returns:
+            StatementStats: The (shared) statistics entry of the statement.
+        """
+        key = _WHITESPACE.sub(" ", sql).strip()
+        bucket = next(
+            (i for i, bound in enumerate(LATENCY_BUCKETS_MS) if elapsed_ms <= bound),
+            len(LATENCY_BUCKETS_MS),
+        )
+
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = StatementStats(sql=key)
+            stats.calls += 1
+            stats.rows += rows
+            stats.total_ms += elapsed_ms
+            stats.max_ms = max(stats.max_ms, elapsed_ms)
+            stats.histogram[bucket] += 1
+
+        if self._logger and elapsed_ms >= self.slow_threshold_ms:
+            self._logger.info("%.2fms %s", elapsed_ms, key)
+
+        return stats
+
+    def snapshot(self) -> List[StatementStats]:
+        """
+        Returns a copy of the collected statistics.
+
+        Returns:
+            List[StatementStats]: Entries ordered by total time, slowest first.
+        """
+        with self._lock:
+            entries = [
+                StatementStats(
+                    sql=s.sql,
+                    calls=s.calls,
+                    rows=s.rows,
+                    total_ms=s.total_ms,
+                    max_ms=s.max_ms,
+                    histogram=list(s.histogram),
+                )
+                for s in self._stats.values()
+            ]
+        return sorted(entries, key=lambda s: s.total_ms, reverse=True)
+
+    def reset(self):
+        """Discards all collected statistics."""
+        with self._lock:
+            self._stats.clear()
+
+    def close(self):
+        """Closes the slow-query log file."""
+        if self._logger and self._handler:
+            self._handler.close()
+            self._logger.removeHandler(self._handler)
+            self._handler = None
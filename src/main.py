@@ -11,11 +11,17 @@ import ctypes
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtWidgets import QApplication
+import sqlite3
+
+from PySide6.QtWidgets import QApplication, QMessageBox, QProgressDialog
+from PySide6.QtCore import Qt, QThreadPool, QSettings
 from ui.main_window import MainWindow
+from ui.maintenance_scheduler import IdleMaintenanceScheduler
 
 
 from data.database import DatabaseConnector
+from data.recovery import is_corruption_error, recover_in_place, recovery_marker
+from data.session import Session
 
 # Repositories
 from repository.venue_repo import VenueRepository
@@ -25,6 +31,10 @@ from repository.observation_repo import ObservationRepository
 from repository.evaluation_criteria_repo import EvaluationCriteriaRepository
 from repository.grade_repo import GradeRepository
 from repository.meeting_repo import MeetingRepository
+from repository.maintenance_repo import MaintenanceRepository
+from repository.change_log_repo import ChangeLogRepository
+from repository.archive_repo import ArchiveRepository
+from repository.intern_summary_repo import InternSummaryRepository
 
 # Services
 from services.venue_service import VenueService
@@ -37,12 +47,25 @@ from services.import_service import ImportService
 from services.meeting_service import MeetingService
 from services.report_service import ReportService
 from services.export_service import ExportService
+from services.diagnostics_service import DiagnosticsService
+from services.backup_service import BackupService
+from services.maintenance_service import MaintenanceService
+from services.integrity_service import IntegrityService
+from services.change_feed_service import ChangeFeedService
+from services.archive_service import ArchiveService
 
 # Utils
 from utils.seeder import seed_default_criteria
 
 # Config
-from config import DB_DIR
+from config import (
+    DB_DIR,
+    DB_PATH,
+    DB_TRACE_ENABLED,
+    MAINTENANCE_IDLE_BUDGET_MS,
+    MAINTENANCE_IDLE_MS,
+    MAINTENANCE_QUIT_BUDGET_MS,
+)
 
 
 def main():
@@ -73,15 +96,12 @@ def main():
     # It needs to be available for the repositories.
     print("INITIALIZING DATABASE CONNECTION")
     try:
-        db = DatabaseConnector()
+        db = open_database()
         print("   -> Connection successful\n")
     except Exception as e:
         print(f"CRITICAL ERROR: Failed to connect to database. Details: {e}\n")
         return
 
-    # Ensure the database connection is cleanly closed when the app exits.
-    app.aboutToQuit.connect(db.close)
-
     print("INITIALIZING SERVICES")
     try:
         # Dependency Injection: Create repository instances first,
@@ -91,20 +111,29 @@ def main():
         # Repositories (Data Access Layer)
         repo_venue = VenueRepository(db)
         repo_intern = InternRepository(db)
+        repo_summary = InternSummaryRepository(db)
         repo_doc = DocumentRepository(db)
         repo_obs = ObservationRepository(db)
         repo_criteria = EvaluationCriteriaRepository(db)
         repo_grade = GradeRepository(db)
         repo_meeting = MeetingRepository(db)
+        repo_maintenance = MaintenanceRepository(db)
+        repo_change_log = ChangeLogRepository(db)
+        repo_archive = ArchiveRepository(db)
         report_service = ReportService()
 
         # Services (Business Logic Layer)
-        v_service = VenueService(repo_venue)
-        i_service = InternService(repo_intern)
+        # The session lets the services hand out the same instance of an
+        # intern, venue or criteria instead of reading it again.
+        session = Session(db)
+        v_service = VenueService(repo_venue, session=session)
+        i_service = InternService(
+            repo_intern, summary_repo=repo_summary, session=session
+        )
         d_service = DocumentService(repo_doc)
         obs_service = ObservationService(repo_obs)
         m_service = MeetingService(repo_meeting)
-        criteria_service = EvaluationCriteriaService(repo_criteria)
+        criteria_service = EvaluationCriteriaService(repo_criteria, session=session)
 
         # Some services might need access to multiple repositories.
         grade_service = GradeService(repo=repo_grade, criteria_repo=repo_criteria)
@@ -117,11 +146,57 @@ def main():
             document_service=d_service,
         )
         export_service = ExportService(db)
+        diagnostics_service = DiagnosticsService(db)
+        backup_service = BackupService(db)
+        maintenance_service = MaintenanceService(repo_maintenance)
+        integrity_service = IntegrityService(repo_maintenance)
+        change_feed_service = ChangeFeedService(repo_change_log)
+        archive_service = ArchiveService(repo_archive)
         print("   -> Services initialized successfully\n")
     except Exception as e:
         print(f"CRITICAL ERROR: Failed to initialize services. Details: {e}\n")
         return
 
+    # Optimize/analyze/vacuum while the user is idle, then check integrity in
+    # the background. Stopped first on exit, so a running check is cancelled
+    # instead of being waited for.
+    maintenance_scheduler = IdleMaintenanceScheduler(
+        maintenance_service,
+        MAINTENANCE_IDLE_MS,
+        MAINTENANCE_IDLE_BUDGET_MS,
+        app,
+        integrity_service=integrity_service,
+    )
+    maintenance_scheduler.integrity_failed.connect(
+        lambda details: QMessageBox.warning(
+            None,
+            "Banco de dados danificado",
+            "A verificação de integridade encontrou problemas no banco de dados.\n"
+            "Os dados legíveis serão recuperados na próxima inicialização.\n\n"
+            f"Detalhes:\n{details}",
+        )
+    )
+    app.aboutToQuit.connect(maintenance_scheduler.stop)
+
+    # On exit: wait for background reads (dashboard, reports), trim the change
+    # feed, run the maintenance tasks that are due, then close the connection
+    # cleanly.
+    def run_exit_maintenance():
+        try:
+            change_feed_service.prune()
+            maintenance_service.run(MAINTENANCE_QUIT_BUDGET_MS, allow_full_vacuum=True)
+        except Exception as e:
+            print(f"WARNING: Exit maintenance failed. Details: {e}")
+
+    app.aboutToQuit.connect(QThreadPool.globalInstance().waitForDone)
+    app.aboutToQuit.connect(run_exit_maintenance)
+    app.aboutToQuit.connect(db.close)
+
+    # Opt-in SQL tracing (env var or the toggle in the Settings dialog).
+    settings = QSettings("MyOrganization", "InternManager2026")
+    if DB_TRACE_ENABLED or settings.value("query_tracing", False, type=bool):
+        diagnostics_service.set_tracing_enabled(True)
+
     # Populate the database with default evaluation criteria if it's a fresh setup.
     try:
         seed_default_criteria(criteria_service)
@@ -135,12 +210,8 @@ def main():
 
     if csv_path:
         try:
+            # read_file runs as a single unit of work and commits on success.
             imp_service.read_file(csv_path)
-            # Make sure the changes from the import are saved.
-            if db.conn:
-                db.conn.commit()
-            else:
-                print("ERRO CRÍTICO: Conexão perdida ao tentar salvar importação.")
         except Exception as e:
             print(f"ERROR: Failed to process import file. Details: {e}\n")
     else:
@@ -151,9 +222,10 @@ def main():
     # A safety check. Ensures that every existing intern has their required
     # documents created, in case they were missed or the system logic changed.
     all_interns = i_service.get_all_interns()
-    for intern in all_interns:
-        if intern.intern_id:
-            d_service.create_initial_documents_batch(intern.intern_id)
+    with d_service.transaction():
+        d_service.create_initial_documents_for_interns(
+            [intern.intern_id for intern in all_interns if intern.intern_id]
+        )
 
     # Inject all necessary services into the main UI window.
     # The UI layer should only interact with services, never with repositories directly.
@@ -168,15 +240,81 @@ def main():
         report_service=report_service,
         import_service=imp_service,
         export_service=export_service,
+        diagnostics_service=diagnostics_service,
+        backup_service=backup_service,
+        change_feed_service=change_feed_service,
+        archive_service=archive_service,
     )
 
     window.show()
 
+    # Feedback while the background integrity check walks a large database.
+    maintenance_scheduler.integrity_progress.connect(
+        lambda done, total: window.statusBar().showMessage(
+            f"Verificando a integridade do banco de dados: {done}/{total} tabelas",
+            3000,
+        )
+    )
+
     print("\n=== SYSTEM RUNNING (GUI) ===")
 
     sys.exit(app.exec())
 
 
+def open_database() -> DatabaseConnector:
+    """
+    Opens the application database, recovering it first if it is damaged.
+
+    The database is recovered (see `data.recovery`) when a background
+    integrity check flagged it during the previous session, or when opening it
+    fails because the file is corrupted. The damaged file is kept next to the
+    recovered one.
+
+    Returns:
+        DatabaseConnector: The open database.
+    """
+    if not recovery_marker(DB_PATH).exists():
+        try:
+            return DatabaseConnector()
+        except sqlite3.DatabaseError as e:
+            if not is_corruption_error(e) or not DB_PATH.exists():
+                raise
+            print(f"   -> Database is damaged ({e}); recovering")
+
+    progress = QProgressDialog("Recuperando o banco de dados...", None, 0, 0)
+    progress.setWindowTitle("Recuperação")
+    progress.setWindowModality(Qt.WindowModality.ApplicationModal)
+    progress.setMinimumDuration(0)
+    progress.show()
+
+    def on_progress(done: int, total: int):
+        progress.setMaximum(total)
+        progress.setValue(done)
+        QApplication.processEvents()
+
+    try:
+        report = recover_in_place(DB_PATH, on_progress)
+    finally:
+        progress.close()
+
+    print(
+        f"   -> Recovered {report.total_rows} rows "
+        f"({len(report.errors)} read errors); damaged file kept at "
+        f"{report.damaged_copy}"
+    )
+    message = (
+        f"O banco de dados foi recuperado ({report.total_rows} registros).\n"
+        f"O arquivo danificado foi mantido em:\n{report.damaged_copy}"
+    )
+    if report.errors:
+        message += (
+            f"\n\n{len(report.errors)} trecho(s) não puderam ser lidos; "
+            "alguns registros podem ter sido perdidos."
+        )
+    QMessageBox.information(None, "Recuperação concluída", message)
+    return DatabaseConnector()
+
+
 def get_csv_path() -> Optional[Path]:
     """
     Finds the path to a CSV file for automatic import.
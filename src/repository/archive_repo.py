@@ -0,0 +1,165 @@
+from pathlib import Path
+from typing import List
+
+from data.database import DatabaseConnector
+from core.models.intern import Intern
+from repository.intern_repo import FINISHED
+
+# Tables copied into an archive, parents first so the foreign keys of the
+# archive file hold. Venues and criteria are copied (not moved): the current
+# interns still reference them.
+SHARED_TABLES = ("venues", "evaluation_criteria")
+INTERN_TABLES = ("documents", "meetings", "grades", "observations")
+
+# Interns whose internship is over: the ones the list shows as 'Concluído'.
+ENDED_INTERNS = f"""
+    SELECT intern_id FROM main.interns
+    WHERE term = ? AND {FINISHED}
+"""
+
+
+class ArchiveRepository:
+    """
+    Repository that moves closed terms between the database and archive files.
+
+    Archive files have the same schema as the main database and are only
+    attached (`ATTACH DATABASE ... AS <alias>`) while a statement needs them.
+
+    Attributes:
+        db (DatabaseConnector): The database connector instance.
+    """
+
+    def __init__(self, db: DatabaseConnector):
+        """
+        Initializes the repository with an active database connection.
+
+        Args:
+            db (DatabaseConnector): An initialized connector with an open connection.
+
+        Raises:
+            RuntimeError: If the connector does not hold a valid connection.
+        """
+        self.db = db
+        if db.conn is None:
+            raise RuntimeError(
+                "Repository initialized without a valid database connection."
+            )
+
+    def get_closed_terms(self) -> List[str]:
+        """
+        Returns the terms whose interns have all finished their internship.
+
+        Returns:
+            List[str]: The terms, oldest first.
+        """
+        sql_query = f"""
+        SELECT term
+        FROM interns
+        GROUP BY term
+        HAVING MIN({FINISHED}) = 1
+        ORDER BY term
+        """
+        return [row["term"] for row in self.db.execute(sql_query).fetchall()]
+
+    def attach(self, path: Path, alias: str):
+        """
+        Attaches an archive file to the connection in use by the calling thread.
+
+        Args:
+            path (Path): The archive file.
+            alias (str): Schema name of the archive in SQL (`<alias>.interns`).
+        """
+        self.db.execute("ATTACH DATABASE ? AS " + alias, (str(path),))
+
+    def detach(self, alias: str):
+        """Detaches an archive attached with `attach`."""
+        self.db.execute("DETACH DATABASE " + alias)
+
+    def copy_term(self, alias: str, term: str):
+        """
+        Copies the ended interns of a term, with all their records, to an archive.
+
+        Only the archive is written, so a transaction around the copy is
+        atomic even in WAL mode. Rows already in the archive (same primary
+        key) are skipped, so a copy interrupted after its commit, or followed
+        by a failed `delete_archived`, can simply be run again.
+
+        Args:
+            alias (str): Schema name of the attached archive.
+            term (str): The term to archive.
+        """
+        for table in SHARED_TABLES:
+            columns = self._columns(table)
+            self.db.execute(
+                f"INSERT OR IGNORE INTO {alias}.{table} ({columns}) "
+                f"SELECT {columns} FROM main.{table}"
+            )
+
+        for table in ("interns", *INTERN_TABLES):
+            columns = self._columns(table)
+            self.db.execute(
+                f"INSERT OR IGNORE INTO {alias}.{table} ({columns}) "
+                f"SELECT {columns} FROM main.{table} "
+                f"WHERE intern_id IN ({ENDED_INTERNS})",
+                (term,),
+            )
+
+    def delete_archived(self, alias: str, term: str) -> int:
+        """
+        Deletes from the main database the ended interns already in the archive.
+
+        Interns missing from the archive are kept, so a copy that was lost
+        never turns into lost data. Documents, meetings, grades and
+        observations follow by cascade.
+
+        Args:
+            alias (str): Schema name of the attached archive.
+            term (str): The archived term.
+
+        Returns:
+            int: Number of interns deleted.
+        """
+        cursor = self.db.execute(
+            f"DELETE FROM main.interns WHERE intern_id IN ({ENDED_INTERNS}) "
+            f"AND intern_id IN (SELECT intern_id FROM {alias}.interns)",
+            (term,),
+        )
+        return cursor.rowcount
+
+    def get_interns(self, alias: str) -> List[Intern]:
+        """
+        Retrieves the interns stored in an attached archive.
+
+        Args:
+            alias (str): Schema name of the attached archive.
+
+        Returns:
+            List[Intern]: The archived interns, ordered by name.
+        """
+        sql_query = f"""
+        SELECT intern_id, name, registration_number, term, email, start_date, end_date,
+        working_days, working_hours, venue_id
+        FROM {alias}.interns
+        ORDER BY name COLLATE NOCASE ASC
+        """
+        cursor = self.db.execute(sql_query)
+        return [
+            Intern(
+                intern_id=row["intern_id"],
+                name=row["name"],
+                registration_number=row["registration_number"],
+                term=row["term"],
+                email=row["email"],
+                start_date=row["start_date"],
+                end_date=row["end_date"],
+                working_days=row["working_days"],
+                working_hours=row["working_hours"],
+                venue_id=row["venue_id"],
+            )
+            for row in cursor.fetchall()
+        ]
+
+    def _columns(self, table: str) -> str:
+        """Column list of a table, so the copy does not depend on column order."""
+        rows = self.db.execute(f"PRAGMA main.table_info({table})").fetchall()
+        return ", ".join(row["name"] for row in rows)
@@ -0,0 +1,435 @@
+"""
+Declarative base for the entity repositories.
+
+Each repository declares its model, table and column mapping once; the base
+class derives the column list, the standard CRUD statements and a row
+factory from it when the subclass is defined.
+
+Example:
+    class MeetingRepository(BaseRepository[Meeting]):
+        model = Meeting
+        table = "meetings"
+        id_field = "meeting_id"
+        columns = (
+            Column("meeting_id"),
+            Column("intern_id", updatable=False),
+            Column("meeting_date"),
+            Column("is_intern_present", convert=bool),
+        )
+"""
+
+import json
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from data.database import DatabaseConnector
+
+T = TypeVar("T")
+
+# Rows fetched per round trip by the streaming reads (`iter_all`).
+ITER_BATCH_SIZE = 500
+
+# Rows per multi-row INSERT of `save_many`; keeps the bound parameters well
+# below SQLite's limit for any table of this schema.
+INSERT_BATCH_SIZE = 500
+
+
+@dataclass(frozen=True)
+class Column:
+    """
+    Mapping of one table column to one model attribute.
+
+    Attributes:
+        field (str): Attribute of the model.
+        name (Optional[str]): Column in the table, when it differs from `field`.
+        writable (bool): Whether INSERT/UPDATE write the column. The ID is
+            never written.
+        updatable (bool): Whether UPDATE writes the column; False for values
+            fixed at creation, such as the owner of a document (`intern_id`).
+        convert (Optional[Callable[[Any], Any]]): Converts the stored value
+            into the attribute value (e.g. `bool` for 0/1 flags). Applied to
+            NULL as well.
+        derive (Optional[Callable[[Any], Any]]): Computes the stored value
+            from the entity, for columns the model has no attribute for
+            (e.g. a normalized copy of the name). Such a column is written
+            but never selected; `field` is then the column name.
+    """
+
+    field: str
+    name: Optional[str] = None
+    writable: bool = True
+    updatable: bool = True
+    convert: Optional[Callable[[Any], Any]] = None
+    derive: Optional[Callable[[Any], Any]] = None
+
+    @property
+    def column(self) -> str:
+        return self.name or self.field
+
+
+class BaseRepository(Generic[T]):
+    """
+    Base class of the repositories that map one table to one model.
+
+    Subclasses set `model`, `table`, `id_field` and `columns`, and optionally
+    `default_order` (ORDER BY of `get_all`) and `touch_column` (set to the
+    current local time by `update`). From those, `__init_subclass__` builds
+    once per class:
+
+    - `select_sql`: `SELECT <columns> FROM <table>`, to be completed with a
+      WHERE/ORDER BY clause by the subclass queries;
+    - a row factory that builds the model straight from the row tuple, by
+      position, so no `sqlite3.Row` is created;
+    - the INSERT, UPDATE and DELETE statements, and an attribute getter for
+      their parameters.
+
+    Writes commit, like the rest of the repositories; inside
+    `DatabaseConnector.transaction()` the commit is deferred to the block.
+
+    Attributes:
+        db (DatabaseConnector): The database connector instance.
+    """
+
+    model: ClassVar[type]
+    table: ClassVar[str]
+    id_field: ClassVar[str]
+    columns: ClassVar[Tuple[Column, ...]]
+    default_order: ClassVar[Optional[str]] = None
+    touch_column: ClassVar[Optional[str]] = None
+
+    id_column: ClassVar[str]
+    select_sql: ClassVar[str]
+    _row_factory: ClassVar[Callable[[Any, tuple], Any]]
+    _insert_sql: ClassVar[str]
+    _insert_head: ClassVar[str]
+    _insert_row: ClassVar[str]
+    _update_sql: ClassVar[str]
+    _delete_sql: ClassVar[str]
+    _write_values: ClassVar[Callable[[Any], tuple]]
+    _update_values: ClassVar[Callable[[Any], tuple]]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "columns" not in cls.__dict__:
+            return
+
+        id_column = next(c.column for c in cls.columns if c.field == cls.id_field)
+        cls.id_column = id_column
+        selected = tuple(c for c in cls.columns if c.derive is None)
+        column_list = ", ".join(c.column for c in selected)
+        cls.select_sql = f"SELECT {column_list} FROM {cls.table}"
+        cls._row_factory = staticmethod(_make_row_factory(cls.model, selected))
+
+        writable = [c for c in cls.columns if c.writable and c.field != cls.id_field]
+        names = [c.column for c in writable]
+        cls._insert_head = f"INSERT INTO {cls.table} ({', '.join(names)}) VALUES "
+        cls._insert_row = f"({', '.join('?' for _ in names)})"
+        cls._insert_sql = cls._insert_head + cls._insert_row
+        updatable = [c for c in writable if c.updatable]
+        assignments = [f"{c.column} = ?" for c in updatable]
+        if cls.touch_column:
+            assignments.append(
+                f"{cls.touch_column} = strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')"
+            )
+        cls._update_sql = (
+            f"UPDATE {cls.table} SET {', '.join(assignments)} WHERE {id_column} = ?"
+        )
+        cls._delete_sql = f"DELETE FROM {cls.table} WHERE {id_column} = ?"
+
+        cls._write_values = staticmethod(_make_values_getter(writable))
+        cls._update_values = staticmethod(_make_values_getter(updatable))
+
+    def __init__(self, db: DatabaseConnector):
+        """
+        Initializes the repository with an active database connection.
+
+        Args:
+            db (DatabaseConnector): An initialized connector with an open connection.
+
+        Raises:
+            RuntimeError: If the connector does not hold a valid connection.
+        """
+        self.db = db
+        if db.conn is None:
+            raise RuntimeError(
+                "Repository initialized without a valid database connection."
+            )
+
+    # --- Reads ---
+
+    def get_all(self) -> List[T]:
+        """
+        Retrieves every row of the table.
+
+        Returns:
+            List[T]: The models, in `default_order`.
+        """
+        order = f" ORDER BY {self.default_order}" if self.default_order else ""
+        return self._fetch_all(order)
+
+    def iter_all(self, batch_size: int = ITER_BATCH_SIZE) -> Iterator[T]:
+        """
+        Streams every row of the table, in `default_order`.
+
+        Rows are fetched `batch_size` at a time, so memory use does not grow
+        with the table. The statement stays open until the generator is
+        exhausted or closed.
+
+        Args:
+            batch_size (int): Rows fetched per round trip.
+
+        Yields:
+            T: The models, one at a time.
+        """
+        order = f" ORDER BY {self.default_order}" if self.default_order else ""
+        return self._iter(order, batch_size=batch_size)
+
+    def get_by_id(self, entity_id: int) -> Optional[T]:
+        """
+        Retrieves a row by its primary key.
+
+        Args:
+            entity_id (int): The unique identifier.
+
+        Returns:
+            Optional[T]: The model if found, otherwise None.
+        """
+        return self._fetch_one(f"WHERE {self.id_column} = ?", (entity_id,))
+
+    def _fetch_all(self, clause: str = "", params: Sequence[Any] = ()) -> List[T]:
+        """Runs `select_sql` followed by `clause` and maps every row."""
+        cursor = self.db.execute(f"{self.select_sql} {clause}", params)
+        cursor.row_factory = self._row_factory
+        return cursor.fetchall()
+
+    def _fetch_one(self, clause: str = "", params: Sequence[Any] = ()) -> Optional[T]:
+        """Runs `select_sql` followed by `clause` and maps the first row."""
+        cursor = self.db.execute(f"{self.select_sql} {clause}", params)
+        cursor.row_factory = self._row_factory
+        return cursor.fetchone()
+
+    def _iter(
+        self,
+        clause: str = "",
+        params: Sequence[Any] = (),
+        batch_size: int = ITER_BATCH_SIZE,
+    ) -> Iterator[T]:
+        """Runs `select_sql` followed by `clause` and yields the rows in batches."""
+        cursor = self.db.execute(f"{self.select_sql} {clause}", params)
+        cursor.row_factory = self._row_factory
+        try:
+            while batch := cursor.fetchmany(batch_size):
+                yield from batch
+        finally:
+            cursor.close()
+
+    def _fetch_grouped(
+        self, key_field: str, keys: Iterable[int], order_by: Optional[str] = None
+    ) -> Dict[int, List[T]]:
+        """
+        Loads the rows of many parents in one query, grouped by parent.
+
+        Args:
+            key_field (str): Attribute holding the parent key (e.g. 'intern_id').
+            keys (Iterable[int]): The parent keys.
+            order_by (Optional[str]): ORDER BY of the rows within each group.
+
+        Returns:
+            Dict[int, List[T]]: The rows of each key, in `order_by`; keys
+            without rows map to an empty list.
+        """
+        grouped: Dict[int, List[T]] = {key: [] for key in keys}
+        for entity in self._fetch_in(key_field, grouped, order_by):
+            grouped[getattr(entity, key_field)].append(entity)
+        return grouped
+
+    def _fetch_in(
+        self, field: str, values: Iterable[Any], order_by: Optional[str] = None
+    ) -> List[T]:
+        """
+        Retrieves the rows whose column `field` is one of `values`, in one query.
+
+        The values are bound as a single JSON array and expanded by
+        `json_each`, so the statement is the same for any number of values
+        (and is cached) and never hits the bound-parameter limit.
+        """
+        values = list(values)
+        if not values:
+            return []
+
+        column = next(c.column for c in self.columns if c.field == field)
+        clause = f"WHERE {column} IN (SELECT value FROM json_each(?))"
+        if order_by:
+            clause += f" ORDER BY {order_by}"
+        return self._fetch_all(clause, (json.dumps(values),))
+
+    def _from_row(self, row: Sequence[Any]) -> T:
+        """Maps a row read with the `select_sql` column list."""
+        return self._row_factory(None, row)
+
+    # --- Writes ---
+
+    def save(self, entity: T) -> int:
+        """
+        Persists a new entity.
+
+        Args:
+            entity (T): The entity to save. Must not have an ID yet.
+
+        Returns:
+            int: The unique identifier of the new record.
+
+        Raises:
+            ValueError: If the entity already has an ID.
+            RuntimeError: If the database fails to generate an ID.
+        """
+        if getattr(entity, self.id_field) is not None:
+            raise ValueError(
+                f"Cannot save a {self.model.__name__} that already has an ID. "
+                "Use update instead."
+            )
+        cursor = self.db.execute(self._insert_sql, self._write_values(entity))
+        self.db.commit()
+        if cursor.lastrowid is None:
+            raise RuntimeError(
+                f"Database failed to generate an ID for the new {self.model.__name__}."
+            )
+        return cursor.lastrowid
+
+    def save_many(self, entities: Sequence[T]) -> List[int]:
+        """
+        Persists many new entities with multi-row INSERTs.
+
+        Rows are inserted `INSERT_BATCH_SIZE` per statement, inside one
+        transaction, and the new IDs are read back with `RETURNING` and set on
+        the entities.
+
+        Args:
+            entities (Sequence[T]): The entities to save. None may have an ID.
+
+        Returns:
+            List[int]: The new IDs, in the order of `entities`.
+
+        Raises:
+            ValueError: If an entity already has an ID.
+        """
+        if any(getattr(entity, self.id_field) is not None for entity in entities):
+            raise ValueError(
+                f"Cannot save a {self.model.__name__} that already has an ID. "
+                "Use update instead."
+            )
+
+        ids: List[int] = []
+        with self.db.transaction():
+            for start in range(0, len(entities), INSERT_BATCH_SIZE):
+                chunk = entities[start : start + INSERT_BATCH_SIZE]
+                sql_query = (
+                    self._insert_head
+                    + ", ".join(self._insert_row for _ in chunk)
+                    + f" RETURNING {self.id_column}"
+                )
+                params = [value for e in chunk for value in self._write_values(e)]
+                rows = self.db.execute(sql_query, params).fetchall()
+                # RETURNING does not promise an order; new rowids grow with
+                # the VALUES order.
+                ids.extend(sorted(row[0] for row in rows))
+
+        for entity, entity_id in zip(entities, ids):
+            setattr(entity, self.id_field, entity_id)
+        return ids
+
+    def update(self, entity: T) -> bool:
+        """
+        Updates an existing record with every writable attribute.
+
+        Args:
+            entity (T): The entity with updated data. Must have an ID.
+
+        Returns:
+            bool: True if a row was updated.
+
+        Raises:
+            ValueError: If the entity does not have an ID.
+        """
+        entity_id = getattr(entity, self.id_field)
+        if entity_id is None:
+            raise ValueError(f"Cannot update a {self.model.__name__} without an ID.")
+        cursor = self.db.execute(
+            self._update_sql, (*self._update_values(entity), entity_id)
+        )
+        self.db.commit()
+        return cursor.rowcount > 0
+
+    def delete(self, entity: T) -> bool:
+        """
+        Permanently deletes a record.
+
+        Args:
+            entity (T): The entity to delete. Must have an ID.
+
+        Returns:
+            bool: True if a row was deleted.
+
+        Raises:
+            ValueError: If the entity does not have an ID.
+        """
+        entity_id = getattr(entity, self.id_field)
+        if entity_id is None:
+            raise ValueError(f"Cannot delete a {self.model.__name__} without an ID.")
+        cursor = self.db.execute(self._delete_sql, (entity_id,))
+        self.db.commit()
+        return cursor.rowcount > 0
+
+
+def _make_row_factory(
+    model: type, columns: Tuple[Column, ...]
+) -> Callable[[Any, tuple], Any]:
+    """
+    Builds `row_factory(cursor, row)` returning the model built from the row.
+
+    The row is read by position, and only the columns with a `convert` go
+    through a conversion, so mapping a row costs no lookup by name.
+    """
+    fields = tuple(c.field for c in columns)
+    converters = tuple(
+        (index, c.convert) for index, c in enumerate(columns) if c.convert
+    )
+
+    if not converters:
+
+        def row_factory(cursor, row):
+            return model(**dict(zip(fields, row)))
+
+        return row_factory
+
+    def row_factory(cursor, row):
+        values = list(row)
+        for index, convert in converters:
+            values[index] = convert(values[index])
+        return model(**dict(zip(fields, values)))
+
+    return row_factory
+
+
+def _make_values_getter(columns: List[Column]) -> Callable[[Any], tuple]:
+    """Builds `values(entity)`: the parameters of `columns`, in order."""
+    if any(c.derive is not None for c in columns):
+        getters = [c.derive or attrgetter(c.field) for c in columns]
+        return lambda entity: tuple(get(entity) for get in getters)
+
+    getter = attrgetter(*(c.field for c in columns))
+    return getter if len(columns) > 1 else lambda entity: (getter(entity),)
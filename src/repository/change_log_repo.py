@@ -0,0 +1,102 @@
+from data.database import DatabaseConnector
+from core.models.data_change import DataChange
+from typing import Optional, List
+
+
+class ChangeLogRepository:
+    """
+    Repository for the trigger-maintained change feed (`change_log` table).
+
+    Rows are only ever written by the triggers; this repository reads them
+    and trims the history.
+
+    Attributes:
+        db (DatabaseConnector): The database connector instance.
+    """
+
+    def __init__(self, db: DatabaseConnector):
+        """
+        Initializes the repository with an active database connection.
+
+        Args:
+            db (DatabaseConnector): An initialized connector with an open connection.
+
+        Raises:
+            RuntimeError: If the connector does not hold a valid connection.
+        """
+        self.db = db
+        if db.conn is None:
+            raise RuntimeError(
+                "Repository initialized without a valid database connection."
+            )
+
+    def get_changes_since(
+        self, seq: int, limit: Optional[int] = None
+    ) -> List[DataChange]:
+        """
+        Retrieves the changes recorded after a sequence number, oldest first.
+
+        Args:
+            seq (int): Last sequence number already seen by the caller.
+            limit (Optional[int]): Maximum number of changes; None for all.
+
+        Returns:
+            List[DataChange]: The changes.
+        """
+        sql_query = """
+        SELECT seq, table_name, row_id, operation
+        FROM change_log
+        WHERE seq > ?
+        ORDER BY seq
+        LIMIT ?
+        """
+        cursor = self.db.execute(sql_query, (seq, -1 if limit is None else limit))
+        return [self._parse_row(row) for row in cursor.fetchall()]
+
+    def get_latest_sequence(self) -> int:
+        """
+        Returns the sequence number of the most recent change.
+
+        Read from `sqlite_sequence`, so it stays correct after the history
+        has been pruned.
+
+        Returns:
+            int: The sequence number, or 0 if nothing ever changed.
+        """
+        sql_query = "SELECT seq FROM sqlite_sequence WHERE name = 'change_log'"
+        row = self.db.execute(sql_query).fetchone()
+        return row["seq"] if row else 0
+
+    def get_oldest_sequence(self) -> Optional[int]:
+        """
+        Returns the sequence number of the oldest change still recorded.
+
+        Returns:
+            Optional[int]: The sequence number, or None if the log is empty.
+        """
+        row = self.db.execute("SELECT MIN(seq) AS seq FROM change_log").fetchone()
+        return row["seq"]
+
+    def prune(self, keep: int):
+        """
+        Deletes all but the `keep` most recent changes.
+
+        Args:
+            keep (int): Number of changes to keep.
+        """
+        sql_query = """
+        DELETE FROM change_log
+        WHERE seq <= (
+            SELECT seq FROM change_log ORDER BY seq DESC LIMIT 1 OFFSET ?
+        )
+        """
+        self.db.execute(sql_query, (keep,))
+        self.db.commit()
+
+    def _parse_row(self, row) -> DataChange:
+        return DataChange(
+            seq=row["seq"],
+            table_name=row["table_name"],
+            row_id=row["row_id"],
+            operation=row["operation"],
+        )
@@ -1,110 +1,140 @@
-from sqlite3 import Connection, Cursor
-from data.database import DatabaseConnector
 from core.models.document import Document
-from typing import List, Optional
+from core.models.search_result import SearchResult
+from repository.base_repo import BaseRepository, Column
+import json
+from typing import Dict, Iterable, List, Tuple
 
 
-class DocumentRepository:
-    def __init__(self, db: DatabaseConnector):
-        self.db = db
-        if db.conn is None or db.cursor is None:
-            raise RuntimeError(
-                "Repository initialized without a valid database connection."
-            )
-        self.conn: Connection = db.conn
-        self.cursor: Cursor = db.cursor
+class DocumentRepository(BaseRepository[Document]):
+    model = Document
+    table = "documents"
+    id_field = "document_id"
+    columns = (
+        Column("document_id"),
+        Column("intern_id", updatable=False),
+        Column("document_name"),
+        Column("status"),
+        Column("feedback"),
+        Column("last_update", writable=False),
+    )
+    touch_column = "last_update"
 
     def get_by_intern_id(self, intern_id: int) -> List[Document]:
-        sql_query = "SELECT document_id, intern_id, document_name, status, feedback FROM documents WHERE intern_id = ?"
-        self.cursor.execute(sql_query, (intern_id,))
-        results = self.cursor.fetchall()
-        return [
-            Document(
-                document_id=row["document_id"],
-                intern_id=row["intern_id"],
-                document_name=row["document_name"],
-                status=row["status"],
-                feedback=row["feedback"],
-            )
-            for row in results
-        ]
+        return self._fetch_all("WHERE intern_id = ?", (intern_id,))
 
-    def get_by_id(self, document_id: int) -> Optional[Document]:
-        sql_query = "SELECT document_id, intern_id, document_name, status, feedback FROM documents WHERE document_id = ?"
-        self.cursor.execute(sql_query, (document_id,))
-        row = self.cursor.fetchone()
-        if row is None:
-            return None
-        return Document(
-            document_id=row["document_id"],
-            intern_id=row["intern_id"],
-            document_name=row["document_name"],
-            status=row["status"],
-            feedback=row["feedback"],
-        )
+    def get_by_intern_ids(self, intern_ids: Iterable[int]) -> Dict[int, List[Document]]:
+        """Documents of many interns in one query, grouped by intern."""
+        return self._fetch_grouped("intern_id", intern_ids)
 
     def count_pending(self) -> int:
         """Retorna o total de documentos com status = Pendente."""
         sql_query = "SELECT COUNT(*) FROM documents WHERE status = 'Pendente' "
-        self.cursor.execute(sql_query)
-        result = self.cursor.fetchone()
+        cursor = self.db.execute(sql_query)
+        result = cursor.fetchone()
         return result[0] if result else 0
 
-    def save(self, document: Document) -> int:
-        if document.document_id is not None:
-            raise ValueError("Cannot save a document that already has an ID.")
-        sql_query = "INSERT INTO documents (intern_id, document_name, status, feedback) VALUES (?, ?, ?, ?)"
-        data = (
-            document.intern_id,
-            document.document_name,
-            document.status,
-            document.feedback,
-        )
-        self.cursor.execute(sql_query, data)
-        self.conn.commit()
-        return self.cursor.lastrowid  # type: ignore
+    def get_status_histogram(self) -> Dict[str, Dict[str, int]]:
+        """
+        Counts the documents per name and status.
+
+        Returns:
+            Dict[str, Dict[str, int]]: {document_name: {status: count}}; a
+            NULL status is reported as None.
+        """
+        sql_query = """
+        SELECT document_name, status, COUNT(*) AS total
+        FROM documents
+        GROUP BY document_name, status
+        """
+        histogram: Dict[str, Dict[str, int]] = {}
+        for row in self.db.execute(sql_query).fetchall():
+            histogram.setdefault(row["document_name"], {})[row["status"]] = row["total"]
+        return histogram
+
+    def count_pending_by_intern(self) -> Dict[int, int]:
+        """
+        Counts the pending documents of each intern.
 
-    def update(self, document: Document) -> bool:
-        if document.document_id is None:
-            raise ValueError("Cannot update a document without an ID.")
+        Returns:
+            Dict[int, int]: {intern_id: pending documents}; interns without
+            pending documents are absent.
+        """
+        sql_query = """
+        SELECT intern_id, COUNT(*) AS total
+        FROM documents
+        WHERE status = 'Pendente'
+        GROUP BY intern_id
+        """
+        return {
+            row["intern_id"]: row["total"]
+            for row in self.db.execute(sql_query).fetchall()
+        }
+
+    def count_interns_by_approval(
+        self, document_names: Iterable[str]
+    ) -> Tuple[int, int]:
+        """
+        Splits the interns by whether one of the given documents is approved.
+
+        Args:
+            document_names (Iterable[str]): Exact document names.
 
+        Returns:
+            Tuple[int, int]: (interns with an approved document among the
+            names, interns without one, including those with none of them).
+        """
         sql_query = """
-                UPDATE documents 
-                SET document_name = ?, 
-                    status = ?, 
-                    feedback = ?, 
-                    last_update = datetime('now', 'localtime') 
-                WHERE document_id = ?
-            """
-
-        data = (
-            document.document_name,
-            document.status,
-            document.feedback,
-            document.document_id,
+        SELECT COALESCE(SUM(approved), 0) AS ok, COUNT(*) - COALESCE(SUM(approved), 0) AS pending
+        FROM (
+            SELECT MAX(d.status = 'Aprovado') AS approved
+            FROM interns i
+            LEFT JOIN documents d
+                ON d.intern_id = i.intern_id
+                AND d.document_name IN (SELECT value FROM json_each(?))
+            GROUP BY i.intern_id
         )
+        """
+        row = self.db.execute(sql_query, (json.dumps(list(document_names)),)).fetchone()
+        return row["ok"], row["pending"]
 
-        self.cursor.execute(sql_query, data)
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+    def search_feedback(self, match_query: str, limit: int = 50) -> List[SearchResult]:
+        """
+        Full-text search over the document feedback, best matches first.
 
-    def delete(self, document: Document) -> bool:
-        if document.document_id is None:
-            raise ValueError("Cannot delete a document without an ID.")
-        sql_query = "DELETE FROM documents WHERE document_id = ?"
-        self.cursor.execute(sql_query, (document.document_id,))
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        Args:
+            match_query (str): An FTS5 MATCH expression (see
+                `utils.text.to_fts_query`).
+            limit (int): Maximum number of results.
 
-    def create_batch(self, documents: List[Document]):
-        query = "INSERT INTO documents (intern_id, document_name, status, feedback) VALUES (?, ?, ?, ?)"
-        data = [
-            (doc.intern_id, doc.document_name, doc.status, doc.feedback)
-            for doc in documents
+        Returns:
+            List[SearchResult]: The matching documents with a snippet.
+        """
+        sql_query = """
+        SELECT d.document_id, d.intern_id,
+               snippet(documents_fts, 0, '[', ']', '…', 12) AS snippet,
+               documents_fts.rank AS rank
+        FROM documents_fts
+        JOIN documents d ON d.document_id = documents_fts.rowid
+        WHERE documents_fts MATCH ?
+        ORDER BY documents_fts.rank
+        LIMIT ?
+        """
+        cursor = self.db.execute(sql_query, (match_query, limit))
+        return [
+            SearchResult(
+                source_id=row["document_id"],
+                intern_id=row["intern_id"],
+                snippet=row["snippet"],
+                rank=row["rank"],
+            )
+            for row in cursor.fetchall()
         ]
+
+    def create_batch(self, documents: List[Document]):
+        data = [self._write_values(doc) for doc in documents]
         try:
-            self.cursor.executemany(query, data)
-            self.conn.commit()
+            self.db.executemany(self._insert_sql, data)
+            self.db.commit()
         except Exception as e:
-            self.conn.rollback()
+            self.db.rollback()
             raise e
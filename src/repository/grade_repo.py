@@ -1,67 +1,40 @@
-from data.database import DatabaseConnector
 from core.models.grade import Grade
-from typing import Optional, List
-from sqlite3 import Connection, Cursor
+from repository.base_repo import BaseRepository, Column
+from typing import Dict, Iterable, List
 
+# Keeps `last_update` untouched when a grade is saved again with the same value.
+UPSERT_CLAUSE = """
+ON CONFLICT(intern_id, criteria_id) DO UPDATE SET
+    value = excluded.value,
+    last_update = strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')
+WHERE value IS NOT excluded.value
+"""
 
-class GradeRepository:
+
+class GradeRepository(BaseRepository[Grade]):
     """
     Repository responsible for persistence and retrieval of Grade entities.
 
     This class manages the specific grades assigned to interns based on
-    evaluation criteria. It maps directly to the `grades` table.
+    evaluation criteria. It maps directly to the `grades` table. Saving a
+    duplicate (intern_id, criteria_id) pair raises `sqlite3.IntegrityError`.
 
     Attributes:
         db (DatabaseConnector): The database connector instance.
-        conn (Connection): Active SQLite connection.
-        cursor (Cursor): Active SQLite cursor.
     """
 
-    def __init__(self, db: DatabaseConnector):
-        """
-        Initializes the repository with an active database connection.
-
-        Args:
-            db (DatabaseConnector): An initialized connector with an open connection.
-
-        Raises:
-            RuntimeError: If the connector does not hold a valid connection or cursor.
-        """
-        self.db = db
-        if db.conn is None or db.cursor is None:
-            raise RuntimeError(
-                "Repository initialized without a valid database connection."
-            )
-        self.conn: Connection = db.conn
-        self.cursor: Cursor = db.cursor
-
-    def get_all(self) -> List[Grade]:
-        """
-        Retrieves all grades stored in the database.
-
-        The results are ordered by the last update timestamp in descending order.
-
-        Returns:
-            List[Grade]: A list of all recorded grades.
-        """
-        sql_query = """
-        SELECT grade_id, intern_id, criteria_id, value, last_update
-        FROM grades
-        ORDER BY last_update DESC
-        """
-        self.cursor.execute(sql_query)
-        results = self.cursor.fetchall()
-
-        return [
-            Grade(
-                grade_id=row["grade_id"],
-                intern_id=row["intern_id"],
-                criteria_id=row["criteria_id"],
-                value=row["value"],
-                last_update=row["last_update"],
-            )
-            for row in results
-        ]
+    model = Grade
+    table = "grades"
+    id_field = "grade_id"
+    columns = (
+        Column("grade_id"),
+        Column("intern_id", updatable=False),
+        Column("criteria_id", updatable=False),
+        Column("value"),
+        Column("last_update", writable=False),
+    )
+    default_order = "last_update DESC"
+    touch_column = "last_update"
 
     def get_by_intern_id(self, intern_id: int) -> List[Grade]:
         """
@@ -74,139 +47,34 @@ class GradeRepository:
             List[Grade]: A list of Grade objects associated with the intern,
             ordered by criteria ID.
         """
-        sql_query = """
-        SELECT grade_id, intern_id, criteria_id, value, last_update
-        FROM grades
-        WHERE intern_id = ?
-        ORDER BY criteria_id ASC
-        """
-        self.cursor.execute(sql_query, (intern_id,))
-        results = self.cursor.fetchall()
-
-        return [
-            Grade(
-                grade_id=row["grade_id"],
-                intern_id=row["intern_id"],
-                criteria_id=row["criteria_id"],
-                value=row["value"],
-                last_update=row["last_update"],
-            )
-            for row in results
-        ]
-
-    def get_by_id(self, grade_id: int) -> Optional[Grade]:
-        """
-        Retrieves a grade by its unique database identifier.
-
-        Args:
-            grade_id (int): The unique identifier of the grade.
-
-        Returns:
-            Optional[Grade]: The Grade object if found, otherwise None.
-        """
-        sql_query = """
-        SELECT grade_id, intern_id, criteria_id, value, last_update
-        FROM grades
-        WHERE grade_id = ?
-        """
-        self.cursor.execute(sql_query, (grade_id,))
-        row = self.cursor.fetchone()
-
-        if row is None:
-            return None
-
-        return Grade(
-            grade_id=row["grade_id"],
-            intern_id=row["intern_id"],
-            criteria_id=row["criteria_id"],
-            value=row["value"],
-            last_update=row["last_update"],
+        return self._fetch_all(
+            "WHERE intern_id = ? ORDER BY criteria_id ASC", (intern_id,)
         )
 
-    def save(self, grade: Grade) -> int:
-        """
-        Persists a new Grade entity.
-
-        Args:
-            grade (Grade): The grade entity to save. Must not have an ID yet.
-
-        Returns:
-            int: The unique identifier (primary key) of the newly created record.
-
-        Raises:
-            ValueError: If the grade object already has an assigned ID.
-            RuntimeError: If the database fails to generate an ID.
-            sqlite3.IntegrityError: If a duplicate (intern_id, criteria_id) exists.
-        """
-        if grade.grade_id is not None:
-            raise ValueError(
-                "Cannot save a grade that already has an ID. Use update instead."
-            )
-
-        sql_query = """
-        INSERT INTO grades (intern_id, criteria_id, value)
-        VALUES (?, ?, ?)
-        """
-        data = (grade.intern_id, grade.criteria_id, grade.value)
-
-        self.cursor.execute(sql_query, data)
-        self.conn.commit()
-
-        if self.cursor.lastrowid is None:
-            raise RuntimeError("Database failed to generate an ID for the new grade.")
-
-        return self.cursor.lastrowid
-
-    def update(self, grade: Grade) -> bool:
+    def upsert_many(self, grades: Iterable[Grade]) -> None:
         """
-        Updates an existing Grade record.
+        Inserts or updates many grades in one statement and transaction.
 
-        Updates the value and automatically sets `last_update` to the current
-        local time via SQLite's strftime.
+        Grades are matched by (intern_id, criteria_id): a new pair is
+        inserted, an existing one gets the new value. Rows whose value does
+        not change are not written.
 
         Args:
-            grade (Grade): The grade entity with updated data. Must have an ID.
-
-        Returns:
-            bool: True if the update was successful, False otherwise.
-
-        Raises:
-            ValueError: If the grade object does not have an ID.
-        """
-        if grade.grade_id is None:
-            raise ValueError("Cannot update a grade without an ID.")
-
-        sql_query = """
-        UPDATE grades SET
-            value = ?,
-            last_update = strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')
-        WHERE grade_id = ?
+            grades (Iterable[Grade]): The grades; their IDs are ignored.
         """
+        data = [self._write_values(grade) for grade in grades]
+        with self.db.transaction():
+            self.db.executemany(f"{self._insert_sql} {UPSERT_CLAUSE}", data)
 
-        data = (grade.value, grade.grade_id)
-
-        self.cursor.execute(sql_query, data)
-        self.conn.commit()
-        return self.cursor.rowcount > 0
-
-    def delete(self, grade: Grade) -> bool:
+    def get_by_intern_ids(self, intern_ids: Iterable[int]) -> Dict[int, List[Grade]]:
         """
-        Permanently deletes a Grade record.
+        Retrieves the grades of many interns in a single query.
 
         Args:
-            grade (Grade): The grade entity to delete. Must have an ID.
+            intern_ids (Iterable[int]): The interns.
 
         Returns:
-            bool: True if the deletion was successful, False otherwise.
-
-        Raises:
-            ValueError: If the grade object does not have an ID.
+            Dict[int, List[Grade]]: The grades of each intern, ordered by
+            criteria ID (an empty list for interns without grades).
         """
-        if grade.grade_id is None:
-            raise ValueError("Cannot delete a grade without an ID.")
-
-        sql_query = "DELETE FROM grades WHERE grade_id = ?"
-
-        self.cursor.execute(sql_query, (grade.grade_id,))
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        return self._fetch_grouped("intern_id", intern_ids, "criteria_id ASC")
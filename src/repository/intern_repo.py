@@ -1,134 +1,241 @@
-from data.database import DatabaseConnector
 from core.models.intern import Intern
-from typing import Optional, List
-from sqlite3 import Connection, Cursor, Row
+from core.models.intern_filter import InternFilter
+from core.models.intern_row import InternRow
+from repository.base_repo import BaseRepository, Column
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from utils.text import normalize_name
+
+# Listing order of the interns; `intern_id` breaks ties between equal names
+# so that (name, intern_id) identifies a position in the list.
+LIST_ORDER = "name COLLATE NOCASE ASC, intern_id ASC"
+
+# `Intern.status`: 'Concluído' once a valid YYYY-MM-DD end date has passed.
+# Never NULL, so that NOT FINISHED selects the active interns.
+FINISHED = (
+    "(end_date IS NOT NULL AND date(end_date) IS end_date "
+    "AND end_date < datetime('now', 'localtime'))"
+)
+
+# Columns of `InternRow`. The venue is joined with USING, so the filters'
+# unqualified `venue_id` still names the intern's column.
+LIST_ROW_SQL = (
+    "SELECT intern_id, name, venue_name, registration_number, "
+    f"CASE WHEN {FINISHED} THEN 'Concluído' ELSE 'Ativo' END "
+    "FROM interns LEFT JOIN venues USING (venue_id)"
+)
+
+
+class InternRepository(BaseRepository[Intern]):
+    model = Intern
+    table = "interns"
+    id_field = "intern_id"
+    # Ordem igual ao schema (resources/migrations)
+    columns = (
+        Column("intern_id"),
+        Column("name"),
+        Column("registration_number"),
+        Column("term"),
+        Column("email"),
+        Column("start_date"),
+        Column("end_date"),
+        Column("working_days"),
+        Column("working_hours"),
+        Column("venue_id"),
+        Column("normalized_name", derive=lambda intern: normalize_name(intern.name)),
+    )
+    default_order = LIST_ORDER
+    touch_column = "last_update"
 
+    def get_by_registration_number(self, ra: str) -> Optional[Intern]:
+        return self._fetch_one("WHERE registration_number = ?", (ra,))
 
-class InternRepository:
-    def __init__(self, db: DatabaseConnector):
-        self.db = db
-        if db.conn is None or db.cursor is None:
-            raise RuntimeError(
-                "Repository initialized without a valid database connection."
-            )
-        self.conn: Connection = db.conn
-        self.cursor: Cursor = db.cursor
-
-        # GARANTIA: Força o modo de dicionário para não dependermos da ordem das colunas
-        self.conn.row_factory = Row
-
-    def _parse_row(self, row: Row) -> Intern:
-        """Converte linha do banco para Objeto Intern de forma segura."""
-        return Intern(
-            intern_id=row["intern_id"],
-            name=row["name"],
-            registration_number=row["registration_number"],
-            term=row["term"],
-            email=row["email"],
-            start_date=row["start_date"],
-            end_date=row["end_date"],
-            working_days=row["working_days"],
-            working_hours=row["working_hours"],
-            venue_id=row["venue_id"],
+    def get_by_name(self, name: str) -> Optional[Intern]:
+        """
+        Retrieves the intern with the given name, ignoring case and accents.
+
+        Args:
+            name (str): The full name, as typed or imported.
+
+        Returns:
+            Optional[Intern]: The oldest intern with that name, or None.
+        """
+        return self._fetch_one(
+            "WHERE normalized_name = ? ORDER BY intern_id LIMIT 1",
+            (normalize_name(name),),
         )
 
-    def get_all(self) -> List[Intern]:
-        # Selecionamos explicitamente para garantir que as colunas existam
-        sql_query = """
-        SELECT intern_id, name, registration_number, term, email, start_date, end_date, 
-        working_days, working_hours, venue_id FROM interns ORDER BY name COLLATE NOCASE ASC
+    def get_by_registration_numbers(self, ras: Iterable[str]) -> Dict[str, Intern]:
+        """
+        Retrieves many interns by RA in one query.
+
+        Args:
+            ras (Iterable[str]): The registration numbers.
+
+        Returns:
+            Dict[str, Intern]: The interns found, by RA; unknown RAs are absent.
         """
-        self.cursor.execute(sql_query)
-        results = self.cursor.fetchall()
-        return [self._parse_row(row) for row in results]
-
-    def get_by_id(self, intern_id: int) -> Optional[Intern]:
-        sql_query = """
-        SELECT intern_id, name, registration_number, term, email, start_date, end_date, 
-        working_days, working_hours, venue_id FROM interns WHERE intern_id = ?
+        return {
+            intern.registration_number: intern
+            for intern in self._fetch_in("registration_number", set(ras))
+        }
+
+    def get_by_normalized_names(self, names: Iterable[str]) -> Dict[str, Intern]:
         """
-        self.cursor.execute(sql_query, (intern_id,))
-        row = self.cursor.fetchone()
-        return self._parse_row(row) if row else None
+        Retrieves many interns by name in one query.
 
-    def get_by_registration_number(self, ra: str) -> Optional[Intern]:
-        sql_query = """
-        SELECT intern_id, name, registration_number, term, email, start_date, end_date, 
-        working_days, working_hours, venue_id FROM interns WHERE registration_number = ?
+        Args:
+            names (Iterable[str]): Names already reduced with `normalize_name`.
+
+        Returns:
+            Dict[str, Intern]: The oldest intern of each name found, by
+            normalized name; unknown names are absent.
         """
-        self.cursor.execute(sql_query, (ra,))
-        row = self.cursor.fetchone()
-        return self._parse_row(row) if row else None
-
-    def save(self, intern: Intern) -> int:
-        if intern.intern_id is not None:
-            raise ValueError("Cannot save an intern that already has an ID.")
-
-        # A ordem aqui deve bater EXATAMENTE com a ordem do 'data' abaixo
-        sql_query = """
-        INSERT INTO interns (
-            name, registration_number, term, email, 
-            start_date, end_date, working_days, working_hours, venue_id
-        ) 
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        found: Dict[str, Intern] = {}
+        for intern in self._fetch_in("normalized_name", set(names), "intern_id"):
+            found.setdefault(normalize_name(intern.name), intern)
+        return found
+
+    def get_page(
+        self,
+        filters: Optional[InternFilter] = None,
+        after: Optional[Tuple[str, int]] = None,
+        limit: int = 100,
+    ) -> List[Intern]:
         """
+        Retrieves one page of the intern list with keyset pagination.
 
-        data = (
-            intern.name,
-            intern.registration_number,
-            intern.term,
-            intern.email,
-            intern.start_date,
-            intern.end_date,
-            intern.working_days,  # Confirme que isso é Dias
-            intern.working_hours,  # Confirme que isso é Horas
-            intern.venue_id,
-        )
+        The next page starts right after the (name, intern_id) key of the last
+        row of the previous one, so every page costs an index seek plus
+        `limit` rows, however deep the page is (unlike OFFSET).
+
+        Args:
+            filters (Optional[InternFilter]): Restricts the list.
+            after (Optional[Tuple[str, int]]): (name, intern_id) of the last
+                row already shown; None for the first page.
+            limit (int): Maximum number of rows.
 
-        self.cursor.execute(sql_query, data)
-        self.conn.commit()
-        if self.cursor.lastrowid is None:
-            raise RuntimeError("Database failed to generate an ID.")
-        return self.cursor.lastrowid
-
-    def update(self, intern: Intern) -> bool:
-        if intern.intern_id is None:
-            raise ValueError("Cannot update an intern without an ID.")
-
-        sql_query = """
-        UPDATE interns SET
-            name = ?, registration_number = ?, term = ?, email = ?, 
-            start_date = ?, end_date = ?, working_days = ?, working_hours = ?, 
-            venue_id = ?, 
-            last_update = strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')
-        WHERE intern_id = ?
+        Returns:
+            List[Intern]: The page, ordered by name (case-insensitive), then ID.
         """
-        data = (
-            intern.name,
-            intern.registration_number,
-            intern.term,
-            intern.email,
-            intern.start_date,
-            intern.end_date,
-            intern.working_days,
-            intern.working_hours,
-            intern.venue_id,
-            intern.intern_id,
-        )
+        clause, params = self._page_clause(filters, after, limit)
+        return self._fetch_all(clause, params)
+
+    def list_rows(
+        self,
+        filters: Optional[InternFilter] = None,
+        after: Optional[Tuple[str, int]] = None,
+        limit: int = 100,
+    ) -> List[InternRow]:
+        """
+        Retrieves one page of the intern list as displayed rows.
+
+        Same pages as `get_page`, but each row carries only what the list
+        shows, with the venue name joined and the status computed by the
+        database, so no venue lookup or date parsing is left to the caller.
+
+        Args:
+            filters (Optional[InternFilter]): Restricts the list.
+            after (Optional[Tuple[str, int]]): (name, intern_id) of the last
+                row already shown; None for the first page.
+            limit (int): Maximum number of rows.
+
+        Returns:
+            List[InternRow]: The page, in the order of `get_page`.
+        """
+        clause, params = self._page_clause(filters, after, limit)
+        cursor = self.db.execute(f"{LIST_ROW_SQL} {clause}", params)
+        cursor.row_factory = _make_intern_row
+        return cursor.fetchall()
+
+    def get_row(self, intern_id: int) -> Optional[InternRow]:
+        """
+        Retrieves the displayed row of one intern (to refresh it in place).
+
+        Args:
+            intern_id (int): The intern.
+
+        Returns:
+            Optional[InternRow]: The row, or None if the intern does not exist.
+        """
+        cursor = self.db.execute(f"{LIST_ROW_SQL} WHERE intern_id = ?", (intern_id,))
+        cursor.row_factory = _make_intern_row
+        return cursor.fetchone()
+
+    def count(self, filters: Optional[InternFilter] = None) -> int:
+        """
+        Counts the interns matching the filters (the length of the list).
+
+        Args:
+            filters (Optional[InternFilter]): Restricts the count.
+
+        Returns:
+            int: The number of interns.
+        """
+        conditions, params = self._filter_conditions(filters)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        row = self.db.execute(f"SELECT COUNT(*) FROM interns{where}", params).fetchone()
+        return row[0]
+
+    def _page_clause(
+        self,
+        filters: Optional[InternFilter],
+        after: Optional[Tuple[str, int]],
+        limit: int,
+    ) -> Tuple[str, List[Any]]:
+        """Builds the WHERE/ORDER BY/LIMIT clause of a page of the list."""
+        conditions, params = self._filter_conditions(filters)
+        if after is not None:
+            # Equivalent to (name, intern_id) > (?, ?), spelled out so that
+            # the first term seeks into the name index instead of scanning.
+            name, intern_id = after
+            conditions.append(
+                "name COLLATE NOCASE >= ? "
+                "AND (name COLLATE NOCASE > ? OR intern_id > ?)"
+            )
+            params.extend((name, name, intern_id))
+
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        return f"{where}ORDER BY {LIST_ORDER} LIMIT ?", [*params, limit]
+
+    def _filter_conditions(
+        self, filters: Optional[InternFilter]
+    ) -> Tuple[List[str], List[Any]]:
+        conditions: List[str] = []
+        params: List[Any] = []
+        if filters is None:
+            return conditions, params
+
+        if filters.term is not None:
+            conditions.append("term = ?")
+            params.append(filters.term)
+        if filters.venue_id == 0:
+            conditions.append("venue_id IS NULL")
+        elif filters.venue_id is not None:
+            conditions.append("venue_id = ?")
+            params.append(filters.venue_id)
+        if filters.status == "Concluído":
+            conditions.append(FINISHED)
+        elif filters.status == "Ativo":
+            conditions.append(f"NOT {FINISHED}")
+        elif filters.status is not None:
+            raise ValueError(f"Unknown status filter: {filters.status!r}")
+        if filters.search and filters.search.strip():
+            # Qualified: the list rows join `venues`, which has the column too.
+            conditions.append(
+                "(interns.normalized_name LIKE ? ESCAPE '\\' "
+                "OR registration_number LIKE ? ESCAPE '\\' "
+                "OR venue_id IN (SELECT v.venue_id FROM venues v "
+                "WHERE v.normalized_name LIKE ? ESCAPE '\\'))"
+            )
+            name = f"%{_escape_like(normalize_name(filters.search))}%"
+            params.extend((name, f"%{_escape_like(filters.search.strip())}%", name))
+        return conditions, params
 
-        self.cursor.execute(sql_query, data)
-        self.conn.commit()
-        return self.cursor.rowcount > 0
 
-    def delete(self, intern: Intern) -> bool:
-        if intern.intern_id is None:
-            raise ValueError("Cannot delete an intern without an ID.")
+def _escape_like(text: str) -> str:
+    """Escapes the LIKE wildcards of user text (used with ESCAPE '\\')."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
-        # Deletar dependências (Documents, Meetings, Grades, Observations)
-        # O SQLite faria isso sozinho se ON DELETE CASCADE estiver ativo e PRAGMA foreign_keys = ON
-        # Mas por segurança, podemos deletar explicitamente ou confiar no CASCADE do seu create_db.sql
 
-        sql_query = "DELETE FROM interns WHERE intern_id = ?"
-        self.cursor.execute(sql_query, (intern.intern_id,))
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+def _make_intern_row(cursor, row: tuple) -> InternRow:
+    return InternRow._make(row)
@@ -0,0 +1,109 @@
+from data.database import DatabaseConnector
+from core.models.intern_summary import InternSummary
+from typing import Optional, List, Tuple
+
+
+class InternSummaryRepository:
+    """
+    Repository for the trigger-maintained `intern_summary` table.
+
+    The table is read-only from the application's point of view: every
+    counter is updated by triggers when documents, meetings, grades or
+    observations change.
+
+    Attributes:
+        db (DatabaseConnector): The database connector instance.
+    """
+
+    def __init__(self, db: DatabaseConnector):
+        """
+        Initializes the repository with an active database connection.
+
+        Args:
+            db (DatabaseConnector): An initialized connector with an open connection.
+
+        Raises:
+            RuntimeError: If the connector does not hold a valid connection.
+        """
+        self.db = db
+        if db.conn is None:
+            raise RuntimeError(
+                "Repository initialized without a valid database connection."
+            )
+
+    def get_by_intern_id(self, intern_id: int) -> Optional[InternSummary]:
+        """
+        Retrieves the summary of one intern.
+
+        Args:
+            intern_id (int): The intern.
+
+        Returns:
+            Optional[InternSummary]: The summary, or None if the intern does not exist.
+        """
+        sql_query = """
+        SELECT intern_id, total_docs, pending_docs, total_meetings,
+               present_meetings, grade_total, last_activity
+        FROM intern_summary
+        WHERE intern_id = ?
+        """
+        row = self.db.execute(sql_query, (intern_id,)).fetchone()
+        return self._parse_row(row) if row else None
+
+    def get_all(self) -> List[InternSummary]:
+        """
+        Retrieves the summaries of every intern.
+
+        Returns:
+            List[InternSummary]: The summaries, ordered by intern ID.
+        """
+        sql_query = """
+        SELECT intern_id, total_docs, pending_docs, total_meetings,
+               present_meetings, grade_total, last_activity
+        FROM intern_summary
+        ORDER BY intern_id
+        """
+        cursor = self.db.execute(sql_query)
+        return [self._parse_row(row) for row in cursor.fetchall()]
+
+    def count_pending_items(self) -> int:
+        """
+        Counts the pending document items over all interns.
+
+        An intern without any document counts as one pending item.
+
+        Returns:
+            int: The number of pending items.
+        """
+        sql_query = """
+        SELECT COALESCE(SUM(CASE WHEN total_docs = 0 THEN 1 ELSE pending_docs END), 0)
+        FROM intern_summary
+        """
+        return self.db.execute(sql_query).fetchone()[0]
+
+    def count_document_compliance(self) -> Tuple[int, int]:
+        """
+        Splits the interns by the state of their documents.
+
+        Returns:
+            Tuple[int, int]: (interns with every document approved, interns
+            with a pending document or no document at all).
+        """
+        sql_query = """
+        SELECT COALESCE(SUM(total_docs > 0 AND pending_docs = 0), 0) AS ok,
+               COALESCE(SUM(total_docs = 0 OR pending_docs > 0), 0) AS pending
+        FROM intern_summary
+        """
+        row = self.db.execute(sql_query).fetchone()
+        return row["ok"], row["pending"]
+
+    def _parse_row(self, row) -> InternSummary:
+        return InternSummary(
+            intern_id=row["intern_id"],
+            total_docs=row["total_docs"],
+            pending_docs=row["pending_docs"],
+            total_meetings=row["total_meetings"],
+            present_meetings=row["present_meetings"],
+            grade_total=row["grade_total"],
+            last_activity=row["last_activity"],
+        )
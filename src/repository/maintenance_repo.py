@@ -0,0 +1,199 @@
+from data.database import DatabaseConnector
+from core.models.maintenance_run import MaintenanceRun
+from typing import Optional, List
+
+
+class MaintenanceRepository:
+    """
+    Repository for database maintenance statements and their history.
+
+    Besides the `maintenance_runs` table, it wraps the PRAGMAs used to keep
+    query plans fresh and the file compact. Every maintenance statement runs
+    on the writer connection.
+
+    Attributes:
+        db (DatabaseConnector): The database connector instance.
+    """
+
+    def __init__(self, db: DatabaseConnector):
+        """
+        Initializes the repository with an active database connection.
+
+        Args:
+            db (DatabaseConnector): An initialized connector with an open connection.
+
+        Raises:
+            RuntimeError: If the connector does not hold a valid connection.
+        """
+        self.db = db
+        if db.conn is None:
+            raise RuntimeError(
+                "Repository initialized without a valid database connection."
+            )
+
+    # --- History ---
+
+    def save(self, run: MaintenanceRun) -> int:
+        """
+        Records the outcome of a maintenance task.
+
+        Args:
+            run (MaintenanceRun): The run to persist.
+
+        Returns:
+            int: The ID of the new record.
+        """
+        sql_query = """
+        INSERT INTO maintenance_runs (task, started_at, duration_ms, result)
+        VALUES (?, ?, ?, ?)
+        """
+        cursor = self.db.execute(
+            sql_query, (run.task, run.started_at, run.duration_ms, run.result)
+        )
+        self.db.commit()
+
+        if cursor.lastrowid is None:
+            raise RuntimeError("Database failed to generate an ID for the run.")
+        return cursor.lastrowid
+
+    def get_last_completed(self, task: str) -> Optional[MaintenanceRun]:
+        """
+        Returns the most recent successful run of a task.
+
+        Successful runs have a result of 'ok', optionally followed by details
+        ('ok: ...').
+
+        Args:
+            task (str): The task name.
+
+        Returns:
+            Optional[MaintenanceRun]: The run, or None if it never completed.
+        """
+        sql_query = """
+        SELECT run_id, task, started_at, duration_ms, result
+        FROM maintenance_runs
+        WHERE task = ? AND (result = 'ok' OR result LIKE 'ok:%')
+        ORDER BY started_at DESC
+        LIMIT 1
+        """
+        row = self.db.execute(sql_query, (task,)).fetchone()
+        return self._parse_row(row) if row else None
+
+    def get_recent(self, limit: int = 50) -> List[MaintenanceRun]:
+        """
+        Returns the latest maintenance runs, newest first.
+
+        Args:
+            limit (int): Maximum number of runs.
+
+        Returns:
+            List[MaintenanceRun]: The runs.
+        """
+        sql_query = """
+        SELECT run_id, task, started_at, duration_ms, result
+        FROM maintenance_runs
+        ORDER BY run_id DESC
+        LIMIT ?
+        """
+        cursor = self.db.execute(sql_query, (limit,))
+        return [self._parse_row(row) for row in cursor.fetchall()]
+
+    def prune(self, keep: int):
+        """
+        Deletes all but the `keep` most recent runs.
+
+        Args:
+            keep (int): Number of runs to keep.
+        """
+        sql_query = """
+        DELETE FROM maintenance_runs
+        WHERE run_id <= (
+            SELECT run_id FROM maintenance_runs ORDER BY run_id DESC LIMIT 1 OFFSET ?
+        )
+        """
+        self.db.execute(sql_query, (keep,))
+        self.db.commit()
+
+    # --- Maintenance statements ---
+
+    def optimize(self):
+        """Runs `PRAGMA optimize` (re-analyzes tables whose stats drifted)."""
+        self.db.execute("PRAGMA optimize").fetchall()
+
+    def analyze(self, analysis_limit: int):
+        """
+        Refreshes the planner statistics of every table and index.
+
+        Args:
+            analysis_limit (int): Rows sampled per index (`PRAGMA
+                analysis_limit`); 0 analyzes everything.
+        """
+        self.db.execute(f"PRAGMA analysis_limit = {int(analysis_limit)}").fetchall()
+        self.db.execute("ANALYZE")
+        self.db.commit()
+
+    def get_auto_vacuum(self) -> int:
+        """Returns the auto_vacuum mode (0 = NONE, 1 = FULL, 2 = INCREMENTAL)."""
+        return self.db.execute("PRAGMA auto_vacuum").fetchone()[0]
+
+    def get_freelist_count(self) -> int:
+        """Returns the number of unused pages in the database file."""
+        return self.db.execute("PRAGMA freelist_count").fetchone()[0]
+
+    def get_page_count(self) -> int:
+        """Returns the total number of pages in the database file."""
+        return self.db.execute("PRAGMA page_count").fetchone()[0]
+
+    def incremental_vacuum(self, pages: int):
+        """
+        Returns up to `pages` free pages to the file system.
+
+        Only effective when auto_vacuum is INCREMENTAL.
+
+        Args:
+            pages (int): Maximum number of pages to release.
+        """
+        self.db.executescript(f"PRAGMA incremental_vacuum({int(pages)});")
+
+    def vacuum(self):
+        """
+        Rebuilds the whole file.
+
+        Also switches a legacy database to the INCREMENTAL auto_vacuum mode
+        requested by the connector, after which `incremental_vacuum` works.
+        """
+        self.db.executescript("VACUUM;")
+
+    def get_tables(self) -> List[str]:
+        """Returns the names of every table, including internal ones, by name."""
+        sql_query = """
+        SELECT name FROM sqlite_master
+        WHERE type = 'table' AND sql NOT LIKE 'CREATE VIRTUAL%'
+        ORDER BY name
+        """
+        return [row["name"] for row in self.db.execute(sql_query).fetchall()]
+
+    def quick_check(self, table: Optional[str] = None) -> str:
+        """
+        Runs `PRAGMA quick_check`, on the whole file or on a single table.
+
+        Args:
+            table (Optional[str]): Limits the check to a table and its indexes.
+
+        Returns:
+            str: 'ok', or the problems found, one per line.
+        """
+        pragma = (
+            "PRAGMA quick_check" if table is None else f"PRAGMA quick_check({table})"
+        )
+        rows = self.db.execute(pragma).fetchall()
+        return "\n".join(str(row[0]) for row in rows)
+
+    def _parse_row(self, row) -> MaintenanceRun:
+        return MaintenanceRun(
+            run_id=row["run_id"],
+            task=row["task"],
+            started_at=row["started_at"],
+            duration_ms=row["duration_ms"],
+            result=row["result"],
+        )
@@ -1,77 +1,43 @@
-from data.database import DatabaseConnector
 from core.models.meeting import Meeting
-from typing import List
-from sqlite3 import Connection, Cursor
-
-
-class MeetingRepository:
-    def __init__(self, db: DatabaseConnector):
-        self.db = db
-        if db.conn is None or db.cursor is None:
-            raise RuntimeError(
-                "Repository initialized without a valid database connection."
-            )
-        self.conn: Connection = db.conn
-        self.cursor: Cursor = db.cursor
-
-    def get_all(self) -> List[Meeting]:
-        sql_query = "SELECT * FROM meetings ORDER BY meeting_date DESC"
-        self.cursor.execute(sql_query)
-        rows = self.cursor.fetchall()
-        return [self._parse_row(row) for row in rows]
+from repository.base_repo import BaseRepository, Column
+from typing import Dict, Iterable, List
+
+
+class MeetingRepository(BaseRepository[Meeting]):
+    model = Meeting
+    table = "meetings"
+    id_field = "meeting_id"
+    columns = (
+        Column("meeting_id"),
+        Column("intern_id", updatable=False),
+        Column("meeting_date"),
+        # Guardado como 0/1
+        Column("is_intern_present", convert=bool),
+    )
+    default_order = "meeting_date DESC"
 
     def get_by_intern_id(self, intern_id: int) -> List[Meeting]:
         """
         Busca todas as reuniões de um estagiário específico.
         """
-        sql_query = (
-            "SELECT * FROM meetings WHERE intern_id = ? ORDER BY meeting_date DESC"
+        return self._fetch_all(
+            "WHERE intern_id = ? ORDER BY meeting_date DESC", (intern_id,)
         )
-        self.cursor.execute(sql_query, (intern_id,))
-        rows = self.cursor.fetchall()
-        return [self._parse_row(row) for row in rows]
 
-    # Alias para compatibilidade
-    get_by_intern = get_by_intern_id
-
-    def save(self, meeting: Meeting) -> int:
-        if meeting.meeting_id is not None:
-            raise ValueError(
-                "Cannot save a meeting that already has an ID. Use update instead."
-            )
-
-        sql_query = """
-        INSERT INTO meetings (intern_id, meeting_date, is_intern_present)
-        VALUES (?, ?, ?)
+    def get_by_intern_ids(self, intern_ids: Iterable[int]) -> Dict[int, List[Meeting]]:
         """
-        # Converte True/False para 1/0
-        present_int = 1 if meeting.is_intern_present else 0
-
-        data = (meeting.intern_id, meeting.meeting_date, present_int)
-
-        self.cursor.execute(sql_query, data)
-        self.conn.commit()
-
-        if self.cursor.lastrowid is None:
-            raise RuntimeError("Database failed to generate an ID for the new meeting.")
-        return self.cursor.lastrowid
+        Busca as reuniões de vários estagiários numa única consulta.
+        """
+        return self._fetch_grouped("intern_id", intern_ids, "meeting_date DESC")
 
-    def delete(self, meeting: Meeting) -> bool:
+    def count_between(self, start: str, end: str) -> int:
         """
-        Deleta uma reunião passando o objeto Meeting.
+        Conta as reuniões com data em [start, end) (datas ISO, YYYY-MM-DD).
         """
-        if not meeting.meeting_id:
-            raise ValueError("Cannot delete a meeting without a valid ID")
-
-        sql_query = "DELETE FROM meetings WHERE meeting_id = ?"
-        self.cursor.execute(sql_query, (meeting.meeting_id,))
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        sql_query = """
+        SELECT COUNT(*) FROM meetings WHERE meeting_date >= ? AND meeting_date < ?
+        """
+        return self.db.execute(sql_query, (start, end)).fetchone()[0]
 
-    def _parse_row(self, row) -> Meeting:
-        return Meeting(
-            meeting_id=row[0],
-            intern_id=row[1],
-            meeting_date=row[2],
-            is_intern_present=bool(row[3]),
-        )
+    # Alias para compatibilidade
+    get_by_intern = get_by_intern_id
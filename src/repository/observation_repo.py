@@ -1,220 +1,86 @@
-from data.database import DatabaseConnector
 from core.models.observation import Observation
-from typing import Optional, List
-from sqlite3 import Connection, Cursor
+from core.models.search_result import SearchResult
+from repository.base_repo import BaseRepository, Column
+from typing import Dict, Iterable, List
 
 
-class ObservationRepository:
+class ObservationRepository(BaseRepository[Observation]):
     """
     Repository responsible for persistence and retrieval of Observation entities.
 
     This class provides an interface to the `observations` table, allowing
-    the management of free-text notes associated with interns.
+    the management of free-text notes associated with interns. Listings are
+    ordered by the last update timestamp, most recent notes first; `update`
+    refreshes `last_update`.
 
     Attributes:
         db (DatabaseConnector): The database connector instance.
-        conn (Connection): Active SQLite connection.
-        cursor (Cursor): Active SQLite cursor.
     """
 
-    def __init__(self, db: DatabaseConnector):
-        """
-        Initializes the repository with an active database connection.
-
-        Args:
-            db (DatabaseConnector): An initialized connector with an open connection.
-
-        Raises:
-            RuntimeError: If the connector does not hold a valid connection or cursor.
-        """
-        self.db = db
-        if db.conn is None or db.cursor is None:
-            raise RuntimeError(
-                "Repository initialized without a valid database connection."
-            )
-        self.conn: Connection = db.conn
-        self.cursor: Cursor = db.cursor
-
-    def get_all(self) -> List[Observation]:
-        """
-        Retrieves all observations stored in the database.
-
-        The results are ordered by the last update timestamp in descending order,
-        showing the most recent notes first.
-
-        Returns:
-            List[Observation]: A list of all recorded observations.
-        """
-        sql_query = """
-        SELECT observation_id, intern_id, observation, last_update
-        FROM observations
-        ORDER BY last_update DESC
-        """
-
-        self.cursor.execute(sql_query)
-        results = self.cursor.fetchall()
-
-        observations: List[Observation] = []
-
-        for row in results:
-            observations.append(
-                Observation(
-                    observation_id=row["observation_id"],
-                    intern_id=row["intern_id"],
-                    observation=row["observation"],
-                    last_update=row["last_update"],
-                )
-            )
-
-        return observations
-
-    def get_by_id(self, observation_id: int) -> Optional[Observation]:
-        """
-        Retrieves a observation by its unique database identifier.
-
-        Args:
-            observation_id (int): The unique identifier of the observation.
-
-        Returns:
-            Optional[Observation]: The Observation object if found, otherwise None.
-        """
-        sql_query = """
-        SELECT observation_id, intern_id, observation, last_update
-        FROM observations 
-        WHERE observation_id = ?
-        """
-
-        self.cursor.execute(sql_query, (observation_id,))
-        row = self.cursor.fetchone()
-
-        if row is None:
-            return None
-
-        return Observation(
-            observation_id=row["observation_id"],
-            intern_id=row["intern_id"],
-            observation=row["observation"],
-            last_update=row["last_update"],
-        )
+    model = Observation
+    table = "observations"
+    id_field = "observation_id"
+    columns = (
+        Column("observation_id"),
+        Column("intern_id", updatable=False),
+        Column("observation"),
+        Column("last_update", writable=False),
+    )
+    default_order = "last_update DESC"
+    touch_column = "last_update"
 
     def get_by_intern_id(self, intern_id: int) -> List[Observation]:
         """
         Retrieves all observations for a specific intern.
         """
-        sql_query = """
-            SELECT observation_id, intern_id, observation, last_update
-            FROM observations
-            WHERE intern_id = ?
-            ORDER BY last_update DESC
-            """
-        self.cursor.execute(sql_query, (intern_id,))
-        results = self.cursor.fetchall()
-
-        return [
-            Observation(
-                observation_id=row["observation_id"],
-                intern_id=row["intern_id"],
-                observation=row["observation"],
-                last_update=row["last_update"],
-            )
-            for row in results
-        ]
-
-    def save(self, observation: Observation) -> int:
-        """
-        Persists a new Observation entity in the database.
-
-        Args:
-            observation (Observation): The entity to save. Must not have an ID yet.
-
-        Returns:
-            int: The unique identifier (primary key) of the newly created record.
-
-        Raises:
-            ValueError: If the observation object already has an assigned ID.
-            RuntimeError: If the database fails to generate an ID.
-        """
-        if observation.observation_id is not None:
-            raise ValueError(
-                "Cannot save an observation that already has an ID. Use update instead."
-            )
-
-        sql_query = """
-        INSERT INTO observations (observation, intern_id)
-        VALUES (?, ?)
-        """
-
-        data = (
-            observation.observation,
-            observation.intern_id,
+        return self._fetch_all(
+            "WHERE intern_id = ? ORDER BY last_update DESC", (intern_id,)
         )
 
-        self.cursor.execute(sql_query, data)
-        self.conn.commit()
-
-        if self.cursor.lastrowid is None:
-            raise RuntimeError(
-                "Database failed to generate an ID for the new observation."
-            )
-
-        return self.cursor.lastrowid
-
-    def update(self, observation: Observation) -> bool:
+    def get_by_intern_ids(
+        self, intern_ids: Iterable[int]
+    ) -> Dict[int, List[Observation]]:
         """
-        Updates an existing Observation record in the database.
-
-        Updates the text content and automatically refreshes the `last_update`
-        timestamp using SQLite's local time function.
+        Retrieves the observations of many interns in a single query.
 
         Args:
-            observation (Observation): The entity with updated data. Must have an ID.
+            intern_ids (Iterable[int]): The interns.
 
         Returns:
-            bool: True if the update was successful, False otherwise.
-
-        Raises:
-            ValueError: If the observation object does not have an ID.
+            Dict[int, List[Observation]]: The observations of each intern,
+            most recent first (an empty list for interns without notes).
         """
-        if observation.observation_id is None:
-            raise ValueError("Cannot update an observation without an ID.")
-
-        sql_query = """
-        UPDATE observations SET
-            observation = ?,
-            last_update = strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')
-        WHERE observation_id = ?
-        """
-
-        data = (
-            observation.observation,
-            observation.observation_id,
-        )
-
-        self.cursor.execute(sql_query, data)
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        return self._fetch_grouped("intern_id", intern_ids, "last_update DESC")
 
-    def delete(self, observation: Observation) -> bool:
+    def search(self, match_query: str, limit: int = 50) -> List[SearchResult]:
         """
-        Deletes a Observation record from the database.
+        Full-text search over the observations, best matches first.
 
         Args:
-            observation (Observation): The entity to delete. Must have an ID.
+            match_query (str): An FTS5 MATCH expression (see
+                `utils.text.to_fts_query`).
+            limit (int): Maximum number of results.
 
         Returns:
-            bool: True if the deletion was successful, False otherwise.
-
-        Raises:
-            ValueError: If the observation object does not have an ID.
+            List[SearchResult]: The matching observations with a snippet.
         """
-        if observation.observation_id is None:
-            raise ValueError("Cannot delete an observation without an ID.")
-
         sql_query = """
-        DELETE FROM observations
-        WHERE observation_id = ?
-        """
-
-        self.cursor.execute(sql_query, (observation.observation_id,))
-        self.conn.commit()
-        return self.cursor.rowcount > 0
+        SELECT o.observation_id, o.intern_id,
+               snippet(observations_fts, 0, '[', ']', '…', 12) AS snippet,
+               observations_fts.rank AS rank
+        FROM observations_fts
+        JOIN observations o ON o.observation_id = observations_fts.rowid
+        WHERE observations_fts MATCH ?
+        ORDER BY observations_fts.rank
+        LIMIT ?
+        """
+        cursor = self.db.execute(sql_query, (match_query, limit))
+        return [
+            SearchResult(
+                source_id=row["observation_id"],
+                intern_id=row["intern_id"],
+                snippet=row["snippet"],
+                rank=row["rank"],
+            )
+            for row in cursor.fetchall()
+        ]
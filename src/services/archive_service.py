@@ -0,0 +1,142 @@
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional
+from urllib.parse import quote, unquote
+
+from config import ARCHIVE_DIR
+from core.models.intern import Intern
+from data.database import DatabaseConnector
+from repository.archive_repo import ArchiveRepository
+
+ARCHIVE_PREFIX = "archive-"
+ARCHIVE_SUFFIX = ".db"
+ARCHIVE_ALIAS = "archive"
+
+
+class ArchiveService:
+    """
+    Service that keeps closed terms out of the main database.
+
+    Interns of a term that has ended are moved, with their documents,
+    meetings, grades and observations, into one archive file per term in
+    `ARCHIVE_DIR`. Historical queries attach the archive only for their
+    duration (`attached()`), so everyday queries never scan old terms.
+
+    Attributes:
+        repo (ArchiveRepository): Statements over the main and archive files.
+        archive_dir (Path): Directory holding the archive files.
+    """
+
+    def __init__(self, repo: ArchiveRepository, archive_dir: Optional[Path] = None):
+        """
+        Initializes the service.
+
+        Args:
+            repo (ArchiveRepository): Statements over the main and archive files.
+            archive_dir (Optional[Path]): Defaults to `config.ARCHIVE_DIR`.
+        """
+        self.repo = repo
+        self.archive_dir = archive_dir or ARCHIVE_DIR
+
+    def get_archivable_terms(self) -> List[str]:
+        """Returns the terms whose interns have all finished, oldest first."""
+        return self.repo.get_closed_terms()
+
+    def get_archived_terms(self) -> List[str]:
+        """Returns the terms that have an archive file, oldest first."""
+        if not self.archive_dir.is_dir():
+            return []
+        files = self.archive_dir.glob(f"{ARCHIVE_PREFIX}*{ARCHIVE_SUFFIX}")
+        return sorted(
+            unquote(path.name[len(ARCHIVE_PREFIX) : -len(ARCHIVE_SUFFIX)])
+            for path in files
+        )
+
+    def archive_term(self, term: str) -> int:
+        """
+        Moves the ended interns of a term into the term's archive file.
+
+        SQLite does not commit attached WAL databases atomically, so this is
+        done in two transactions: the copy is committed to the archive first,
+        then the interns found in the archive are deleted from the main
+        database. If anything fails in between, no intern is lost and
+        archiving the term again completes the move. Archiving a term again
+        later appends to the same file.
+
+        Args:
+            term (str): The term to archive.
+
+        Returns:
+            int: Number of interns archived.
+
+        Raises:
+            ValueError: If the term has interns still in their internship.
+            sqlite3.Error: If the archive cannot be written or the interns
+                cannot be deleted; the interns stay in the main database.
+        """
+        if term not in self.repo.get_closed_terms():
+            raise ValueError(f"O período {term} ainda tem estágios em andamento.")
+
+        path = self._archive_path(term)
+        # Creates (or upgrades) the archive with the current schema.
+        DatabaseConnector(db_path=path).close()
+
+        db = self.repo.db
+        with self.attached(term):
+            with db.transaction():
+                self.repo.copy_term(ARCHIVE_ALIAS, term)
+            with db.transaction():
+                moved = self.repo.delete_archived(ARCHIVE_ALIAS, term)
+        # The interns left the main database without going through the services.
+        db.notify_reset()
+        return moved
+
+    def get_archived_interns(self, term: str) -> List[Intern]:
+        """
+        Retrieves the interns of an archived term.
+
+        Args:
+            term (str): The archived term.
+
+        Returns:
+            List[Intern]: The interns, ordered by name.
+
+        Raises:
+            FileNotFoundError: If the term has no archive.
+        """
+        with self.attached(term) as alias:
+            return self.repo.get_interns(alias)
+
+    @contextmanager
+    def attached(self, term: str) -> Iterator[str]:
+        """
+        Attaches a term's archive to the connection of the calling thread.
+
+        Inside the block, the archive tables can be queried as
+        `<alias>.interns`, `<alias>.documents`, etc. Works on the writer and,
+        inside `reader()`, on a worker's leased connection.
+
+        Args:
+            term (str): The archived term.
+
+        Yields:
+            str: The schema alias of the archive.
+
+        Raises:
+            FileNotFoundError: If the term has no archive.
+        """
+        path = self._archive_path(term)
+        if not path.is_file():
+            raise FileNotFoundError(f"Arquivo do período {term} não encontrado.")
+
+        self.repo.attach(path, ARCHIVE_ALIAS)
+        try:
+            yield ARCHIVE_ALIAS
+        finally:
+            self.repo.detach(ARCHIVE_ALIAS)
+
+    def _archive_path(self, term: str) -> Path:
+        """Returns `archive-<term>.db`, with the term escaped for the file system."""
+        return (
+            self.archive_dir / f"{ARCHIVE_PREFIX}{quote(term, safe='')}{ARCHIVE_SUFFIX}"
+        )
@@ -0,0 +1,154 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, ContextManager, List, Optional, Set
+
+from config import BACKUP_DIR, BACKUP_KEEP, BACKUP_PAGES_PER_STEP
+from data.database import DatabaseConnector
+
+SNAPSHOT_PREFIX = "interns-"
+SNAPSHOT_SUFFIX = ".db"
+PARTIAL_SUFFIX = ".partial"
+
+
+class BackupService:
+    """
+    Service for online snapshots of the database.
+
+    Snapshots are taken with the SQLite backup API a bounded number of pages
+    at a time, so `create_snapshot()` can run in a worker thread (see
+    `ui.workers.ReadWorker`) while the application keeps reading and writing.
+    They are stored as timestamped files in `BACKUP_DIR` and rotated.
+
+    Attributes:
+        db (DatabaseConnector): The application's database connector.
+        backup_dir (Path): Directory holding the snapshots.
+        keep (int): Number of snapshots kept after rotation.
+        pages_per_step (int): Pages copied per backup step.
+    """
+
+    def __init__(
+        self,
+        db: DatabaseConnector,
+        backup_dir: Optional[Path] = None,
+        keep: Optional[int] = None,
+        pages_per_step: Optional[int] = None,
+    ):
+        """
+        Initializes the service.
+
+        Args:
+            db (DatabaseConnector): The application's database connector.
+            backup_dir (Optional[Path]): Defaults to `config.BACKUP_DIR`.
+            keep (Optional[int]): Defaults to `config.BACKUP_KEEP`.
+            pages_per_step (Optional[int]): Defaults to
+                `config.BACKUP_PAGES_PER_STEP`.
+        """
+        self.db = db
+        self.backup_dir = backup_dir or BACKUP_DIR
+        self.keep = max(1, keep or BACKUP_KEEP)
+        self.pages_per_step = pages_per_step or BACKUP_PAGES_PER_STEP
+
+    def reader(self) -> ContextManager:
+        """Leases a read-only connection; see `DatabaseConnector.reader()`."""
+        return self.db.reader()
+
+    def create_snapshot(
+        self,
+        on_progress: Optional[Callable[[int, int], object]] = None,
+        keep_also: Optional[Path] = None,
+    ) -> Path:
+        """
+        Copies the database into a new timestamped snapshot.
+
+        The copy is written to a temporary file and renamed when complete, so
+        an interrupted backup never looks like a valid snapshot. Older
+        snapshots beyond `keep` are deleted afterwards.
+
+        Args:
+            on_progress (Optional[Callable[[int, int], object]]): Called after
+                each step with `(copied_pages, total_pages)`.
+            keep_also (Optional[Path]): An existing snapshot that must survive
+                the rotation (e.g. the one about to be restored).
+
+        Returns:
+            Path: The new snapshot file.
+
+        Raises:
+            RuntimeError: If the database connection is not active.
+            sqlite3.Error: If the copy fails.
+        """
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        target = self._new_snapshot_path()
+        partial = target.with_name(target.name + PARTIAL_SUFFIX)
+
+        def progress(_status, remaining, total):
+            if on_progress:
+                on_progress(total - remaining, total)
+
+        try:
+            self.db.backup_to(partial, pages=self.pages_per_step, progress=progress)
+            partial.replace(target)
+        finally:
+            partial.unlink(missing_ok=True)
+
+        self._rotate(protect={target, keep_also})
+        return target
+
+    def list_snapshots(self) -> List[Path]:
+        """
+        Lists the available snapshots.
+
+        Returns:
+            List[Path]: Snapshot files, newest first.
+        """
+        if not self.backup_dir.is_dir():
+            return []
+
+        snapshots = self.backup_dir.glob(f"{SNAPSHOT_PREFIX}*{SNAPSHOT_SUFFIX}")
+        return sorted(snapshots, key=lambda p: p.stem, reverse=True)
+
+    def restore_snapshot(self, snapshot: Path):
+        """
+        Replaces the database content with a snapshot.
+
+        The copy is a single fast step on the writer, so this must be called
+        from the GUI thread. Callers should first take a safety snapshot in a
+        worker with `create_snapshot(keep_also=snapshot)`, so the restore can
+        be undone.
+
+        Args:
+            snapshot (Path): The snapshot to restore.
+
+        Raises:
+            FileNotFoundError: If the snapshot does not exist.
+            ValueError: If the snapshot is damaged.
+            RuntimeError: If the snapshot is newer than the application.
+        """
+        if not snapshot.is_file():
+            raise FileNotFoundError(f"Backup não encontrado: {snapshot}")
+
+        self.db.restore_from(snapshot)
+
+    def _new_snapshot_path(self) -> Path:
+        """Returns an unused `interns-YYYYmmdd-HHMMSS-ffffff[-N].db` path."""
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        path = self.backup_dir / f"{SNAPSHOT_PREFIX}{stamp}{SNAPSHOT_SUFFIX}"
+        counter = 1
+        while path.exists():
+            path = self.backup_dir / (
+                f"{SNAPSHOT_PREFIX}{stamp}-{counter:02d}{SNAPSHOT_SUFFIX}"
+            )
+            counter += 1
+        return path
+
+    def _rotate(self, protect: Set[Optional[Path]]):
+        """
+        Deletes the oldest snapshots beyond `keep`.
+
+        Args:
+            protect (Set[Optional[Path]]): Snapshots that must survive.
+        """
+        protected = {p.resolve() for p in protect if p is not None}
+        for old in self.list_snapshots()[self.keep :]:
+            if old.resolve() not in protected:
+                old.unlink(missing_ok=True)
@@ -1,4 +1,6 @@
-from typing import Generic, TypeVar, Optional, Dict, Any
+from contextlib import contextmanager
+from typing import ContextManager, Generic, Iterator, TypeVar, Optional, Dict, Any
+from data.session import Session
 from utils.validations import validate_required_fields
 
 T = TypeVar("T")  # Domain model (Intern, Venue, etc)
@@ -11,21 +13,28 @@ class BaseService(Generic[T]):
     Concrete services should extend this class and implement
     entity-specific validation rules.
 
+    With a `Session`, `get_by_id` returns the session's instance of the
+    entity, and the writes of the service keep it up to date (see
+    `_tracking`). Without one, every read goes to the repository.
+
     Attributes:
         repo (Any): Repository instance for the specific entity.
+        session (Optional[Session]): Identity map shared by the services.
         REQUIRED_FIELDS (Dict[str, str]): Dictionary mapping field names to human-readable names.
     """
 
     REQUIRED_FIELDS: Dict[str, str] = {}
 
-    def __init__(self, repo: Any):
+    def __init__(self, repo: Any, session: Optional[Session] = None):
         """
         Initializes the service with a repository.
 
         Args:
             repo (Any): A repository instance that follows the standard interface.
+            session (Optional[Session]): Identity map shared by the services.
         """
         self.repo = repo
+        self.session = session
 
     def _validate_required_fields(self, data: T) -> None:
         """
@@ -57,6 +66,30 @@ class BaseService(Generic[T]):
                 f"{entity_name.capitalize()} has no ID and cannot be updated or deleted."
             )
 
+    def transaction(self) -> ContextManager[None]:
+        """
+        Opens a unit of work on the repository's database connection.
+
+        All writes issued inside the block, through this or any other service
+        sharing the connection, are committed once at the end.
+
+        Returns:
+            ContextManager[None]: The `DatabaseConnector.transaction()` block.
+        """
+        return self.repo.db.transaction()
+
+    def reader(self) -> ContextManager[Any]:
+        """
+        Leases a read-only connection for the calling (worker) thread.
+
+        Every read issued by services inside the block runs on the leased
+        connection, which allows read-heavy work to run off the GUI thread.
+
+        Returns:
+            ContextManager[Any]: The `DatabaseConnector.reader()` block.
+        """
+        return self.repo.db.reader()
+
     def get_all(self) -> Any:
         """
         Retrieves all records for the entity from the repository.
@@ -66,17 +99,62 @@ class BaseService(Generic[T]):
         """
         return self.repo.get_all()
 
+    def iter_all(self, batch_size: int = 500) -> Iterator[T]:
+        """
+        Streams all records for the entity, a batch at a time.
+
+        Use instead of `get_all` when the records are processed one by one
+        (export, reports), so memory use does not depend on the table size.
+
+        Args:
+            batch_size (int): Records fetched from the database per round trip.
+
+        Returns:
+            Iterator[T]: The entity instances, in the order of `get_all`.
+        """
+        return self.repo.iter_all(batch_size)
+
     def get_by_id(self, entity_id: int) -> Optional[T]:
         """
         Retrieves a single record by its unique ID.
 
+        With a session, repeated calls return the same instance without
+        reading the database again.
+
         Args:
             entity_id (int): The unique identifier.
 
         Returns:
             Optional[T]: The entity instance if found, or None.
         """
-        return self.repo.get_by_id(entity_id)
+        if self.session is None:
+            return self.repo.get_by_id(entity_id)
+        return self.session.get(self.repo.model, entity_id, self.repo.get_by_id)
+
+    @contextmanager
+    def _tracking(self, data: T) -> Iterator[None]:
+        """
+        Keeps the session in step with a write of `data` (insert or update).
+
+        On success an entity with an ID becomes the session's instance for
+        that ID. On failure the ID is evicted: the caller may have changed
+        the cached instance before the write was rejected.
+        """
+        if self.session is None:
+            yield
+            return
+
+        model = self.repo.model
+        entity_id = getattr(data, self.repo.id_field)
+        try:
+            yield
+        except BaseException:
+            self.session.evict(model, entity_id)
+            raise
+        if entity_id is None:
+            self.session.evict(model)
+        else:
+            self.session.put(model, entity_id, data)
 
     def delete(self, data: T, entity_name: str) -> bool:
         """
@@ -90,4 +168,8 @@ class BaseService(Generic[T]):
             bool: True if deletion was successful, False otherwise.
         """
         self._ensure_has_id(data, entity_name)
-        return self.repo.delete(data)
+        try:
+            return self.repo.delete(data)
+        finally:
+            if self.session is not None:
+                self.session.evict(self.repo.model, getattr(data, self.repo.id_field))
@@ -0,0 +1,79 @@
+from typing import Dict, List, Optional, Tuple
+
+from config import CHANGE_LOG_KEEP
+from core.models.data_change import DataChange
+from repository.change_log_repo import ChangeLogRepository
+
+
+class ChangeFeedService:
+    """
+    Service that tells views what changed since they were last refreshed.
+
+    A view remembers the sequence number returned by `get_latest_sequence()`
+    when it loads, and later asks for `get_changes_since()` that number to
+    update only the affected rows instead of reloading everything.
+
+    Attributes:
+        repo (ChangeLogRepository): Access to the `change_log` table.
+    """
+
+    def __init__(self, repo: ChangeLogRepository):
+        """
+        Initializes the service.
+
+        Args:
+            repo (ChangeLogRepository): Access to the `change_log` table.
+        """
+        self.repo = repo
+
+    def get_latest_sequence(self) -> int:
+        """Returns the sequence number of the most recent change (0 if none)."""
+        return self.repo.get_latest_sequence()
+
+    def get_changes_since(self, seq: int) -> Optional[List[DataChange]]:
+        """
+        Returns the rows changed after a sequence number.
+
+        Changes to the same row are merged into one entry carrying the latest
+        sequence number: an insert followed by updates is reported as an
+        insert, and a row both inserted and deleted in the window is omitted.
+
+        Args:
+            seq (int): Sequence number the caller last saw.
+
+        Returns:
+            Optional[List[DataChange]]: The changes, ordered by sequence
+            number, or None if the history no longer covers `seq` (pruned, or
+            the database was restored from a snapshot). The caller must then
+            reload everything.
+        """
+        latest = self.repo.get_latest_sequence()
+        if seq > latest:
+            return None
+        if seq == latest:
+            return []
+
+        oldest = self.repo.get_oldest_sequence()
+        if oldest is None or oldest > seq + 1:
+            return None
+
+        merged: Dict[Tuple[str, int], DataChange] = {}
+        for change in self.repo.get_changes_since(seq):
+            key = (change.table_name, change.row_id)
+            previous = merged.pop(key, None)
+            if previous is not None and previous.operation == "I":
+                if change.operation == "D":
+                    continue
+                change.operation = "I"
+            merged[key] = change
+        return list(merged.values())
+
+    def prune(self, keep: Optional[int] = None) -> None:
+        """
+        Trims the change history.
+
+        Args:
+            keep (Optional[int]): Number of changes kept. Defaults to
+                `config.CHANGE_LOG_KEEP`.
+        """
+        self.repo.prune(CHANGE_LOG_KEEP if keep is None else keep)
@@ -0,0 +1,64 @@
+from typing import List, Optional
+from pathlib import Path
+
+from data.database import DatabaseConnector
+from data.tracing import StatementStats
+
+
+class DiagnosticsService:
+    """
+    Service exposing database diagnostics to the UI.
+
+    Wraps the opt-in statement tracing of the `DatabaseConnector` so the
+    presentation layer never touches the connector directly.
+
+    Attributes:
+        db (DatabaseConnector): The application's database connector.
+    """
+
+    def __init__(self, db: DatabaseConnector):
+        """
+        Initializes the service.
+
+        Args:
+            db (DatabaseConnector): The application's database connector.
+        """
+        self.db = db
+
+    def is_tracing_enabled(self) -> bool:
+        """Returns True while statement statistics are being collected."""
+        return self.db.tracer is not None
+
+    def set_tracing_enabled(self, enabled: bool) -> None:
+        """
+        Turns statement tracing (and the slow-query log) on or off.
+
+        Args:
+            enabled (bool): Desired state. Turning it off discards the statistics.
+        """
+        if enabled:
+            self.db.enable_tracing()
+        else:
+            self.db.disable_tracing()
+
+    def get_query_stats(self) -> List[StatementStats]:
+        """
+        Returns the statistics collected since tracing was enabled.
+
+        Returns:
+            List[StatementStats]: Per-statement metrics, slowest total first.
+            Empty when tracing is disabled.
+        """
+        if self.db.tracer is None:
+            return []
+        return self.db.tracer.snapshot()
+
+    def reset_query_stats(self) -> None:
+        """Clears the collected statistics without disabling tracing."""
+        if self.db.tracer:
+            self.db.tracer.reset()
+
+    @property
+    def slow_query_log_path(self) -> Optional[Path]:
+        """Location of the slow-query log, if tracing is enabled."""
+        return self.db.tracer.log_path if self.db.tracer else None
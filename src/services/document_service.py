@@ -2,6 +2,7 @@ from services.base_service import BaseService
 from core.models.document import Document
 from repository.document_repo import DocumentRepository
 from core.constants import DEFAULT_DOCUMENTS_LIST
+from utils.text import to_fts_query
 
 REQUIRED_FIELDS = {
     "document_name": "Nome do Documento",
@@ -32,6 +33,10 @@ class DocumentService(BaseService[Document]):
         """Retorna todos os documentos de um estagiário específico."""
         return self.repo.get_by_intern_id(intern_id)
 
+    def get_documents_by_interns(self, intern_ids):
+        """Retorna os documentos de vários estagiários, agrupados por estagiário."""
+        return self.repo.get_by_intern_ids(intern_ids)
+
     # -------------------------
 
     def get_document_by_id(self, doc_id: int):
@@ -56,5 +61,52 @@ class DocumentService(BaseService[Document]):
 
         self.repo.create_batch(docs_to_create)
 
+    def create_initial_documents_for_interns(self, intern_ids):
+        """
+        Gera o kit padrão de documentos para os estagiários que não têm nenhum.
+        """
+        docs_by_intern = self.repo.get_by_intern_ids(intern_ids)
+        docs_to_create = [
+            Document(intern_id=intern_id, document_name=name, status="Pendente")
+            for intern_id, docs in docs_by_intern.items()
+            if not docs
+            for name in DEFAULT_DOCUMENTS_LIST
+        ]
+        if docs_to_create:
+            self.repo.create_batch(docs_to_create)
+
     def count_total_pending(self) -> int:
         return self.repo.count_pending()
+
+    def get_status_histogram(self):
+        """Retorna {nome do documento: {status: quantidade}}."""
+        return self.repo.get_status_histogram()
+
+    def count_pending_by_intern(self):
+        """Retorna {intern_id: documentos pendentes} (só estagiários com pendências)."""
+        return self.repo.count_pending_by_intern()
+
+    def count_interns_by_document(self, name_filter: str):
+        """
+        Conta os estagiários com e sem um documento aprovado cujo nome contém o filtro.
+
+        A busca pelo nome (sem diferenciar maiúsculas) é feita sobre os nomes
+        distintos do histograma; a contagem por estagiário roda no banco.
+
+        Returns:
+            Tuple[int, int]: (com documento aprovado, pendentes).
+        """
+        search = name_filter.casefold()
+        names = [
+            name
+            for name in self.repo.get_status_histogram()
+            if search in name.casefold()
+        ]
+        return self.repo.count_interns_by_approval(names)
+
+    def search_feedback(self, text: str, limit: int = 50):
+        """Busca nos comentários (feedback) dos documentos de todos os estagiários."""
+        match_query = to_fts_query(text)
+        if not match_query:
+            return []
+        return self.repo.search_feedback(match_query, limit)
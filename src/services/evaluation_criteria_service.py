@@ -1,7 +1,9 @@
 from services.base_service import BaseService
 from core.models.evaluation_criteria import EvaluationCriteria
 from repository.evaluation_criteria_repo import EvaluationCriteriaRepository
+from data.session import Session
 from utils.validations import validate_required_fields
+from typing import List, Optional
 
 REQUIRED_FIELDS = {
     "name": "Nome do Critério",
@@ -18,16 +20,20 @@ class EvaluationCriteriaService(BaseService[EvaluationCriteria]):
 
     Attributes:
         repo (EvaluationCriteriaRepository): The repository for criteria persistence.
+        session (Optional[Session]): Identity map shared by the services.
     """
 
-    def __init__(self, repo: EvaluationCriteriaRepository):
+    def __init__(
+        self, repo: EvaluationCriteriaRepository, session: Optional[Session] = None
+    ):
         """
         Initializes the service with the specific repository.
 
         Args:
             repo (EvaluationCriteriaRepository): Repository for criteria persistence.
+            session (Optional[Session]): Identity map shared by the services.
         """
-        super().__init__(repo)
+        super().__init__(repo, session)
 
     def _validate_weight(self, criteria: EvaluationCriteria):
         """
@@ -55,12 +61,12 @@ class EvaluationCriteriaService(BaseService[EvaluationCriteria]):
         Raises:
             ValueError: If required fields are missing or weight is invalid.
         """
+        with self._tracking(criteria):
+            validate_required_fields(criteria, REQUIRED_FIELDS)
 
-        validate_required_fields(criteria, REQUIRED_FIELDS)
+            self._validate_weight(criteria)
 
-        self._validate_weight(criteria)
-
-        return self.repo.save(criteria)
+            return self.repo.save(criteria)
 
     def update_criteria(self, criteria: EvaluationCriteria) -> bool:
         """
@@ -77,10 +83,11 @@ class EvaluationCriteriaService(BaseService[EvaluationCriteria]):
         """
         self._ensure_has_id(criteria, "evaluation criteria")
 
-        validate_required_fields(criteria, REQUIRED_FIELDS)
-        self._validate_weight(criteria)
+        with self._tracking(criteria):
+            validate_required_fields(criteria, REQUIRED_FIELDS)
+            self._validate_weight(criteria)
 
-        return self.repo.update(criteria)
+            return self.repo.update(criteria)
 
     def delete_criteria(self, criteria: EvaluationCriteria) -> bool:
         """
@@ -94,11 +101,16 @@ class EvaluationCriteriaService(BaseService[EvaluationCriteria]):
         """
         return self.delete(criteria, "evaluation criteria")
 
-    def list_active_criteria(self):
+    def list_active_criteria(self) -> List[EvaluationCriteria]:
         """
         Retrieves all registered evaluation criteria.
 
+        With a session, the list is read once and kept until a criteria is
+        added, changed or removed.
+
         Returns:
             List[EvaluationCriteria]: A list of all available criteria.
         """
-        return self.repo.get_all()
+        if self.session is None:
+            return self.repo.get_all()
+        return self.session.query(EvaluationCriteria, "all", self.repo.get_all)
@@ -1,6 +1,12 @@
 import sqlite3
 import openpyxl
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill
+from openpyxl.utils import get_column_letter
+
+# Linhas lidas do banco por vez; a planilha é gravada em fluxo.
+EXPORT_BATCH_SIZE = 500
+MAX_COLUMN_WIDTH = 50
 
 
 class ExportService:
@@ -10,6 +16,10 @@ class ExportService:
     def export_to_excel(self, filepath: str):
         """
         Exporta todas as tabelas principais para um arquivo Excel (.xlsx).
+
+        As linhas são lidas em lotes (`fetchmany`) e gravadas numa pasta de
+        trabalho `write_only`, então o uso de memória não depende do tamanho
+        das tabelas.
         """
         tables = [
             "interns",
@@ -21,10 +31,7 @@ class ExportService:
             "evaluation_criteria",
         ]
 
-        wb = openpyxl.Workbook()
-        default_sheet = wb.active
-        if default_sheet:
-            wb.remove(default_sheet)
+        wb = openpyxl.Workbook(write_only=True)
 
         # CORREÇÃO: Acessa o atributo .conn diretamente da sua classe DatabaseConnector
         conn = self.db.conn
@@ -49,32 +56,40 @@ class ExportService:
     def _export_table(self, wb, cursor, table_name):
         try:
             cursor.execute(f"SELECT * FROM {table_name}")
-            rows = cursor.fetchall()
+        except sqlite3.OperationalError:
+            print(f"Aviso: Tabela '{table_name}' não encontrada.")
+            return
 
-            # Pega nomes das colunas
-            columns = [description[0] for description in cursor.description]
+        # Pega nomes das colunas
+        columns = [description[0] for description in cursor.description]
+        batch = cursor.fetchmany(EXPORT_BATCH_SIZE)
 
-            ws = wb.create_sheet(title=table_name.capitalize())
+        ws = wb.create_sheet(title=table_name.capitalize())
 
-            header_font = Font(bold=True, color="FFFFFF")
-            header_fill = PatternFill(
-                start_color="4F81BD", end_color="4F81BD", fill_type="solid"
+        # Ajuste de largura: a planilha em fluxo não pode ser relida, então a
+        # largura é estimada pelo cabeçalho e pelo primeiro lote.
+        for index, name in enumerate(columns):
+            length = max(
+                [len(name)]
+                + [len(str(row[index])) for row in batch if row[index] is not None]
+            )
+            ws.column_dimensions[get_column_letter(index + 1)].width = min(
+                length + 2, MAX_COLUMN_WIDTH
             )
 
-            ws.append(columns)
-            for cell in ws[1]:
-                cell.font = header_font
-                cell.fill = header_fill
-
-            for row in rows:
+        header_font = Font(bold=True, color="FFFFFF")
+        header_fill = PatternFill(
+            start_color="4F81BD", end_color="4F81BD", fill_type="solid"
+        )
+        header = []
+        for name in columns:
+            cell = WriteOnlyCell(ws, value=name)
+            cell.font = header_font
+            cell.fill = header_fill
+            header.append(cell)
+        ws.append(header)
+
+        while batch:
+            for row in batch:
                 ws.append(list(row))
-
-            # Ajuste de largura
-            for column_cells in ws.columns:
-                length = max(len(str(cell.value) or "") for cell in column_cells)
-                ws.column_dimensions[column_cells[0].column_letter].width = min(
-                    length + 2, 50
-                )
-
-        except sqlite3.OperationalError:
-            print(f"Aviso: Tabela '{table_name}' não encontrada.")
+            batch = cursor.fetchmany(EXPORT_BATCH_SIZE)
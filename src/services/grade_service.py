@@ -1,5 +1,6 @@
-from typing import List
+from typing import Dict, List, Optional
 from services.base_service import BaseService
+from core.models.evaluation_criteria import EvaluationCriteria
 from core.models.grade import Grade
 from repository.grade_repo import GradeRepository
 from repository.evaluation_criteria_repo import EvaluationCriteriaRepository
@@ -37,12 +38,18 @@ class GradeService(BaseService[Grade]):
         super().__init__(repo)
         self.criteria_repo = criteria_repo
 
-    def _validate_grade_value(self, grade: Grade):
+    def _validate_grade_value(
+        self,
+        grade: Grade,
+        criteria_by_id: Optional[Dict[int, EvaluationCriteria]] = None,
+    ):
         """
         Ensures the grade value is positive and DOES NOT EXCEED the criteria limit.
 
         Args:
             grade (Grade): The grade entity to validate.
+            criteria_by_id (Optional[Dict[int, EvaluationCriteria]]): Criteria
+                already loaded (batch validation); fetched by ID when omitted.
 
         Raises:
             ValueError: If grade is negative, criteria is not found, or grade > max weight.
@@ -51,7 +58,10 @@ class GradeService(BaseService[Grade]):
         if grade.value < 0:
             raise ValueError("A nota não pode ser negativa.")
 
-        criteria = self.criteria_repo.get_by_id(grade.criteria_id)
+        if criteria_by_id is None:
+            criteria = self.criteria_repo.get_by_id(grade.criteria_id)
+        else:
+            criteria = criteria_by_id.get(grade.criteria_id)
 
         if not criteria:
             raise ValueError(
@@ -133,17 +143,31 @@ class GradeService(BaseService[Grade]):
             return []
         return self.repo.get_by_intern_id(intern_id)
 
+    def get_grades_by_interns(self, intern_ids) -> dict[int, list[Grade]]:
+        """
+        Retrieves the grades of many interns in a single query.
+
+        Args:
+            intern_ids (Iterable[int]): The interns' identifiers.
+
+        Returns:
+            dict[int, list[Grade]]: The grades of each intern, ordered by
+            criteria ID.
+        """
+        return self.repo.get_by_intern_ids(intern_ids)
+
     def save_batch_grades(self, grades: list[Grade]):
         """
-        Processes and persists a list of grades using an optimized Upsert strategy.
+        Validates and persists a list of grades with a single upsert.
 
-        This method minimizes database round-trips by pre-fetching existing grades
-        for the associated intern. It determines whether to update an existing
-        entry or create a new one based on the criteria ID.
+        The criteria are loaded once to validate every grade; the grades are
+        then written by `GradeRepository.upsert_many`, which inserts new
+        (intern, criteria) pairs and updates the existing ones in one
+        `executemany`.
 
         Business Rules:
-            - All grades in the batch are assumed to belong to the same intern.
             - Each grade is validated against criteria limits before persistence.
+            - The batch is committed once; an invalid grade discards the whole batch.
 
         Args:
             grades (list[Grade]): List of Grade objects to process.
@@ -154,20 +178,8 @@ class GradeService(BaseService[Grade]):
         if not grades:
             return
 
-        intern_id = grades[0].intern_id
-
-        existing_grades = self.repo.get_by_intern_id(intern_id)
-
-        existing_map = {g.criteria_id: g for g in existing_grades}
-
+        criteria_by_id = {c.criteria_id: c for c in self.criteria_repo.get_all()}
         for grade in grades:
-            self._validate_grade_value(grade)
-
-            if grade.criteria_id in existing_map:
-                target_grade = existing_map[grade.criteria_id]
-
-                target_grade.value = grade.value
+            self._validate_grade_value(grade, criteria_by_id)
 
-                self.repo.update(target_grade)
-            else:
-                self.repo.save(grade)
+        self.repo.upsert_many(grades)
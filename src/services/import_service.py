@@ -6,6 +6,7 @@ from services.venue_service import VenueService
 from services.document_service import DocumentService
 from core.models.venue import Venue
 from core.models.intern import Intern
+from utils.text import normalize_name
 
 
 class ImportService:
@@ -37,7 +38,9 @@ class ImportService:
             else:
                 raise ValueError("Formato não suportado. Use .csv ou .xlsx")
 
-            self._process_data(rows)
+            # Toda a planilha em uma única transação (um commit no final)
+            with self.intern_service.transaction():
+                self._process_data(rows)
 
         except Exception as e:
             print(f"ERRO NA IMPORTAÇÃO: {e}")
@@ -105,74 +108,76 @@ class ImportService:
         return rows
 
     def _process_data(self, rows: list[dict]):
-        processed_venues = set()
-        processed_interns = set()
-        venue_id_map: dict[str, int] = {}
-        line_count = 0
+        """
+        Cria ou atualiza os locais e os alunos das linhas lidas.
 
+        Os registros já existentes são buscados de uma vez (locais pelo nome,
+        alunos pelo RA e pelo nome, sem diferenciar maiúsculas e acentos), de
+        modo que o número de consultas não cresce com o tamanho da planilha.
+        """
+        entries = []
         for row in rows:
-            line_count += 1
             # Normaliza chaves para minúsculo para evitar erro de digitação no header
             safe_row = {k.lower().strip(): v for k, v in row.items()}
+            if safe_row.get("nome", "").strip() and safe_row.get("ra", "").strip():
+                entries.append(safe_row)
 
-            venue_name = safe_row.get("local", "").strip()
-            intern_name = safe_row.get("nome", "").strip()
-            ra_raw = safe_row.get("ra", "").strip()
+        venue_ids = self._import_venues(entries)
+        self._import_interns(entries, venue_ids)
 
-            if not intern_name or not ra_raw:
-                continue
+    def _import_venues(self, entries: list[dict]) -> dict[str, int]:
+        """Cria ou atualiza os locais; retorna {nome normalizado: venue_id}."""
+        # A primeira linha de cada local define os dados do supervisor
+        first_rows: dict[str, dict] = {}
+        for safe_row in entries:
+            venue_name = safe_row.get("local", "").strip()
+            if venue_name:
+                first_rows.setdefault(normalize_name(venue_name), safe_row)
 
-            # --- Processa Local ---
-            current_venue_id: int | None = None
+        existing = self.venue_service.repo.get_by_normalized_names(first_rows)
+        venue_ids: dict[str, int] = {}
+        for key, safe_row in first_rows.items():
             raw_sup_email = safe_row.get("email_supervisor")
-            email_sup = raw_sup_email.strip() if raw_sup_email else None
-
-            # Tenta criar ou buscar local
-            if venue_name and venue_name not in processed_venues:
-                existing_venue = self.venue_service.repo.get_by_name(venue_name)
-                venue_data = {
-                    "venue_name": venue_name,
-                    "supervisor_name": safe_row.get("nome_supervisor", "").strip(),
-                    "supervisor_email": email_sup,
-                    "supervisor_phone": safe_row.get("telefone_supervisor", "").strip(),
-                }
-
-                if existing_venue:
-                    self.venue_service.update_venue(
-                        Venue(venue_id=existing_venue.venue_id, **venue_data)
-                    )
-                    current_venue_id = existing_venue.venue_id
-                else:
-                    current_venue_id = self.venue_service.add_new_venue(
-                        Venue(**venue_data)
-                    )
-
-                # Fallback
-                if current_venue_id is None:
-                    v = self.venue_service.repo.get_by_name(venue_name)
-                    if v:
-                        current_venue_id = v.venue_id
-
-                if current_venue_id is not None:
-                    processed_venues.add(venue_name)
-                    venue_id_map[venue_name] = current_venue_id
-
-            elif venue_name:
-                current_venue_id = venue_id_map.get(venue_name)
-                if not current_venue_id:
-                    v = self.venue_service.repo.get_by_name(venue_name)
-                    if v:
-                        current_venue_id = v.venue_id
-
-            # --- Processa Aluno ---
-            if intern_name in processed_interns:
-                continue
+            venue_data = {
+                "venue_name": safe_row["local"].strip(),
+                "supervisor_name": safe_row.get("nome_supervisor", "").strip(),
+                "supervisor_email": raw_sup_email.strip() if raw_sup_email else None,
+                "supervisor_phone": safe_row.get("telefone_supervisor", "").strip(),
+            }
 
-            existing_intern = self.intern_service.repo.get_by_name(intern_name)
+            existing_venue = existing.get(key)
+            if existing_venue:
+                self.venue_service.update_venue(
+                    Venue(venue_id=existing_venue.venue_id, **venue_data)
+                )
+                venue_ids[key] = existing_venue.venue_id
+            else:
+                venue_ids[key] = self.venue_service.add_new_venue(Venue(**venue_data))
+        return venue_ids
+
+    def _import_interns(self, entries: list[dict], venue_ids: dict[str, int]):
+        """Cria ou atualiza os alunos; um aluno existente é achado pelo RA ou pelo nome."""
+        # A primeira linha de cada aluno prevalece
+        first_rows: dict[str, dict] = {}
+        for safe_row in entries:
+            first_rows.setdefault(normalize_name(safe_row["nome"]), safe_row)
+
+        repo = self.intern_service.repo
+        by_ra = repo.get_by_registration_numbers(
+            str(safe_row["ra"]).strip() for safe_row in first_rows.values()
+        )
+        by_name = repo.get_by_normalized_names(first_rows)
+
+        new_intern_ids = []
+        for key, safe_row in first_rows.items():
+            ra = str(safe_row["ra"]).strip()
+            venue_name = safe_row.get("local", "").strip()
             intern_data = {
-                "name": intern_name,
-                "registration_number": str(ra_raw),
-                "venue_id": current_venue_id,
+                "name": safe_row["nome"].strip(),
+                "registration_number": ra,
+                "venue_id": venue_ids.get(normalize_name(venue_name))
+                if venue_name
+                else None,
                 "term": safe_row.get("periodo", "").strip(),
                 "email": safe_row.get("email", None),
                 "start_date": safe_row.get("data_inicio", "").strip(),
@@ -180,21 +185,23 @@ class ImportService:
                 "working_hours": safe_row.get("horarios", "").strip(),
             }
 
+            existing_intern = by_ra.get(ra) or by_name.get(key)
             if existing_intern:
                 self.intern_service.update_intern(
                     Intern(intern_id=existing_intern.intern_id, **intern_data)
                 )
             else:
-                new_intern_id = self.intern_service.add_new_intern(
-                    Intern(**intern_data)
+                new_intern_ids.append(
+                    self.intern_service.add_new_intern(Intern(**intern_data))
                 )
-                # Cria documentos iniciais
-                if new_intern_id:
-                    try:
-                        self.document_service.create_initial_documents_batch(
-                            new_intern_id
-                        )
-                    except Exception:
-                        pass
 
-            processed_interns.add(intern_name)
+        # Cria documentos iniciais
+        if new_intern_ids:
+            try:
+                # Savepoint: uma falha aqui não desfaz o restante da importação
+                with self.document_service.transaction():
+                    self.document_service.create_initial_documents_for_interns(
+                        new_intern_ids
+                    )
+            except Exception:
+                pass
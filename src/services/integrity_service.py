@@ -0,0 +1,120 @@
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, ContextManager, Optional
+
+from core.models.maintenance_run import MaintenanceRun
+from data.recovery import request_recovery
+from repository.maintenance_repo import MaintenanceRepository
+
+# How often the background check is due.
+INTEGRITY_CHECK_INTERVAL = timedelta(days=1)
+
+# Name of the check in the maintenance history.
+INTEGRITY_TASK = "quick_check"
+
+
+class IntegrityService:
+    """
+    Service that checks the database file for corruption in the background.
+
+    `check()` runs `PRAGMA quick_check` one table at a time on a reader
+    connection, so it runs in a worker thread (see `ui.workers.ReadWorker`),
+    reports progress and can stop between tables. `record()` stores the
+    outcome on the writer; when problems were found, the database is flagged
+    so the next start recovers it (see `data.recovery`).
+
+    Attributes:
+        repo (MaintenanceRepository): Check statements and history.
+    """
+
+    def __init__(self, repo: MaintenanceRepository):
+        """
+        Initializes the service.
+
+        Args:
+            repo (MaintenanceRepository): Check statements and history.
+        """
+        self.repo = repo
+
+    def reader(self) -> ContextManager:
+        """Leases a read-only connection; see `DatabaseConnector.reader()`."""
+        return self.repo.db.reader()
+
+    def is_due(self) -> bool:
+        """True if the last successful check is older than the interval."""
+        last = self.repo.get_last_completed(INTEGRITY_TASK)
+        if last is None:
+            return True
+        started_at = datetime.fromisoformat(last.started_at)
+        return datetime.now() - started_at >= INTEGRITY_CHECK_INTERVAL
+
+    def check(
+        self,
+        on_progress: Optional[Callable[[int, int], object]] = None,
+        is_cancelled: Optional[Callable[[], bool]] = None,
+    ) -> Optional[MaintenanceRun]:
+        """
+        Checks every table and its indexes, one table per step.
+
+        Args:
+            on_progress (Optional[Callable[[int, int], object]]): Called after
+                each table with `(checked_tables, total_tables)`.
+            is_cancelled (Optional[Callable[[], bool]]): Polled between tables;
+                returning True stops the check.
+
+        Returns:
+            Optional[MaintenanceRun]: The outcome ('ok', or the problems per
+            table), not yet recorded. None if the check was cancelled.
+        """
+        started_at = datetime.now().isoformat(timespec="seconds")
+        start = time.perf_counter()
+        problems = []
+
+        try:
+            tables = self.repo.get_tables()
+        except sqlite3.DatabaseError as e:
+            tables = []
+            problems.append(f"sqlite_master: {e}")
+
+        for done, table in enumerate(tables, start=1):
+            if is_cancelled and is_cancelled():
+                return None
+            try:
+                result = self.repo.quick_check(table)
+            except sqlite3.DatabaseError as e:
+                result = str(e)
+            if result != "ok":
+                problems.append(f"{table}: {result}")
+            if on_progress:
+                on_progress(done, len(tables))
+
+        return MaintenanceRun(
+            task=INTEGRITY_TASK,
+            started_at=started_at,
+            duration_ms=(time.perf_counter() - start) * 1000,
+            result="\n".join(problems) if problems else "ok",
+        )
+
+    def record(self, run: MaintenanceRun) -> bool:
+        """
+        Stores the outcome of a check (writer thread).
+
+        When problems were found, the database file is flagged for recovery at
+        the next start.
+
+        Args:
+            run (MaintenanceRun): The outcome returned by `check()`.
+
+        Returns:
+            bool: True if the database is healthy.
+        """
+        run.run_id = self.repo.save(run)
+        if run.result == "ok":
+            return True
+
+        db = self.repo.db
+        if not db.is_memory:
+            request_recovery(Path(db.db_path))
+        return False
@@ -1,12 +1,17 @@
 from services.base_service import BaseService
 from core.models.intern import Intern
+from core.models.intern_filter import InternFilter
+from core.models.intern_row import InternRow
 from repository.intern_repo import InternRepository
+from repository.intern_summary_repo import InternSummaryRepository
+from core.models.intern_summary import InternSummary
+from data.session import Session
 from utils.validations import (
     validate_email_format,
     validate_date_range,
     parse_date_to_iso,
 )
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 REQUIRED_FIELDS = {
     "name": "Nome do Aluno",
@@ -27,19 +32,29 @@ class InternService(BaseService[Intern]):
 
     Attributes:
         repo (InternRepository): The repository for intern persistence.
+        session (Optional[Session]): Identity map shared by the services.
+        summary_repo (InternSummaryRepository): Precomputed per-intern counters.
         REQUIRED_FIELDS (Dict[str, str]): Mapping of required fields for validation.
     """
 
     REQUIRED_FIELDS = REQUIRED_FIELDS
 
-    def __init__(self, repo: InternRepository):
+    def __init__(
+        self,
+        repo: InternRepository,
+        summary_repo: InternSummaryRepository,
+        session: Optional[Session] = None,
+    ):
         """
-        Initializes the InternService with the specified repository.
+        Initializes the InternService with the specified repositories.
 
         Args:
             repo (InternRepository): Repository for intern persistence.
+            summary_repo (InternSummaryRepository): Precomputed per-intern counters.
+            session (Optional[Session]): Identity map shared by the services.
         """
-        super().__init__(repo)
+        super().__init__(repo, session)
+        self.summary_repo = summary_repo
 
     def _validate_common_intern_data(self, intern: Intern) -> None:
         """
@@ -95,20 +110,21 @@ class InternService(BaseService[Intern]):
         Raises:
             ValueError: If the RA is already in use by another intern.
         """
-        if self.repo.get_by_registration_number(intern.registration_number):
-            raise ValueError("RA já cadastrado.")
+        with self._tracking(intern):
+            if self.repo.get_by_registration_number(intern.registration_number):
+                raise ValueError("RA já cadastrado.")
 
-        self._normalize_intern_dates(intern)
-        self._validate_common_intern_data(intern)
+            self._normalize_intern_dates(intern)
+            self._validate_common_intern_data(intern)
 
-        return self.repo.save(intern)
+            return self.repo.save(intern)
 
     def get_by_name(self, name: str) -> Optional[Intern]:
         """
         Retrieves an intern by name (encapsulating the repository).
 
         Args:
-            name (str): The name (or partial name) to search for.
+            name (str): The full name (case and accents are ignored).
 
         Returns:
             Optional[Intern]: The found intern or None.
@@ -132,13 +148,14 @@ class InternService(BaseService[Intern]):
             ValueError: If the RA belongs to another intern or validation fails.
         """
         self._ensure_has_id(intern, "intern")
-        existing = self.repo.get_by_registration_number(intern.registration_number)
-        if existing and existing.intern_id != intern.intern_id:
-            raise ValueError("Este RA pertence a outro estagiário.")
-        self._validate_common_intern_data(intern)
-        self._normalize_intern_dates(intern)
+        with self._tracking(intern):
+            existing = self.repo.get_by_registration_number(intern.registration_number)
+            if existing and existing.intern_id != intern.intern_id:
+                raise ValueError("Este RA pertence a outro estagiário.")
+            self._validate_common_intern_data(intern)
+            self._normalize_intern_dates(intern)
 
-        return self.repo.update(intern)
+            return self.repo.update(intern)
 
     def delete_intern(self, intern: Intern):
         """
@@ -162,14 +179,74 @@ class InternService(BaseService[Intern]):
         """
         return self.repo.get_all()
 
-    def get_by_id(self, entity_id: int) -> Optional[Intern]:
+    def get_interns_page(
+        self,
+        filters: Optional[InternFilter] = None,
+        after: Optional[Intern] = None,
+        limit: int = 100,
+    ) -> List[Intern]:
         """
-        Retrieves a single intern by their unique ID.
+        Returns one page of the intern list, in the order of `get_all_interns`.
 
         Args:
-            entity_id (int): The unique identifier.
+            filters (Optional[InternFilter]): Restricts the list (term, venue,
+                status).
+            after (Optional[Intern]): Last intern of the previous page; None
+                for the first page.
+            limit (int): Maximum number of interns.
 
         Returns:
-            Optional[Intern]: The intern object if found, None otherwise.
+            List[Intern]: The page; shorter than `limit` when it is the last one.
         """
-        return self.repo.get_by_id(entity_id)
+        key = (after.name, after.intern_id) if after is not None else None
+        return self.repo.get_page(filters, key, limit)
+
+    def list_intern_rows(
+        self,
+        filters: Optional[InternFilter] = None,
+        after: Optional[InternRow] = None,
+        limit: int = 100,
+    ) -> List[InternRow]:
+        """
+        Returns one page of the intern list as the rows the main table shows.
+
+        Args:
+            filters (Optional[InternFilter]): Restricts the list (term, venue,
+                status).
+            after (Optional[InternRow]): Last row of the previous page; None
+                for the first page.
+            limit (int): Maximum number of rows.
+
+        Returns:
+            List[InternRow]: The page, in the order of `get_interns_page`.
+        """
+        key = (after.name, after.intern_id) if after is not None else None
+        return self.repo.list_rows(filters, key, limit)
+
+    def get_intern_row(self, intern_id: int) -> Optional[InternRow]:
+        """Returns the main-table row of one intern, or None if it was deleted."""
+        return self.repo.get_row(intern_id)
+
+    def count_interns(self, filters: Optional[InternFilter] = None) -> int:
+        """Counts the interns matching the filters."""
+        return self.repo.count(filters)
+
+    def get_summary(self, intern_id: int) -> Optional[InternSummary]:
+        """
+        Returns the document, meeting and grade counters of an intern.
+
+        Args:
+            intern_id (int): The intern.
+
+        Returns:
+            Optional[InternSummary]: The counters, or None if the intern does not exist.
+        """
+        return self.summary_repo.get_by_intern_id(intern_id)
+
+    def count_pending_document_items(self) -> int:
+        """Counts documents not yet approved (interns without documents count as one)."""
+        return self.summary_repo.count_pending_items()
+
+    def count_document_compliance(self) -> Tuple[int, int]:
+        """Returns (interns with every document approved, interns with pendencies)."""
+        return self.summary_repo.count_document_compliance()
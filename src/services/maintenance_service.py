@@ -0,0 +1,157 @@
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+
+from core.models.maintenance_run import MaintenanceRun
+from repository.maintenance_repo import MaintenanceRepository
+
+# How often the expensive tasks are due.
+ANALYZE_INTERVAL = timedelta(days=7)
+
+# Rows sampled per index by ANALYZE; keeps it fast on large tables.
+ANALYSIS_LIMIT = 1000
+
+# Pages released per `incremental_vacuum` step, so the budget is checked often.
+VACUUM_PAGES_PER_STEP = 256
+
+# A legacy (auto_vacuum = NONE) file is rebuilt once, on exit only, when this
+# share of it is free and it is small enough to be rebuilt within the budget.
+FULL_VACUUM_MIN_FREE_RATIO = 0.2
+FULL_VACUUM_MAX_PAGES = 25_000
+
+# Rows of history kept in `maintenance_runs`.
+HISTORY_SIZE = 200
+
+
+class MaintenanceService:
+    """
+    Service that keeps the database healthy within a time budget.
+
+    A run executes, in order and while budget remains, `PRAGMA optimize`,
+    `ANALYZE` (weekly) and an incremental vacuum of the free pages. Statements are interrupted when the budget
+    runs out, and every task that ran is recorded in `maintenance_runs`.
+
+    Runs use the writer connection, so they are triggered from the GUI thread
+    while the user is idle (`ui.maintenance_scheduler`) and on exit. The
+    integrity check reads the whole file, so it runs on a reader instead (see
+    `services.integrity_service`).
+
+    Attributes:
+        repo (MaintenanceRepository): Maintenance statements and history.
+    """
+
+    def __init__(self, repo: MaintenanceRepository):
+        """
+        Initializes the service.
+
+        Args:
+            repo (MaintenanceRepository): Maintenance statements and history.
+        """
+        self.repo = repo
+
+    def run(
+        self, budget_ms: float, allow_full_vacuum: bool = False
+    ) -> List[MaintenanceRun]:
+        """
+        Runs the maintenance tasks that are due, within a time budget.
+
+        Args:
+            budget_ms (float): Total time available for the run.
+            allow_full_vacuum (bool): Allows the one-time rebuild of a legacy
+                file into INCREMENTAL auto_vacuum mode (use on exit only).
+
+        Returns:
+            List[MaintenanceRun]: The tasks that ran, with their results.
+        """
+        db = self.repo.db
+        if db.in_transaction:
+            # Interrupting a statement would roll back the caller's work.
+            return []
+        db.commit()
+
+        tasks: List[tuple[str, Callable[[], Optional[str]]]] = [
+            ("optimize", self._optimize),
+            ("analyze", self._analyze),
+            ("incremental_vacuum", lambda: self._vacuum(allow_full_vacuum)),
+        ]
+
+        deadline = time.perf_counter() + budget_ms / 1000
+        runs: List[MaintenanceRun] = []
+
+        for task, action in tasks:
+            remaining_ms = (deadline - time.perf_counter()) * 1000
+            if remaining_ms <= 0:
+                break
+
+            started_at = datetime.now().isoformat(timespec="seconds")
+            start = time.perf_counter()
+            try:
+                with db.time_limit(remaining_ms):
+                    result = action()
+            except sqlite3.OperationalError as e:
+                result = "interrupted" if "interrupt" in str(e) else f"erro: {e}"
+            except sqlite3.Error as e:
+                result = f"erro: {e}"
+
+            if result is None:  # Not due
+                continue
+
+            run = MaintenanceRun(
+                task=task,
+                started_at=started_at,
+                duration_ms=(time.perf_counter() - start) * 1000,
+                result=result,
+            )
+            run.run_id = self.repo.save(run)
+            runs.append(run)
+
+        if runs:
+            self.repo.prune(HISTORY_SIZE)
+        return runs
+
+    def get_history(self, limit: int = 50) -> List[MaintenanceRun]:
+        """Returns the latest maintenance runs, newest first."""
+        return self.repo.get_recent(limit)
+
+    def _is_due(self, task: str, interval: timedelta) -> bool:
+        last = self.repo.get_last_completed(task)
+        if last is None:
+            return True
+        return datetime.now() - datetime.fromisoformat(last.started_at) >= interval
+
+    def _optimize(self) -> Optional[str]:
+        self.repo.optimize()
+        return "ok"
+
+    def _analyze(self) -> Optional[str]:
+        if not self._is_due("analyze", ANALYZE_INTERVAL):
+            return None
+        self.repo.analyze(ANALYSIS_LIMIT)
+        return "ok"
+
+    def _vacuum(self, allow_full_vacuum: bool) -> Optional[str]:
+        free_pages = self.repo.get_freelist_count()
+        if free_pages == 0:
+            return None
+
+        if self.repo.get_auto_vacuum() == 2:  # INCREMENTAL
+            released = 0
+            while free_pages > 0:
+                self.repo.incremental_vacuum(VACUUM_PAGES_PER_STEP)
+                remaining = self.repo.get_freelist_count()
+                if remaining >= free_pages:
+                    break
+                released += free_pages - remaining
+                free_pages = remaining
+            return f"ok: {released} páginas liberadas"
+
+        page_count = self.repo.get_page_count()
+        if (
+            allow_full_vacuum
+            and page_count <= FULL_VACUUM_MAX_PAGES
+            and free_pages >= page_count * FULL_VACUUM_MIN_FREE_RATIO
+        ):
+            self.repo.vacuum()
+            return f"ok: arquivo reconstruído ({free_pages} páginas liberadas)"
+        return None
@@ -1,3 +1,6 @@
+from datetime import date
+from typing import List
+
 from services.base_service import BaseService
 from core.models.meeting import Meeting
 from repository.meeting_repo import MeetingRepository
@@ -57,6 +60,50 @@ class MeetingService(BaseService[Meeting]):
 
         return self.repo.save(meeting)
 
+    def add_meetings_for_interns(
+        self, intern_ids: List[int], meeting_date: str, is_intern_present: bool = True
+    ) -> List[int]:
+        """
+        Records the same meeting for many interns at once (group meeting).
+
+        The date is validated and converted once, and the meetings are
+        inserted together in a single transaction.
+
+        Args:
+            intern_ids (List[int]): The interns who took part.
+            meeting_date (str): Date of the meeting (DD/MM/YYYY or ISO).
+            is_intern_present (bool): Attendance recorded for every intern.
+
+        Returns:
+            List[int]: The IDs of the new meetings, in the order of `intern_ids`.
+
+        Raises:
+            ValueError: If no intern is given or the date is missing.
+        """
+        if not intern_ids:
+            raise ValueError("Nenhum estagiário informado para a reunião.")
+
+        template = Meeting(
+            intern_id=intern_ids[0],
+            meeting_date=meeting_date,
+            is_intern_present=is_intern_present,
+        )
+        self._validate_required_fields(template)
+        try:
+            meeting_date = parse_date_to_iso(meeting_date)
+        except ValueError:
+            pass
+
+        meetings = [
+            Meeting(
+                intern_id=intern_id,
+                meeting_date=meeting_date,
+                is_intern_present=is_intern_present,
+            )
+            for intern_id in intern_ids
+        ]
+        return self.repo.save_many(meetings)
+
     def get_meetings_by_intern(self, intern_id: int):
         """
         Retrieves all meetings associated with a specific intern.
@@ -69,6 +116,35 @@ class MeetingService(BaseService[Meeting]):
         """
         return self.repo.get_by_intern_id(intern_id)
 
+    def get_meetings_by_interns(self, intern_ids):
+        """
+        Retrieves the meetings of many interns in a single query.
+
+        Args:
+            intern_ids (Iterable[int]): The interns.
+
+        Returns:
+            Dict[int, List[Meeting]]: The meetings of each intern.
+        """
+        return self.repo.get_by_intern_ids(intern_ids)
+
+    def count_meetings_in_month(self, day: date) -> int:
+        """
+        Counts the meetings held in the month of a given day.
+
+        Args:
+            day (date): Any day of the month.
+
+        Returns:
+            int: The number of meetings from the 1st to the last day of the month.
+        """
+        start = day.replace(day=1)
+        if start.month == 12:
+            end = start.replace(year=start.year + 1, month=1)
+        else:
+            end = start.replace(month=start.month + 1)
+        return self.repo.count_between(start.isoformat(), end.isoformat())
+
     def delete_meeting(self, meeting_id: int):
         """
         Removes a meeting from the system using the base service logic.
@@ -1,6 +1,7 @@
 from services.base_service import BaseService
 from core.models.observation import Observation
 from repository.observation_repo import ObservationRepository
+from utils.text import to_fts_query
 
 REQUIRED_FIELDS = {
     "observation": "Comentário",
@@ -86,3 +87,25 @@ class ObservationService(BaseService[Observation]):
     def get_observations_by_intern(self, intern_id: int):
         """Retorna todas as observações de um estagiário."""
         return self.repo.get_by_intern_id(intern_id)
+
+    def get_observations_by_interns(self, intern_ids):
+        """Retorna as observações de vários estagiários, agrupadas por estagiário."""
+        return self.repo.get_by_intern_ids(intern_ids)
+
+    def search_observations(self, text: str, limit: int = 50):
+        """
+        Searches the observations of every intern by their words.
+
+        Args:
+            text (str): Words to look for (accents and case are ignored; the
+                last letters of a word may be omitted).
+            limit (int): Maximum number of results.
+
+        Returns:
+            List[SearchResult]: Matches with a snippet, best first. Empty if the
+            text has no words.
+        """
+        match_query = to_fts_query(text)
+        if not match_query:
+            return []
+        return self.repo.search(match_query, limit)
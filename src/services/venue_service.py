@@ -1,6 +1,7 @@
 from services.base_service import BaseService
 from core.models.venue import Venue
 from repository.venue_repo import VenueRepository
+from data.session import Session
 from utils.validations import validate_email_format
 
 from typing import Optional
@@ -21,19 +22,21 @@ class VenueService(BaseService[Venue]):
 
     Attributes:
         repo (VenueRepository): The repository for venue persistence.
+        session (Optional[Session]): Identity map shared by the services.
         REQUIRED_FIELDS (Dict[str, str]): Mapping of required fields for validation.
     """
 
     REQUIRED_FIELDS = REQUIRED_FIELDS
 
-    def __init__(self, repo: VenueRepository):
+    def __init__(self, repo: VenueRepository, session: Optional[Session] = None):
         """
         Initializes the VenueService with the specified repository.
 
         Args:
             repo (VenueRepository): Repository for venue persistence.
+            session (Optional[Session]): Identity map shared by the services.
         """
-        super().__init__(repo)
+        super().__init__(repo, session)
 
     def add_new_venue(self, venue: Venue):
         """
@@ -51,18 +54,19 @@ class VenueService(BaseService[Venue]):
         Raises:
             ValueError: If required fields are missing or email format is invalid.
         """
-        self._validate_required_fields(venue)
+        with self._tracking(venue):
+            self._validate_required_fields(venue)
 
-        if venue.supervisor_email:
-            validate_email_format(str(venue.supervisor_email))
-        return self.repo.save(venue)
+            if venue.supervisor_email:
+                validate_email_format(str(venue.supervisor_email))
+            return self.repo.save(venue)
 
     def get_by_name(self, name: str) -> Optional[Venue]:
         """
         Searches for a Venue by its name.
 
         Args:
-            name (str): The name (or partial name) to search for.
+            name (str): The full name (case and accents are ignored).
 
         Returns:
             Optional[Venue]: The Venue object if found, or None.
@@ -83,11 +87,12 @@ class VenueService(BaseService[Venue]):
             ValueError: If the venue object does not have an ID.
         """
         self._ensure_has_id(venue, "venue")
-        self._validate_required_fields(venue)
+        with self._tracking(venue):
+            self._validate_required_fields(venue)
 
-        if venue.supervisor_email:
-            validate_email_format(str(venue.supervisor_email))
-        return self.repo.update(venue)
+            if venue.supervisor_email:
+                validate_email_format(str(venue.supervisor_email))
+            return self.repo.update(venue)
 
     def delete_venue(self, venue: Venue):
         """
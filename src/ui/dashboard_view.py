@@ -1,5 +1,6 @@
 from typing import Optional
-from datetime import datetime
+from datetime import date
+from functools import partial
 from PySide6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -18,7 +19,9 @@ import qtawesome as qta
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
+from core.models.intern_filter import InternFilter
 from ui.styles import COLORS
+from ui.workers import ReadWorker
 
 
 class ChartWidget(QFrame):
@@ -38,6 +41,10 @@ class DashboardView(QWidget):
         self.m_service = meeting_service
         self.v_service = venue_service
 
+        # Refreshes run on a reader connection; only the latest one is applied.
+        self._generation = 0
+        self._workers: set[ReadWorker] = set()
+
         self._setup_ui()
         self.refresh_data()
 
@@ -240,36 +247,59 @@ class DashboardView(QWidget):
             lbl.setText(str(value))
 
     def refresh_data(self):
-        interns = self.i_service.get_all_interns()
-
-        total_interns = len(interns)
-        no_venue_count = sum(1 for i in interns if not i.venue_id)
-
-        # Pendências Gerais (Card)
-        total_pending_items = 0
-        for i in interns:
-            docs = self.d_service.get_documents_by_intern(i.intern_id)
-            total_pending_items += sum(1 for d in docs if d.status != "Aprovado")
-            if not docs:
-                total_pending_items += 1
-
-        all_meetings = self.m_service.repo.get_all()
-        now = datetime.now()
-        meetings_month = sum(
-            1
-            for m in all_meetings
-            if datetime.strptime(m.meeting_date, "%Y-%m-%d").month == now.month
+        """Recalcula os indicadores em segundo plano e atualiza a tela ao terminar."""
+        self._generation += 1
+        worker = ReadWorker(
+            self.i_service.reader,
+            self._collect_stats,
+            self.combo_doc_filter.currentText(),
         )
+        worker.signals.finished.connect(
+            partial(self._on_stats_ready, worker, self._generation)
+        )
+        worker.signals.failed.connect(partial(self._on_stats_failed, worker))
+        self._workers.add(worker)
+        worker.start()
+
+    def _collect_stats(self, filter_doc: str) -> dict:
+        """Executa as consultas do painel (roda fora da thread da interface)."""
+        total_interns = self.i_service.count_interns()
+        no_venue_count = self.i_service.count_interns(InternFilter(venue_id=0))
+
+        # Pendências Gerais (Card), lidas do resumo mantido por triggers
+        total_pending_items = self.i_service.count_pending_document_items()
+
+        meetings_month = self.m_service.count_meetings_in_month(date.today())
+
+        ok_count, pending_count = self._count_docs_filtered(filter_doc)
+
+        return {
+            "total": total_interns,
+            "no_venue": no_venue_count,
+            "pending": total_pending_items,
+            "meetings_month": meetings_month,
+            "docs_ok": ok_count,
+            "docs_pending": pending_count,
+        }
+
+    def _on_stats_ready(self, worker, generation, stats):
+        self._workers.discard(worker)
+        if generation != self._generation:
+            return  # Um refresh mais recente já está a caminho
+
+        self._update_card_value(self.card_total, stats["total"])
+        self._update_card_value(self.card_no_venue, stats["no_venue"])
+        self._update_card_value(self.card_pending, stats["pending"])
+        self._update_card_value(self.card_meetings, stats["meetings_month"])
+
+        self._plot_venue_distribution(
+            self.chart1_frame, stats["total"], stats["no_venue"]
+        )
+        self._plot_docs(stats["docs_ok"], stats["docs_pending"])
 
-        self._update_card_value(self.card_total, total_interns)
-        self._update_card_value(self.card_no_venue, no_venue_count)
-        self._update_card_value(self.card_pending, total_pending_items)
-        self._update_card_value(self.card_meetings, meetings_month)
-
-        self._plot_venue_distribution(self.chart1_frame, total_interns, no_venue_count)
-
-        filter_doc = self.combo_doc_filter.currentText()
-        self._plot_docs_filtered(filter_doc, interns)
+    def _on_stats_failed(self, worker, message):
+        self._workers.discard(worker)
+        print(f"Erro ao atualizar o painel: {message}")
 
     def _plot_venue_distribution(self, frame, total, no_venue):
         if frame.figure is None or frame.canvas is None:
@@ -307,38 +337,15 @@ class DashboardView(QWidget):
 
         frame.canvas.draw()
 
-    def _plot_docs_filtered(self, filter_name, interns):
+    def _count_docs_filtered(self, filter_name):
+        if filter_name == "Todos":
+            return self.i_service.count_document_compliance()
+        return self.d_service.count_interns_by_document(filter_name)
+
+    def _plot_docs(self, ok_count, pending_count):
         self.fig_docs.clear()
         ax = self.fig_docs.add_subplot(111)
 
-        ok_count = 0
-        pending_count = 0
-
-        if filter_name == "Todos":
-            for i in interns:
-                docs = self.d_service.get_documents_by_intern(i.intern_id)
-                if not docs:
-                    pending_count += 1
-                elif any(d.status != "Aprovado" for d in docs):
-                    pending_count += 1
-                else:
-                    ok_count += 1
-        else:
-            for i in interns:
-                docs = self.d_service.get_documents_by_intern(i.intern_id)
-                target_docs = [
-                    d for d in docs if filter_name.lower() in d.document_name.lower()
-                ]
-
-                if not target_docs:
-                    pending_count += 1
-                else:
-                    is_ok = any(d.status == "Aprovado" for d in target_docs)
-                    if is_ok:
-                        ok_count += 1
-                    else:
-                        pending_count += 1
-
         categories = ["Aprovado", "Pendente"]
         values = [ok_count, pending_count]
         colors = [COLORS["success"], COLORS["warning"]]
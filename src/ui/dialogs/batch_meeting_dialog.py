@@ -14,7 +14,6 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, QDate
 import qtawesome as qta
 from ui.styles import COLORS
-from core.models.meeting import Meeting
 
 
 class BatchMeetingDialog(QDialog):
@@ -177,15 +176,12 @@ class BatchMeetingDialog(QDialog):
 
         date_str = self.date_edit.date().toString("yyyy-MM-dd")
 
-        count = 0
         try:
-            for iid in selected_ids:
-                meeting = Meeting(
-                    intern_id=iid, meeting_date=date_str, is_intern_present=True
-                )
-                # CORREÇÃO DO NOME DO MÉTODO AQUI:
-                self.meeting_service.add_new_meeting(meeting)
-                count += 1
+            # Um único INSERT (e um único commit) para todo o grupo
+            new_ids = self.meeting_service.add_meetings_for_interns(
+                selected_ids, date_str, is_intern_present=True
+            )
+            count = len(new_ids)
 
             QMessageBox.information(
                 self, "Sucesso", f"{count} reuniões agendadas com sucesso!"
@@ -0,0 +1,143 @@
+from PySide6.QtWidgets import (
+    QDialog,
+    QVBoxLayout,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QHeaderView,
+    QAbstractItemView,
+)
+from PySide6.QtCore import Qt, QSize
+import qtawesome as qta
+
+from data.tracing import LATENCY_BUCKETS_MS
+from services.diagnostics_service import DiagnosticsService
+from ui.styles import COLORS
+
+
+class QueryStatsDialog(QDialog):
+    """
+    Resumo das consultas SQL registradas pelo rastreamento do banco.
+    """
+
+    def __init__(self, parent, service: DiagnosticsService):
+        super().__init__(parent)
+        self.service = service
+
+        self.setWindowTitle("Estatísticas de Consultas")
+        self.resize(900, 550)
+        self.setStyleSheet(f"QDialog {{ background-color: {COLORS['light']}; }}")
+
+        self._setup_ui()
+        self.refresh_data()
+
+    def _setup_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(15)
+
+        # Header
+        header = QHBoxLayout()
+        icon = QLabel()
+        icon.setPixmap(
+            qta.icon("fa5s.tachometer-alt", color=COLORS["medium"]).pixmap(
+                QSize(28, 28)
+            )
+        )
+        lbl_title = QLabel("Consultas ao Banco de Dados")
+        lbl_title.setStyleSheet(
+            f"font-size: 18px; font-weight: bold; color: {COLORS['dark']};"
+        )
+        header.addWidget(icon)
+        header.addWidget(lbl_title)
+        header.addStretch()
+        layout.addLayout(header)
+
+        self.lbl_log = QLabel()
+        self.lbl_log.setStyleSheet(f"color: {COLORS['secondary']};")
+        self.lbl_log.setTextInteractionFlags(
+            Qt.TextInteractionFlag.TextSelectableByMouse
+        )
+        layout.addWidget(self.lbl_log)
+
+        # Tabela
+        self.table = QTableWidget()
+        self.table.setColumnCount(6)
+        self.table.setHorizontalHeaderLabels(
+            ["Consulta", "Chamadas", "Linhas", "Média (ms)", "Máx (ms)", "Latência"]
+        )
+        self.table.horizontalHeader().setSectionResizeMode(
+            0, QHeaderView.ResizeMode.Stretch
+        )
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setAlternatingRowColors(True)
+        layout.addWidget(self.table)
+
+        # Botões
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+
+        btn_reset = QPushButton(" Zerar")
+        btn_reset.setIcon(qta.icon("fa5s.eraser", color=COLORS["dark"]))
+        btn_reset.clicked.connect(self.reset_stats)
+
+        btn_refresh = QPushButton(" Atualizar")
+        btn_refresh.setIcon(qta.icon("fa5s.sync-alt", color=COLORS["dark"]))
+        btn_refresh.clicked.connect(self.refresh_data)
+
+        btn_close = QPushButton("Fechar")
+        btn_close.clicked.connect(self.accept)
+
+        btn_layout.addWidget(btn_reset)
+        btn_layout.addWidget(btn_refresh)
+        btn_layout.addWidget(btn_close)
+        layout.addLayout(btn_layout)
+
+    def refresh_data(self):
+        if not self.service.is_tracing_enabled():
+            self.lbl_log.setText(
+                "O rastreamento está desativado. Ative-o nas Configurações."
+            )
+        else:
+            self.lbl_log.setText(
+                f"Consultas lentas: {self.service.slow_query_log_path or '-'}"
+            )
+
+        stats = self.service.get_query_stats()
+        self.table.setRowCount(0)
+        for row, s in enumerate(stats):
+            self.table.insertRow(row)
+
+            sql_item = QTableWidgetItem(s.sql)
+            sql_item.setToolTip(s.sql)
+            self.table.setItem(row, 0, sql_item)
+            self.table.setItem(row, 1, self._number_item(str(s.calls)))
+            self.table.setItem(row, 2, self._number_item(str(s.rows)))
+            self.table.setItem(row, 3, self._number_item(f"{s.avg_ms:.2f}"))
+            self.table.setItem(row, 4, self._number_item(f"{s.max_ms:.2f}"))
+            self.table.setItem(row, 5, QTableWidgetItem(self._format_histogram(s)))
+
+    def reset_stats(self):
+        self.service.reset_query_stats()
+        self.refresh_data()
+
+    def _number_item(self, text):
+        item = QTableWidgetItem(text)
+        item.setTextAlignment(
+            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        )
+        return item
+
+    def _format_histogram(self, stats):
+        """Ex: '≤1ms: 40 | ≤5ms: 2 | >500ms: 1' (somente faixas não vazias)."""
+        labels = [f"≤{b:g}ms" for b in LATENCY_BUCKETS_MS]
+        labels.append(f">{LATENCY_BUCKETS_MS[-1]:g}ms")
+        return " | ".join(
+            f"{label}: {count}"
+            for label, count in zip(labels, stats.histogram)
+            if count
+        )
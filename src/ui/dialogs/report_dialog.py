@@ -25,8 +25,10 @@ from services.venue_service import VenueService
 from services.document_service import DocumentService
 from services.meeting_service import MeetingService
 from services.observation_service import ObservationService
+from services.intern_service import InternService
 
 from ui.styles import COLORS
+from ui.workers import ReadWorker
 
 
 class ReportDialog(QDialog):
@@ -41,6 +43,7 @@ class ReportDialog(QDialog):
         document_service: DocumentService,
         meeting_service: MeetingService,
         observation_service: ObservationService,
+        intern_service: InternService,
     ):
         super().__init__(parent)
         self.setWindowTitle(f"Gerar Relatório: {intern.name}")
@@ -55,6 +58,7 @@ class ReportDialog(QDialog):
         self.doc_service = document_service
         self.meeting_service = meeting_service
         self.obs_service = observation_service
+        self.intern_service = intern_service
 
         # Estilo
         self.setStyleSheet(f"""
@@ -176,21 +180,21 @@ class ReportDialog(QDialog):
             self.lbl_grades.setText("⚠️ Nenhuma nota lançada (Relatório sairá zerado)")
             self.lbl_grades.setStyleSheet(f"color: {COLORS['warning']};")
 
-        # 2. Documentos
-        docs = self.doc_service.get_documents_by_intern(intern_id)
-        # CORREÇÃO DE LÓGICA: Considera pendente tudo que não for "Aprovado"
-        pending = sum(1 for d in docs if d.status != "Aprovado")
+        # 2. Documentos e reuniões: contadores do resumo (pendente = não "Aprovado")
+        summary = self.intern_service.get_summary(intern_id)
+        pending = summary.pending_docs if summary else 0
+        total_docs = summary.total_docs if summary else 0
 
         if pending > 0:
             self.lbl_docs.setText(f"⚠️ {pending} Documentos pendentes de aprovação")
             self.lbl_docs.setStyleSheet(f"color: {COLORS['warning']};")
         else:
-            self.lbl_docs.setText(f"✅ {len(docs)} Documentos verificados")
+            self.lbl_docs.setText(f"✅ {total_docs} Documentos verificados")
             self.lbl_docs.setStyleSheet(f"color: {COLORS['success']};")
 
         # 3. Meetings
-        meetings = self.meeting_service.get_meetings_by_intern(intern_id)
-        self.lbl_meetings.setText(f"📅 {len(meetings)} Registros de supervisão")
+        total_meetings = summary.total_meetings if summary else 0
+        self.lbl_meetings.setText(f"📅 {total_meetings} Registros de supervisão")
 
     def generate_report(self):
         if self.intern.intern_id is None:
@@ -217,34 +221,44 @@ class ReportDialog(QDialog):
         QTimer.singleShot(100, lambda: self._process_generation(path))
 
     def _process_generation(self, path):
-        try:
-            if self.intern.intern_id is None:
-                raise ValueError("ID do aluno inválido.")
-
-            intern_id = self.intern.intern_id
-            self.progress.setValue(40)
-
-            venue = None
-            if self.intern.venue_id:
-                venue = self.venue_service.get_by_id(self.intern.venue_id)
+        if self.intern.intern_id is None:
+            self._on_generation_failed("ID do aluno inválido.")
+            return
 
-            all_criteria = self.criteria_service.list_active_criteria()
-            grades = self.grade_service.get_grades_by_intern(intern_id)
-            documents = self.doc_service.get_documents_by_intern(intern_id)
-            meetings = self.meeting_service.get_meetings_by_intern(intern_id)
-            observations = self.obs_service.get_observations_by_intern(intern_id)
+        self.progress.setValue(40)
 
+        # As consultas rodam numa conexão de leitura, fora da thread da interface
+        self._worker = ReadWorker(
+            self.grade_service.reader, self._load_report_data, self.intern.intern_id
+        )
+        self._worker.signals.finished.connect(
+            lambda data: self._render_report(path, data)
+        )
+        self._worker.signals.failed.connect(self._on_generation_failed)
+        self._worker.start()
+
+    def _load_report_data(self, intern_id: int) -> dict:
+        venue = None
+        if self.intern.venue_id:
+            venue = self.venue_service.get_by_id(self.intern.venue_id)
+
+        return {
+            "venue": venue,
+            "criteria_list": self.criteria_service.list_active_criteria(),
+            "grades": self.grade_service.get_grades_by_intern(intern_id),
+            "documents": self.doc_service.get_documents_by_intern(intern_id),
+            "meetings": self.meeting_service.get_meetings_by_intern(intern_id),
+            "observations": self.obs_service.get_observations_by_intern(intern_id),
+        }
+
+    def _render_report(self, path, data):
+        try:
             self.progress.setValue(70)
 
             self.report_service.generate_pdf(
                 filepath=path,
                 intern=self.intern,
-                venue=venue,
-                criteria_list=all_criteria,
-                grades=grades,
-                documents=documents,
-                meetings=meetings,
-                observations=observations,
+                **data,
             )
 
             self.progress.setValue(100)
@@ -262,9 +276,12 @@ class ReportDialog(QDialog):
             self.accept()
 
         except Exception as e:
-            self.progress.setVisible(False)
-            self.btn_generate.setEnabled(True)
-            self.btn_generate.setText("Tentar Novamente")
-            QMessageBox.critical(
-                self, "Erro Fatal", f"Não foi possível gerar o PDF.\nErro: {e}"
-            )
+            self._on_generation_failed(str(e))
+
+    def _on_generation_failed(self, message):
+        self.progress.setVisible(False)
+        self.btn_generate.setEnabled(True)
+        self.btn_generate.setText("Tentar Novamente")
+        QMessageBox.critical(
+            self, "Erro Fatal", f"Não foi possível gerar o PDF.\nErro: {message}"
+        )
@@ -9,10 +9,16 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QFileDialog,
     QLabel,
+    QCheckBox,
+    QProgressBar,
+    QInputDialog,
 )
+from pathlib import Path
 from PySide6.QtCore import Qt, QSettings, QSize
 import qtawesome as qta
 from ui.styles import COLORS
+from ui.dialogs.query_stats_dialog import QueryStatsDialog
+from ui.workers import ReadWorker
 
 
 class SettingsDialog(QDialog):
@@ -21,12 +27,25 @@ class SettingsDialog(QDialog):
     """
 
     # ADICIONADO: export_service no __init__
-    def __init__(self, parent=None, export_service=None):
+    def __init__(
+        self,
+        parent=None,
+        export_service=None,
+        diagnostics_service=None,
+        backup_service=None,
+        archive_service=None,
+    ):
         super().__init__(parent)
         self.export_service = export_service  # Guarda a referência
+        self.diagnostics_service = diagnostics_service
+        self.backup_service = backup_service
+        self.archive_service = archive_service
+        self.data_restored = False
+        self.data_archived = False
+        self._backup_worker = None
 
         self.setWindowTitle("Configurações do Sistema")
-        self.resize(550, 500)  # Aumentei um pouco a altura
+        self.resize(550, 720)  # Aumentei um pouco a altura
 
         # Estilo
         self.setStyleSheet(f"""
@@ -143,20 +162,82 @@ class SettingsDialog(QDialog):
             self.btn_export.setText("Exportar (Serviço indisponível)")
 
         data_layout.addWidget(self.btn_export)
+
+        backup_buttons = QHBoxLayout()
+        self.btn_backup = QPushButton(" Criar Backup Agora")
+        self.btn_backup.setIcon(qta.icon("fa5s.database", color=COLORS["dark"]))
+        self.btn_backup.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.btn_backup.clicked.connect(self.create_backup)
+
+        self.btn_restore = QPushButton(" Restaurar Backup...")
+        self.btn_restore.setIcon(qta.icon("fa5s.history", color=COLORS["dark"]))
+        self.btn_restore.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.btn_restore.clicked.connect(self.restore_backup)
+
+        backup_buttons.addWidget(self.btn_backup)
+        backup_buttons.addWidget(self.btn_restore)
+        data_layout.addLayout(backup_buttons)
+
+        self.backup_progress = QProgressBar()
+        self.backup_progress.setVisible(False)
+        data_layout.addWidget(self.backup_progress)
+
+        self.lbl_last_backup = QLabel()
+        self.lbl_last_backup.setStyleSheet(
+            f"color: {COLORS['secondary']}; font-weight: normal;"
+        )
+        data_layout.addWidget(self.lbl_last_backup)
+
+        self.btn_archive = QPushButton(" Arquivar Período Encerrado...")
+        self.btn_archive.setIcon(qta.icon("fa5s.archive", color=COLORS["dark"]))
+        self.btn_archive.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.btn_archive.clicked.connect(self.archive_term)
+        data_layout.addWidget(self.btn_archive)
+
+        if not self.backup_service:
+            self.btn_backup.setEnabled(False)
+            self.btn_restore.setEnabled(False)
+        if not self.archive_service:
+            self.btn_archive.setEnabled(False)
         group_data.setLayout(data_layout)
         layout.addWidget(group_data)
 
+        # --- Grupo 3: Diagnóstico ---
+        group_diag = QGroupBox("Diagnóstico")
+        diag_layout = QVBoxLayout()
+
+        self.chk_tracing = QCheckBox(
+            "Registrar estatísticas de consultas (e log de consultas lentas)"
+        )
+        self.chk_tracing.toggled.connect(self.toggle_tracing)
+        diag_layout.addWidget(self.chk_tracing)
+
+        self.btn_query_stats = QPushButton(" Ver Estatísticas de Consultas")
+        self.btn_query_stats.setIcon(
+            qta.icon("fa5s.tachometer-alt", color=COLORS["dark"])
+        )
+        self.btn_query_stats.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.btn_query_stats.clicked.connect(self.open_query_stats)
+        diag_layout.addWidget(self.btn_query_stats)
+
+        if not self.diagnostics_service:
+            self.chk_tracing.setEnabled(False)
+            self.btn_query_stats.setEnabled(False)
+
+        group_diag.setLayout(diag_layout)
+        layout.addWidget(group_diag)
+
         layout.addStretch()
 
         # Botões Rodapé
         btn_layout = QHBoxLayout()
         btn_layout.addStretch()
 
-        btn_cancel = QPushButton("Cancelar")
-        btn_cancel.setStyleSheet(
+        self.btn_cancel = QPushButton("Cancelar")
+        self.btn_cancel.setStyleSheet(
             f"background: transparent; color: {COLORS['secondary']}; border: none;"
         )
-        btn_cancel.clicked.connect(self.reject)
+        self.btn_cancel.clicked.connect(self.reject)
 
         self.btn_save = QPushButton(" Salvar Configurações")
         self.btn_save.setIcon(qta.icon("fa5s.save", color="white"))
@@ -170,7 +251,7 @@ class SettingsDialog(QDialog):
         """)
         self.btn_save.clicked.connect(self.save_settings)
 
-        btn_layout.addWidget(btn_cancel)
+        btn_layout.addWidget(self.btn_cancel)
         btn_layout.addWidget(self.btn_save)
         layout.addLayout(btn_layout)
 
@@ -190,16 +271,169 @@ class SettingsDialog(QDialog):
         )
         self.txt_city.setText(str(self.settings.value("city_state", "") or ""))
         self.txt_logo_path.setText(str(self.settings.value("logo_path", "") or ""))
+        self._update_last_backup_label()
+        if self.diagnostics_service:
+            self.chk_tracing.blockSignals(True)
+            self.chk_tracing.setChecked(self.diagnostics_service.is_tracing_enabled())
+            self.chk_tracing.blockSignals(False)
 
     def save_settings(self):
         self.settings.setValue("institution_name", self.txt_institution.text().strip())
         self.settings.setValue("coordinator_name", self.txt_supervisor.text().strip())
         self.settings.setValue("city_state", self.txt_city.text().strip())
         self.settings.setValue("logo_path", self.txt_logo_path.text().strip())
+        self.settings.setValue("query_tracing", self.chk_tracing.isChecked())
 
         QMessageBox.information(self, "Salvo", "Configurações atualizadas com sucesso!")
         self.accept()
 
+    def toggle_tracing(self, enabled):
+        if self.diagnostics_service:
+            self.diagnostics_service.set_tracing_enabled(enabled)
+
+    def open_query_stats(self):
+        if self.diagnostics_service:
+            QueryStatsDialog(self, self.diagnostics_service).exec()
+
+    def create_backup(self):
+        """Takes a snapshot in a background thread, reporting progress."""
+        if not self.backup_service or self._backup_worker:
+            return
+        self._start_snapshot(self._on_backup_finished)
+
+    def _start_snapshot(self, on_finished, keep_also=None):
+        """Runs `create_snapshot` in a worker; the UI stays responsive."""
+        self._set_backup_running(True)
+
+        worker = ReadWorker(
+            self.backup_service.reader,
+            self.backup_service.create_snapshot,
+            keep_also=keep_also,
+        )
+        worker.kwargs["on_progress"] = worker.signals.progress.emit
+        worker.signals.progress.connect(self._on_backup_progress)
+        worker.signals.finished.connect(on_finished)
+        worker.signals.failed.connect(self._on_backup_failed)
+        self._backup_worker = worker
+        worker.start()
+
+    def _on_backup_progress(self, done, total):
+        self.backup_progress.setMaximum(max(total, 1))
+        self.backup_progress.setValue(done)
+
+    def _on_backup_finished(self, path):
+        self._set_backup_running(False)
+        QMessageBox.information(self, "Backup", f"Backup criado em:\n{path}")
+
+    def _on_backup_failed(self, message):
+        self._set_backup_running(False)
+        QMessageBox.critical(self, "Erro", f"Falha ao criar o backup:\n{message}")
+
+    def _set_backup_running(self, running):
+        if not running:
+            self._backup_worker = None
+        self.backup_progress.setValue(0)
+        self.backup_progress.setVisible(running)
+        for btn in (self.btn_backup, self.btn_restore, self.btn_cancel, self.btn_save):
+            btn.setEnabled(not running)
+        self._update_last_backup_label()
+
+    def restore_backup(self):
+        if not self.backup_service or self._backup_worker:
+            return
+
+        path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Restaurar Backup",
+            str(self.backup_service.backup_dir),
+            "Backups (*.db)",
+        )
+        if not path:
+            return
+
+        confirm = QMessageBox.question(
+            self,
+            "Restaurar Backup",
+            "Todos os dados atuais serão substituídos pelo backup selecionado.\n"
+            "Um backup do estado atual será criado antes. Deseja continuar?",
+        )
+        if confirm != QMessageBox.StandardButton.Yes:
+            return
+
+        # O backup de segurança roda em segundo plano; só a cópia final
+        # (rápida, feita na conexão de escrita) acontece na thread da interface.
+        snapshot = Path(path)
+        self._start_snapshot(
+            lambda safety: self._finish_restore(snapshot, safety),
+            keep_also=snapshot,
+        )
+
+    def _finish_restore(self, snapshot, safety):
+        self._set_backup_running(False)
+        try:
+            self.backup_service.restore_snapshot(snapshot)
+            self.data_restored = True
+            QMessageBox.information(
+                self,
+                "Sucesso",
+                f"Backup restaurado.\nEstado anterior salvo em:\n{safety}",
+            )
+        except Exception as e:
+            QMessageBox.critical(self, "Erro", f"Falha ao restaurar:\n{e}")
+
+    def _update_last_backup_label(self):
+        if not self.backup_service:
+            return
+        snapshots = self.backup_service.list_snapshots()
+        self.lbl_last_backup.setText(
+            f"Último backup: {snapshots[0].name}" if snapshots else "Nenhum backup."
+        )
+
+    def archive_term(self):
+        if not self.archive_service:
+            return
+
+        terms = self.archive_service.get_archivable_terms()
+        if not terms:
+            QMessageBox.information(
+                self, "Arquivar", "Nenhum período encerrado para arquivar."
+            )
+            return
+
+        term, ok = QInputDialog.getItem(
+            self, "Arquivar Período", "Período encerrado:", terms, 0, False
+        )
+        if not ok:
+            return
+
+        confirm = QMessageBox.question(
+            self,
+            "Arquivar Período",
+            f"Mover os alunos do período {term} (com documentos, reuniões, notas "
+            "e observações) para o arquivo histórico?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+        )
+        if confirm != QMessageBox.StandardButton.Yes:
+            return
+
+        try:
+            count = self.archive_service.archive_term(term)
+            self.data_archived = True
+            QMessageBox.information(
+                self, "Sucesso", f"{count} aluno(s) do período {term} arquivados."
+            )
+        except Exception as e:
+            QMessageBox.critical(self, "Erro", f"Falha ao arquivar:\n{e}")
+
+    def done(self, result):
+        # O worker de backup referencia este diálogo; espera ele terminar.
+        if self._backup_worker:
+            QMessageBox.information(
+                self, "Backup", "Aguarde o término do backup para fechar a janela."
+            )
+            return
+        super().done(result)
+
     def export_data(self):
         if not self.export_service:
             return
@@ -23,6 +23,8 @@ from PySide6.QtWidgets import (
     QMenu,
 )
 from PySide6.QtCore import Qt
+from bisect import bisect_left
+from typing import Dict, List, Optional
 from PySide6.QtGui import QColor, QPalette
 import qtawesome as qta
 
@@ -36,6 +38,9 @@ from services.grade_service import GradeService
 from services.import_service import ImportService
 from services.observation_service import ObservationService
 from services.report_service import ReportService
+from core.models.data_change import DataChange
+from core.models.intern_filter import InternFilter
+from core.models.intern_row import InternRow
 
 # Dialogs
 from ui.dialogs.intern_dialog import InternDialog
@@ -54,6 +59,20 @@ from ui.delegates import StatusDelegate
 from ui.venue_view import VenueView
 from ui.criteria_view import CriteriaView
 
+# Sidebar row of each page and the tables its content is built from.
+PAGE_DASHBOARD, PAGE_INTERNS, PAGE_VENUES, PAGE_CRITERIA = range(4)
+
+# Interns loaded into the main table per page; more pages are fetched as the
+# user scrolls near the end of the table.
+INTERN_PAGE_SIZE = 200
+SCROLL_PREFETCH_ROWS = 20
+PAGE_TABLES = {
+    PAGE_DASHBOARD: {"interns", "documents", "meetings", "venues"},
+    PAGE_INTERNS: {"interns", "venues"},
+    PAGE_VENUES: {"venues"},
+    PAGE_CRITERIA: {"evaluation_criteria"},
+}
+
 
 class MainWindow(QMainWindow):
     """Main application window, orchestrating all UI components and views."""
@@ -70,6 +89,10 @@ class MainWindow(QMainWindow):
         report_service: ReportService,
         import_service: ImportService,
         export_service=None,
+        diagnostics_service=None,
+        backup_service=None,
+        change_feed_service=None,
+        archive_service=None,
     ):
         """Initializes services, window properties, and the main UI."""
         super().__init__()
@@ -83,6 +106,12 @@ class MainWindow(QMainWindow):
         self.report_service = report_service
         self.import_service = import_service
         self.export_service = export_service
+        self.diagnostics_service = diagnostics_service
+        self.backup_service = backup_service
+        self.change_feed_service = change_feed_service
+        self.archive_service = archive_service
+        # Change feed position each page was last built at.
+        self._page_seq: Dict[int, int] = {}
 
         self.setWindowTitle("InternManager Pro 2026")
         self.setMinimumSize(1280, 800)
@@ -125,6 +154,12 @@ class MainWindow(QMainWindow):
             }}
         """)
 
+        # Keyset pagination state of the main table (see load_data).
+        self._filters = InternFilter()
+        self._loaded_rows: List[InternRow] = []
+        self._last_loaded_row: Optional[InternRow] = None
+        self._all_interns_loaded = False
+
         self._setup_ui()
         self.load_data()
 
@@ -260,6 +295,10 @@ class MainWindow(QMainWindow):
             f"font-size: 26px; font-weight: 800; color: {COLORS['dark']};"
         )
         header.addWidget(lbl)
+
+        self.lbl_count = QLabel()
+        self.lbl_count.setStyleSheet(f"font-size: 14px; color: {COLORS['secondary']};")
+        header.addWidget(self.lbl_count)
         header.addStretch()
 
         self.btn_add = QPushButton(" Novo Aluno")
@@ -346,6 +385,7 @@ class MainWindow(QMainWindow):
         # Use a custom delegate to render the 'Status' column
         self.table.setItemDelegateForColumn(4, StatusDelegate(self.table))
         self.table.doubleClicked.connect(self.open_edit_dialog)
+        self.table.verticalScrollBar().valueChanged.connect(self._on_table_scrolled)
 
         layout.addWidget(self.table)
 
@@ -405,47 +445,184 @@ class MainWindow(QMainWindow):
 
     # --- DATA LOGIC ---
     def load_data(self):
-        """Fetches all interns and populates the main table."""
-        interns = self.service.get_all_interns()
-        all_venues = self.venue_service.get_all()
-        venue_map = {v.venue_id: v.venue_name for v in all_venues}
+        """Rebuilds the main table with the first page of interns."""
+        self._mark_page_current(PAGE_INTERNS)
+        self._loaded_rows = []
+        self._last_loaded_row = None
+        self._all_interns_loaded = False
 
         self.table.setRowCount(0)
-        for row, intern in enumerate(interns):
-            self.table.insertRow(row)
-            self.table.setRowHeight(row, 50)
+        self._update_count()
+        self._load_next_intern_page()
 
-            self.table.setItem(row, 0, QTableWidgetItem(str(intern.intern_id)))
+    def _load_next_intern_page(self):
+        """Appends the next page of interns (keyset pagination) to the table."""
+        if self._all_interns_loaded:
+            return
+        intern_rows = self.service.list_intern_rows(
+            self._filters, after=self._last_loaded_row, limit=INTERN_PAGE_SIZE
+        )
+        row = self.table.rowCount()
+        self.table.setRowCount(row + len(intern_rows))
+        for intern_row in intern_rows:
+            self.table.setRowHeight(row, 50)
+            self._fill_row(row, intern_row)
+            row += 1
+
+        self._loaded_rows.extend(intern_rows)
+        if intern_rows:
+            self._last_loaded_row = intern_rows[-1]
+        self._all_interns_loaded = len(intern_rows) < INTERN_PAGE_SIZE
+
+    def _reload_from(self, index):
+        """
+        Drops the table rows from `index` on and loads them again.
+
+        The keyset cursor moves back to the last row kept, so the list order
+        is read again from there; at least as many rows as before are shown.
+        """
+        shown = len(self._loaded_rows)
+        del self._loaded_rows[index:]
+        self.table.setRowCount(index)
+        self._last_loaded_row = self._loaded_rows[-1] if self._loaded_rows else None
+        self._all_interns_loaded = False
+        while len(self._loaded_rows) < shown and not self._all_interns_loaded:
+            self._load_next_intern_page()
+
+    def _update_count(self):
+        self.lbl_count.setText(f"{self.service.count_interns(self._filters)} alunos")
+
+    def _on_table_scrolled(self, value):
+        scrollbar = self.table.verticalScrollBar()
+        if value >= scrollbar.maximum() - SCROLL_PREFETCH_ROWS:
+            self._load_next_intern_page()
+
+    def _fill_row(self, row, intern_row: InternRow):
+        """Writes one intern into a row of the main table."""
+        self.table.setItem(row, 0, QTableWidgetItem(str(intern_row.intern_id)))
+
+        name_item = QTableWidgetItem(intern_row.name)
+        font = name_item.font()
+        font.setBold(True)
+        name_item.setFont(font)
+        self.table.setItem(row, 1, name_item)
+
+        self.table.setItem(row, 2, QTableWidgetItem(intern_row.venue_name or "-"))
+        self.table.setItem(
+            row, 3, QTableWidgetItem(str(intern_row.registration_number or "-"))
+        )
+        self.table.setItem(row, 4, QTableWidgetItem(intern_row.status))
+
+    def _find_row(self, intern_id) -> Optional[int]:
+        """Returns the table row showing an intern, if any."""
+        for row, intern_row in enumerate(self._loaded_rows):
+            if intern_row.intern_id == intern_id:
+                return row
+        return None
+
+    def _mark_page_current(self, page):
+        """Records that a page was just rebuilt from the database."""
+        if self.change_feed_service:
+            self._page_seq[page] = self.change_feed_service.get_latest_sequence()
+
+    def _pending_changes(self, page) -> Optional[List[DataChange]]:
+        """
+        Returns the changes a page has not shown yet and marks them as seen.
+
+        None means the page must be rebuilt from scratch: there is no change
+        feed, the page was never built, or the feed no longer covers it.
+        """
+        if self.change_feed_service is None:
+            return None
+        since = self._page_seq.get(page)
+        if since is None:
+            return None
+        changes = self.change_feed_service.get_changes_since(since)
+        if changes is None:
+            return None
+        if changes:
+            self._page_seq[page] = changes[-1].seq
+        return [c for c in changes if c.table_name in PAGE_TABLES[page]]
+
+    def sync_interns(self):
+        """
+        Brings the main table up to date, touching only the changed rows.
+
+        Edited interns are rewritten in place and deleted ones removed. A
+        renamed intern changes places, so the table is reloaded from the first
+        row whose position may have changed. New interns, renamed venues and
+        edits under a search (which may move rows in or out of the result)
+        rebuild the table.
+        """
+        changes = self._pending_changes(PAGE_INTERNS)
+        if changes is None or any(
+            c.table_name == "venues" or c.operation == "I" for c in changes
+        ):
+            self.load_data()
+            return
+        if changes and self._filters.search:
+            self.load_data()
+            return
 
-            name_item = QTableWidgetItem(intern.name)
-            font = name_item.font()
-            font.setBold(True)
-            name_item.setFont(font)
-            self.table.setItem(row, 1, name_item)
+        reload_from = None
+        for change in changes:
+            row = self._find_row(change.row_id)
+            if row is None:
+                continue
+            intern_row = None
+            if change.operation == "U":
+                intern_row = self.service.get_intern_row(change.row_id)
+            if intern_row is None:
+                self.table.removeRow(row)
+                del self._loaded_rows[row]
+                if reload_from is not None and reload_from > row:
+                    reload_from -= 1
+                continue
+
+            if intern_row.name == self._loaded_rows[row].name:
+                self._loaded_rows[row] = intern_row
+                self._fill_row(row, intern_row)
+                continue
+            # Left as is until the reload, so `_loaded_rows` stays sorted.
+            keys = [r.list_key for r in self._loaded_rows]
+            first = min(row, bisect_left(keys, intern_row.list_key))
+            reload_from = first if reload_from is None else min(reload_from, first)
+
+        if reload_from is not None:
+            self._reload_from(reload_from)
+
+        if any(c.operation == "D" for c in changes):
+            self._update_count()
+
+    def refresh_page(self, page):
+        """
+        Refreshes a page if the tables it shows changed since it was built.
+
+        Args:
+            page (int): Sidebar row of the page.
+        """
+        if page == PAGE_INTERNS:
+            self.sync_interns()
+            return
 
-            self.table.setItem(
-                row, 2, QTableWidgetItem(venue_map.get(intern.venue_id, "-"))
-            )
-            self.table.setItem(
-                row, 3, QTableWidgetItem(str(intern.registration_number or "-"))
-            )
-            self.table.setItem(row, 4, QTableWidgetItem(intern.status))
+        if self._pending_changes(page) == []:
+            return
+        self._mark_page_current(page)
+        if page == PAGE_DASHBOARD:
+            self.page_dashboard.refresh_data()
+        elif page == PAGE_VENUES:
+            self.page_venues.refresh_data()
+        elif page == PAGE_CRITERIA:
+            self.page_criteria.refresh_data()
 
-        # Re-apply filter if it exists
-        if self.txt_search.text():
-            self.filter_table(self.txt_search.text())
+    def refresh_current_page(self):
+        """Applies pending changes to the visible page; others catch up when shown."""
+        self.refresh_page(self.content_stack.currentIndex())
 
     def filter_table(self, text):
-        """Hides or shows table rows based on the search text."""
-        search = text.lower().strip()
-        for row in range(self.table.rowCount()):
-            match = False
-            for col in [1, 2, 3]:  # Search name, venue, and registration number
-                item = self.table.item(row, col)
-                if item and search in item.text().lower():
-                    match = True
-                    break
-            self.table.setRowHidden(row, not match)
+        """Reloads the table with the interns matching the search text."""
+        self._filters = InternFilter(search=text.strip() or None)
+        self.load_data()
 
     def get_selected_intern(self):
         """Retrieves the intern object for the currently selected table row."""
@@ -468,8 +645,7 @@ class MainWindow(QMainWindow):
                 new_id = self.service.add_new_intern(d.get_data())
                 if new_id:
                     self.doc_service.create_initial_documents_batch(new_id)
-                self.load_data()
-                self.page_dashboard.refresh_data()
+                self.refresh_current_page()
                 QMessageBox.information(self, "Sucesso", "Aluno cadastrado!")
             except Exception as e:
                 QMessageBox.warning(self, "Erro", f"Erro: {e}")
@@ -494,7 +670,7 @@ class MainWindow(QMainWindow):
                 i.working_hours = data.working_hours
 
                 self.service.update_intern(i)
-                self.load_data()
+                self.refresh_current_page()
             except Exception as e:
                 QMessageBox.warning(self, "Erro", str(e))
 
@@ -513,8 +689,7 @@ class MainWindow(QMainWindow):
             == QMessageBox.StandardButton.Yes
         ):
             self.service.delete_intern(i)
-            self.load_data()
-            self.page_dashboard.refresh_data()
+            self.refresh_current_page()
 
     def open_grades_dialog(self):
         """Opens the grade management dialog for the selected intern."""
@@ -527,14 +702,14 @@ class MainWindow(QMainWindow):
         i = self.get_selected_intern()
         if i:
             DocumentDialog(self, i, self.doc_service).exec()
-            self.page_dashboard.refresh_data()
+            self.refresh_current_page()
 
     def open_meetings(self):
         """Opens the meeting management dialog for the selected intern."""
         i = self.get_selected_intern()
         if i:
             MeetingDialog(self, i, self.meeting_service).exec()
-            self.page_dashboard.refresh_data()
+            self.refresh_current_page()
 
     def open_observations(self):
         """Opens the observation dialog for the selected intern."""
@@ -544,7 +719,20 @@ class MainWindow(QMainWindow):
 
     def open_settings(self):
         """Opens the application settings dialog."""
-        SettingsDialog(self, export_service=self.export_service).exec()
+        dialog = SettingsDialog(
+            self,
+            export_service=self.export_service,
+            diagnostics_service=self.diagnostics_service,
+            backup_service=self.backup_service,
+            archive_service=self.archive_service,
+        )
+        dialog.exec()
+
+        if dialog.data_restored:
+            # The restored file has its own change history.
+            self._page_seq.clear()
+        if dialog.data_restored or dialog.data_archived:
+            self.refresh_current_page()
 
     def import_csv_dialog(self):
         # Filtro atualizado para aceitar Excel e CSV
@@ -560,8 +748,7 @@ class MainWindow(QMainWindow):
                 self.import_service.read_file(path)
 
                 # Atualiza a tela
-                self.load_data()
-                self.page_dashboard.refresh_data()
+                self.refresh_current_page()
 
                 QMessageBox.information(
                     self, "Sucesso", "Importação concluída com sucesso!"
@@ -585,6 +772,7 @@ class MainWindow(QMainWindow):
                 self.doc_service,
                 self.meeting_service,
                 self.obs_service,
+                self.service,
             ).exec()
 
     def open_batch_meeting(self):
@@ -592,7 +780,7 @@ class MainWindow(QMainWindow):
             self, self.service, self.meeting_service, self.venue_service
         )
         if d.exec():
-            self.page_dashboard.refresh_data()
+            self.refresh_current_page()
 
     # --- NAVIGATION ---
     def on_sidebar_changed(self, row):
@@ -601,14 +789,7 @@ class MainWindow(QMainWindow):
             self.content_stack.setCurrentIndex(row)
 
             # Lazy-load or refresh data for the selected page
-            if row == 0:  # Dashboard
-                self.page_dashboard.refresh_data()
-            elif row == 1:  # Alunos
-                self.load_data()
-            elif row == 2:  # Locais
-                self.page_venues.refresh_data()
-            elif row == 3:  # Critérios
-                self.page_criteria.refresh_data()
+            self.refresh_page(row)
 
     def _open_context_menu(self, pos):
         """Cria e exibe o menu de botão direito na tabela."""
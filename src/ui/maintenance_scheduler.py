@@ -0,0 +1,131 @@
+"""
+Runs database maintenance while the user is not interacting with the app.
+"""
+
+import threading
+from typing import Optional
+
+from PySide6.QtCore import QEvent, QObject, QTimer, Signal
+from PySide6.QtWidgets import QApplication
+
+from services.integrity_service import IntegrityService
+from services.maintenance_service import MaintenanceService
+from ui.workers import ReadWorker
+
+INPUT_EVENTS = {
+    QEvent.Type.KeyPress,
+    QEvent.Type.MouseButtonPress,
+    QEvent.Type.MouseMove,
+    QEvent.Type.Wheel,
+}
+
+
+class IdleMaintenanceScheduler(QObject):
+    """
+    Triggers `MaintenanceService.run` after a period without user input.
+
+    Every key press, click, mouse move or scroll anywhere in the application
+    restarts the idle timer, so maintenance (which uses the writer on the GUI
+    thread) only runs when nobody is waiting for the UI. It runs once per
+    idle period.
+
+    When it is due, the integrity check then runs in a background thread on a
+    reader connection. `integrity_progress(checked, total)` is emitted after
+    each table and `integrity_failed` with the problems found. Input does
+    not interrupt the check, `stop()` does.
+
+    Attributes:
+        service (MaintenanceService): The maintenance service.
+        integrity_service (Optional[IntegrityService]): The integrity check.
+        budget_ms (int): Time budget of each idle run.
+    """
+
+    integrity_failed = Signal(str)
+    integrity_progress = Signal(int, int)
+
+    def __init__(
+        self,
+        service: MaintenanceService,
+        idle_ms: int,
+        budget_ms: int,
+        parent: QObject | None = None,
+        integrity_service: Optional[IntegrityService] = None,
+    ):
+        super().__init__(parent)
+        self.service = service
+        self.integrity_service = integrity_service
+        self.budget_ms = budget_ms
+
+        self._integrity_worker: Optional[ReadWorker] = None
+        self._cancel_integrity = threading.Event()
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(idle_ms)
+        self.timer.timeout.connect(self._on_idle)
+
+        app = QApplication.instance()
+        if app:
+            app.installEventFilter(self)
+        self.timer.start()
+
+    def eventFilter(self, watched, event):
+        if event.type() in INPUT_EVENTS:
+            self.timer.start()
+        return False
+
+    def stop(self):
+        """Stops watching for idle periods (e.g. before closing the database)."""
+        self.timer.stop()
+        self._cancel_integrity.set()
+        app = QApplication.instance()
+        if app:
+            app.removeEventFilter(self)
+
+    def _on_idle(self):
+        try:
+            for run in self.service.run(self.budget_ms):
+                print(f"   -> Manutenção '{run.task}': {run.result}")
+        except Exception as e:
+            print(f"WARNING: Idle maintenance failed. Details: {e}")
+        self._start_integrity_check()
+
+    def _start_integrity_check(self):
+        if self.integrity_service is None or self._integrity_worker is not None:
+            return
+        try:
+            if not self.integrity_service.is_due():
+                return
+        except Exception as e:
+            print(f"WARNING: Integrity check skipped. Details: {e}")
+            return
+
+        self._cancel_integrity.clear()
+        worker = ReadWorker(
+            self.integrity_service.reader,
+            self.integrity_service.check,
+            is_cancelled=self._cancel_integrity.is_set,
+        )
+        worker.kwargs["on_progress"] = worker.signals.progress.emit
+        worker.signals.progress.connect(self.integrity_progress)
+        worker.signals.finished.connect(self._on_integrity_checked)
+        worker.signals.failed.connect(self._on_integrity_error)
+        self._integrity_worker = worker
+        worker.start()
+
+    def _on_integrity_checked(self, run):
+        self._integrity_worker = None
+        if run is None or self._cancel_integrity.is_set():
+            return
+        print(f"   -> Verificação de integridade: {run.result}")
+        try:
+            healthy = self.integrity_service.record(run)
+        except Exception as e:
+            print(f"WARNING: Integrity check not recorded. Details: {e}")
+            return
+        if not healthy:
+            self.integrity_failed.emit(run.result)
+
+    def _on_integrity_error(self, message: str):
+        self._integrity_worker = None
+        print(f"WARNING: Integrity check failed. Details: {message}")
@@ -0,0 +1,67 @@
+"""
+Background workers for read-heavy work that must not block the Qt event loop.
+"""
+
+from typing import Any, Callable, ContextManager
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class WorkerSignals(QObject):
+    """
+    Signals emitted by `ReadWorker`, delivered on the GUI thread.
+
+    `progress(done, total)` is never emitted by the worker itself; long tasks
+    can report through it by receiving `signals.progress.emit` as a callback.
+    """
+
+    finished = Signal(object)
+    failed = Signal(str)
+    progress = Signal(int, int)
+
+
+class ReadWorker(QRunnable):
+    """
+    Runs a read-only callable on a pooled reader connection.
+
+    The callable runs in a `QThreadPool` thread inside `context` (normally a
+    service's `reader()`), so every repository query it issues uses a
+    read-only connection instead of the GUI thread's writer. The result (or
+    the error message) is delivered through `signals`.
+
+    Example:
+        worker = ReadWorker(service.reader, service.get_all)
+        worker.signals.finished.connect(self._on_loaded)
+        worker.start()
+    """
+
+    def __init__(
+        self,
+        context: Callable[[], ContextManager[Any]],
+        fn: Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ):
+        super().__init__()
+        self.context = context
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+        # The caller keeps a reference until a signal arrives; letting Qt
+        # delete the runnable would also destroy `signals` too early.
+        self.setAutoDelete(False)
+
+    def run(self):
+        try:
+            with self.context():
+                result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(result)
+
+    def start(self):
+        """Queues the worker on the global thread pool."""
+        QThreadPool.globalInstance().start(self)
@@ -47,5 +47,6 @@ def seed_default_criteria(service: EvaluationCriteriaService):
         ),
     ]
 
-    for criteria in defaults:
-        service.add_new_criteria(criteria)
+    with service.transaction():
+        for criteria in defaults:
+            service.add_new_criteria(criteria)
@@ -0,0 +1,40 @@
+import re
+import unicodedata
+
+WORD_REGEX = re.compile(r"\w+")
+
+
+def to_fts_query(text: str) -> str:
+    """
+    Converts free text typed by the user into an FTS5 MATCH expression.
+
+    Every word becomes a quoted prefix term, so FTS5 operators and
+    punctuation in the input are never interpreted, and all words must match
+    (`estágio rel` -> `"estágio"* "rel"*`).
+
+    Args:
+        text (str): The search text.
+
+    Returns:
+        str: The MATCH expression, or an empty string if the text has no words.
+    """
+    return " ".join(f'"{word}"*' for word in WORD_REGEX.findall(text))
+
+
+def normalize_name(name: str) -> str:
+    """
+    Reduces a person or venue name to the key used to match names.
+
+    Accents are stripped, the text is casefolded and runs of whitespace are
+    collapsed, so `"  José  da SILVA"` and `"jose da silva"` have the same key.
+    The repositories store this key (`normalized_name`) and index it.
+
+    Args:
+        name (str): The name as typed or imported.
+
+    Returns:
+        str: The normalized key.
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.casefold().split())
@@ -0,0 +1,83 @@
+from datetime import date
+
+import pytest
+
+from data.database import DatabaseConnector
+from repository.document_repo import DocumentRepository
+from repository.meeting_repo import MeetingRepository
+from services.document_service import DocumentService
+from services.meeting_service import MeetingService
+
+
+@pytest.fixture
+def db():
+    db = DatabaseConnector(db_path=":memory:")
+    db.executemany(
+        "INSERT INTO interns (intern_id, name, registration_number, term) "
+        "VALUES (?, ?, ?, 't')",
+        [(1, "Ana", "1"), (2, "Bia", "2"), (3, "Caio", "3")],
+    )
+    db.executemany(
+        "INSERT INTO documents (intern_id, document_name, status) VALUES (?, ?, ?)",
+        [
+            (1, "Contrato de Estágio", "Aprovado"),
+            (1, "Avaliação do Supervisor Local - Física", "Pendente"),
+            (2, "Contrato de Estágio", "Pendente"),
+            (2, "Avaliação do Supervisor Local - Carreiras", "Aprovado"),
+        ],
+    )
+    db.executemany(
+        "INSERT INTO meetings (intern_id, meeting_date, is_intern_present) "
+        "VALUES (1, ?, 1)",
+        [("2026-02-28",), ("2026-03-01",), ("2026-03-31",), ("2025-03-15",)],
+    )
+    yield db
+    db.close()
+
+
+def test_document_aggregates(db):
+    service = DocumentService(DocumentRepository(db))
+
+    assert service.get_status_histogram() == {
+        "Avaliação do Supervisor Local - Carreiras": {"Aprovado": 1},
+        "Avaliação do Supervisor Local - Física": {"Pendente": 1},
+        "Contrato de Estágio": {"Aprovado": 1, "Pendente": 1},
+    }
+    assert service.count_pending_by_intern() == {1: 1, 2: 1}
+
+
+@pytest.mark.parametrize(
+    "name_filter, expected",
+    [
+        ("contrato", (1, 2)),
+        # Case-insensitive, accents included; either evaluation counts.
+        ("AVALIAÇÃO DO SUPERVISOR", (1, 2)),
+        ("Diário de Campo", (0, 3)),
+    ],
+)
+def test_interns_by_document(db, name_filter, expected):
+    service = DocumentService(DocumentRepository(db))
+    assert service.count_interns_by_document(name_filter) == expected
+
+
+def test_meetings_in_month(db):
+    service = MeetingService(MeetingRepository(db))
+    assert service.count_meetings_in_month(date(2026, 3, 17)) == 2
+    assert service.count_meetings_in_month(date(2026, 12, 1)) == 0
+
+
+def test_group_meeting_is_one_insert(db):
+    service = MeetingService(MeetingRepository(db))
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+    ids = service.add_meetings_for_interns([1, 2, 3], "15/04/2026")
+    db.conn.set_trace_callback(None)
+
+    # The trace repeats a statement for each trigger it fires.
+    inserts = {s for s in statements if s.lstrip().startswith("INSERT INTO meetings")}
+    assert len(inserts) == 1
+    assert len(ids) == 3
+    assert service.count_meetings_in_month(date(2026, 4, 1)) == 3
+
+    with pytest.raises(ValueError):
+        service.add_meetings_for_interns([], "15/04/2026")
@@ -0,0 +1,121 @@
+import sqlite3
+from datetime import date
+
+import pytest
+
+from data.database import DatabaseConnector
+from repository.archive_repo import ArchiveRepository
+from services.archive_service import ArchiveService
+
+
+@pytest.fixture
+def db(tmp_path):
+    connector = DatabaseConnector(db_path=tmp_path / "interns.db")
+    yield connector
+    connector.close()
+
+
+@pytest.fixture
+def service(db, tmp_path):
+    return ArchiveService(ArchiveRepository(db), archive_dir=tmp_path / "archives")
+
+
+def add_intern(db, registration_number, term, end_date):
+    venue_id = db.execute("INSERT INTO venues (venue_name) VALUES ('Local')").lastrowid
+    criteria_id = db.execute(
+        "INSERT INTO evaluation_criteria (name) VALUES ('Pontualidade')"
+    ).lastrowid
+    intern_id = db.execute(
+        "INSERT INTO interns (name, registration_number, term, end_date, venue_id) "
+        "VALUES ('Aluno', ?, ?, ?, ?)",
+        (registration_number, term, end_date, venue_id),
+    ).lastrowid
+    db.execute(
+        "INSERT INTO documents (intern_id, document_name) VALUES (?, 'TCE')",
+        (intern_id,),
+    )
+    db.execute(
+        "INSERT INTO grades (intern_id, criteria_id, value) VALUES (?, ?, 1.0)",
+        (intern_id, criteria_id),
+    )
+    db.commit()
+    return intern_id
+
+
+def count(db, table):
+    return db.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_only_ended_terms_are_archivable(db, service):
+    add_intern(db, "RA1", "2024/1", "2024-06-30")
+    add_intern(db, "RA2", "2099/1", "2099-06-30")
+    add_intern(db, "RA3", "2025/1", None)
+
+    assert service.get_archivable_terms() == ["2024/1"]
+    with pytest.raises(ValueError):
+        service.archive_term("2099/1")
+
+
+def test_archive_moves_the_term_with_its_records(db, service):
+    archived_id = add_intern(db, "RA1", "2024/1", "2024-06-30")
+    add_intern(db, "RA2", "2099/1", "2099-06-30")
+
+    assert service.archive_term("2024/1") == 1
+
+    assert count(db, "interns") == 1
+    assert count(db, "documents") == 1
+    assert count(db, "grades") == 1
+    assert service.get_archived_terms() == ["2024/1"]
+
+    interns = service.get_archived_interns("2024/1")
+    assert [i.intern_id for i in interns] == [archived_id]
+    with service.attached("2024/1") as alias:
+        assert count(db, f"{alias}.documents") == 1
+        assert count(db, f"{alias}.grades") == 1
+
+    # The archive is detached again.
+    databases = [row["name"] for row in db.execute("PRAGMA database_list")]
+    assert databases == ["main"]
+
+
+def test_archives_are_readable_from_worker_connections(db, service):
+    add_intern(db, "RA1", "2024/1", "2024-06-30")
+    service.archive_term("2024/1")
+
+    with db.reader():
+        assert len(service.get_archived_interns("2024/1")) == 1
+
+
+def test_missing_archive(service):
+    with pytest.raises(FileNotFoundError):
+        service.get_archived_interns("1999/1")
+
+
+def test_internship_ending_today_is_archivable(db, service):
+    # Same rule as the 'Concluído' status of the list.
+    add_intern(db, "RA1", "2024/2", date.today().isoformat())
+    add_intern(db, "RA2", "2024/3", "30/06/2024")  # Not ISO: 'Ativo'
+
+    assert service.get_archivable_terms() == ["2024/2"]
+    assert service.archive_term("2024/2") == 1
+
+
+def test_interrupted_archive_can_be_completed(db, service, monkeypatch):
+    add_intern(db, "RA1", "2024/1", "2024-06-30")
+
+    def fail(alias, term):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    # The copy is committed to the archive, the delete fails.
+    monkeypatch.setattr(service.repo, "delete_archived", fail)
+    with pytest.raises(sqlite3.OperationalError):
+        service.archive_term("2024/1")
+    assert count(db, "interns") == 1
+    assert len(service.get_archived_interns("2024/1")) == 1
+
+    monkeypatch.undo()
+    assert service.archive_term("2024/1") == 1
+    assert count(db, "interns") == 0
+    with service.attached("2024/1") as alias:
+        assert count(db, f"{alias}.interns") == 1
+        assert count(db, f"{alias}.documents") == 1
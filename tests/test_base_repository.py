@@ -0,0 +1,132 @@
+import pytest
+
+from core.models.document import Document
+from core.models.intern import Intern
+from core.models.meeting import Meeting
+from core.models.venue import Venue
+from data.database import DatabaseConnector
+from repository import base_repo
+from repository.document_repo import DocumentRepository
+from repository.intern_repo import InternRepository
+from repository.meeting_repo import MeetingRepository
+from repository.venue_repo import VenueRepository
+
+
+@pytest.fixture
+def db():
+    connector = DatabaseConnector(db_path=":memory:")
+    yield connector
+    connector.close()
+
+
+def test_statements_are_generated_from_the_mapping():
+    assert MeetingRepository.select_sql == (
+        "SELECT meeting_id, intern_id, meeting_date, is_intern_present FROM meetings"
+    )
+    assert VenueRepository._insert_sql.startswith(
+        "INSERT INTO venues (venue_name, address, "
+    )
+    assert "last_update = strftime(" in VenueRepository._update_sql
+    assert MeetingRepository._delete_sql == (
+        "DELETE FROM meetings WHERE meeting_id = ?"
+    )
+    # The owner of a child row is set on insert only.
+    assert "intern_id" in DocumentRepository._insert_sql
+    assert "intern_id" not in DocumentRepository._update_sql
+
+
+def test_crud_round_trip_maps_renamed_and_converted_columns(db):
+    venues = VenueRepository(db)
+    venue_id = venues.save(Venue(venue_name="Hospital", venue_address="Rua A"))
+
+    venue = venues.get_by_id(venue_id)
+    assert venue == Venue(
+        venue_name="Hospital", venue_id=venue_id, venue_address="Rua A"
+    )
+
+    venue.venue_address = "Rua B"
+    assert venues.update(venue)
+    assert venues.get_all() == [venue]
+
+    interns = InternRepository(db)
+    intern_id = interns.save(Intern(name="Ana", registration_number="1", term="2026.1"))
+    meetings = MeetingRepository(db)
+    meetings.save(
+        Meeting(intern_id=intern_id, meeting_date="2026-03-01", is_intern_present=1)
+    )
+
+    (meeting,) = meetings.get_by_intern_id(intern_id)
+    assert meeting.is_intern_present is True
+
+    assert meetings.delete(meeting)
+    assert meetings.get_all() == []
+
+
+def test_writes_check_the_id(db):
+    venues = VenueRepository(db)
+    with pytest.raises(ValueError, match="already has an ID"):
+        venues.save(Venue(venue_name="X", venue_id=1))
+    with pytest.raises(ValueError, match="without an ID"):
+        venues.update(Venue(venue_name="X"))
+    with pytest.raises(ValueError, match="without an ID"):
+        venues.delete(Venue(venue_name="X"))
+
+
+def test_children_of_many_interns_load_in_one_query(db):
+    interns = InternRepository(db)
+    first = interns.save(Intern(name="Ana", registration_number="1", term="2026.1"))
+    second = interns.save(Intern(name="Bia", registration_number="2", term="2026.1"))
+    documents = DocumentRepository(db)
+    documents.create_batch(
+        [
+            Document(intern_id=first, document_name="TCE"),
+            Document(intern_id=first, document_name="Plano"),
+        ]
+    )
+
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+    grouped = documents.get_by_intern_ids([first, second, 999])
+    db.conn.set_trace_callback(None)
+
+    assert len(statements) == 1
+    assert [d.document_name for d in grouped[first]] == ["TCE", "Plano"]
+    assert grouped[second] == [] and grouped[999] == []
+    assert documents.get_by_intern_ids([]) == {}
+
+
+def test_iter_all_streams_in_batches(db):
+    db.executemany(
+        "INSERT INTO interns (name, registration_number, term) VALUES (?, ?, 't')",
+        [(f"Aluno {i:03}", str(i)) for i in range(250)],
+    )
+    interns = InternRepository(db)
+
+    stream = interns.iter_all(batch_size=100)
+    first = next(stream)
+
+    assert first == interns.get_all()[0]
+    assert list(stream) == interns.get_all()[1:]
+
+
+def test_save_many_returns_ids_in_order(db, monkeypatch):
+    monkeypatch.setattr(base_repo, "INSERT_BATCH_SIZE", 3)
+    interns = InternRepository(db)
+    intern_ids = [
+        interns.save(Intern(name=f"Aluno {i}", registration_number=str(i), term="t"))
+        for i in range(7)
+    ]
+    meetings = [
+        Meeting(intern_id=intern_id, meeting_date="2026-03-01", is_intern_present=True)
+        for intern_id in reversed(intern_ids)
+    ]
+
+    ids = MeetingRepository(db).save_many(meetings)
+
+    assert ids == [m.meeting_id for m in meetings]
+    assert len(set(ids)) == 7
+    stored = {m.meeting_id: m.intern_id for m in MeetingRepository(db).get_all()}
+    assert [stored[i] for i in ids] == list(reversed(intern_ids))
+
+    with pytest.raises(ValueError, match="already has an ID"):
+        MeetingRepository(db).save_many(meetings)
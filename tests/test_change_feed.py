@@ -0,0 +1,77 @@
+import pytest
+
+from data.database import DatabaseConnector
+from repository.change_log_repo import ChangeLogRepository
+from services.change_feed_service import ChangeFeedService
+
+
+@pytest.fixture
+def db():
+    connector = DatabaseConnector(db_path=":memory:")
+    yield connector
+    connector.close()
+
+
+@pytest.fixture
+def feed(db):
+    return ChangeFeedService(ChangeLogRepository(db))
+
+
+def add_intern(db, registration_number):
+    cursor = db.execute(
+        "INSERT INTO interns (name, registration_number, term) VALUES (?, ?, ?)",
+        ("Aluno", registration_number, "2026/1"),
+    )
+    db.commit()
+    return cursor.lastrowid
+
+
+def test_triggers_record_every_operation(db, feed):
+    intern_id = add_intern(db, "RA1")
+    db.execute("UPDATE interns SET name = 'Outro' WHERE intern_id = ?", (intern_id,))
+    db.execute(
+        "INSERT INTO documents (intern_id, document_name) VALUES (?, 'TCE')",
+        (intern_id,),
+    )
+    db.execute("DELETE FROM interns WHERE intern_id = ?", (intern_id,))
+    db.commit()
+
+    changes = ChangeLogRepository(db).get_changes_since(0)
+    assert [(c.table_name, c.operation) for c in changes] == [
+        ("interns", "I"),
+        ("interns", "U"),
+        ("documents", "I"),
+        ("documents", "D"),  # Cascaded from the intern
+        ("interns", "D"),
+    ]
+    assert feed.get_latest_sequence() == changes[-1].seq
+
+
+def test_changes_are_merged_per_row(db, feed):
+    kept = add_intern(db, "RA1")
+    seq = feed.get_latest_sequence()
+
+    created = add_intern(db, "RA2")
+    db.execute("UPDATE interns SET name = 'Novo' WHERE intern_id = ?", (created,))
+    db.execute("UPDATE interns SET name = 'Outro' WHERE intern_id = ?", (kept,))
+    temporary = add_intern(db, "RA3")
+    db.execute("DELETE FROM interns WHERE intern_id = ?", (temporary,))
+    db.commit()
+
+    changes = feed.get_changes_since(seq)
+    assert [(c.row_id, c.operation) for c in changes] == [(created, "I"), (kept, "U")]
+    assert feed.get_changes_since(feed.get_latest_sequence()) == []
+
+
+def test_incomplete_history_requires_full_reload(db, feed):
+    add_intern(db, "RA1")
+    seq = feed.get_latest_sequence()
+    add_intern(db, "RA2")
+    add_intern(db, "RA3")
+
+    feed.prune(keep=1)
+    assert feed.get_changes_since(seq) is None
+    assert len(feed.get_changes_since(seq + 1)) == 1
+
+    # A position ahead of the log (e.g. after restoring a snapshot).
+    assert feed.get_changes_since(feed.get_latest_sequence() + 1) is None
@@ -0,0 +1,69 @@
+import threading
+
+from data.database import DatabaseConnector
+from data.migrations import get_schema_template, get_schema_version
+from config import MIGRATIONS_DIR
+
+
+def insert_venue(db, name):
+    db.execute("INSERT INTO venues (venue_name) VALUES (?)", (name,))
+    db.commit()
+
+
+def test_memory_databases_are_isolated():
+    first = DatabaseConnector(db_path=":memory:")
+    second = DatabaseConnector(db_path=":memory:")
+    try:
+        assert first.is_memory
+        insert_venue(first, "Local A")
+        count = "SELECT COUNT(*) FROM venues"
+        assert first.execute(count).fetchone()[0] == 1
+        assert second.execute(count).fetchone()[0] == 0
+    finally:
+        first.close()
+        second.close()
+
+
+def test_memory_database_is_readable_from_worker_threads():
+    db = DatabaseConnector(db_path=":memory:")
+    try:
+        insert_venue(db, "Local A")
+        names = []
+
+        def work():
+            with db.reader():
+                names.extend(
+                    row["venue_name"] for row in db.execute("SELECT * FROM venues")
+                )
+
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()
+        assert names == ["Local A"]
+    finally:
+        db.close()
+
+
+def test_new_database_gets_the_full_schema(tmp_path):
+    latest = get_schema_version(get_schema_template(MIGRATIONS_DIR))
+    db = DatabaseConnector(db_path=tmp_path / "nested" / "new.db")
+    try:
+        assert not db.is_memory
+        assert get_schema_version(db.conn) == latest
+        assert db.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+    finally:
+        db.close()
+
+
+def test_file_uri(tmp_path):
+    path = tmp_path / "uri.db"
+    db = DatabaseConnector(db_path=f"file:{path}?cache=private")
+    try:
+        insert_venue(db, "Local A")
+    finally:
+        db.close()
+    assert path.exists()
+
+
+def test_schema_template_is_built_once():
+    assert get_schema_template(MIGRATIONS_DIR) is get_schema_template(MIGRATIONS_DIR)
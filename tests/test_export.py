@@ -0,0 +1,32 @@
+import openpyxl
+import pytest
+
+from data.database import DatabaseConnector
+from services import export_service
+from services.export_service import ExportService
+
+
+@pytest.fixture
+def db():
+    connector = DatabaseConnector(db_path=":memory:")
+    yield connector
+    connector.close()
+
+
+def test_export_streams_every_row(db, tmp_path, monkeypatch):
+    monkeypatch.setattr(export_service, "EXPORT_BATCH_SIZE", 7)
+    db.executemany(
+        "INSERT INTO interns (name, registration_number, term) VALUES (?, ?, 't')",
+        [(f"Aluno {i}", str(i)) for i in range(30)],
+    )
+    db.commit()
+
+    path = tmp_path / "export.xlsx"
+    ExportService(db).export_to_excel(str(path))
+
+    wb = openpyxl.load_workbook(path, read_only=True)
+    rows = list(wb["Interns"].values)
+    assert rows[0][:3] == ("intern_id", "name", "registration_number")
+    assert len(rows) == 31
+    assert [row[1] for row in rows[1:]] == [f"Aluno {i}" for i in range(30)]
+    assert "Evaluation_criteria" in wb.sheetnames
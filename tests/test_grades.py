@@ -0,0 +1,53 @@
+import pytest
+
+from core.models.grade import Grade
+from data.database import DatabaseConnector
+from repository.evaluation_criteria_repo import EvaluationCriteriaRepository
+from repository.grade_repo import GradeRepository
+from services.grade_service import GradeService
+
+
+@pytest.fixture
+def db():
+    connector = DatabaseConnector(db_path=":memory:")
+    connector.execute(
+        "INSERT INTO interns (intern_id, name, registration_number, term) "
+        "VALUES (1, 'Ana', '1', 't')"
+    )
+    connector.executemany(
+        "INSERT INTO evaluation_criteria (criteria_id, name, weight) VALUES (?, ?, ?)",
+        [(1, "Pontualidade", 2.0), (2, "Relatório", 5.0)],
+    )
+    connector.commit()
+    yield connector
+    connector.close()
+
+
+@pytest.fixture
+def service(db):
+    return GradeService(GradeRepository(db), EvaluationCriteriaRepository(db))
+
+
+def grade_changes(db):
+    return db.execute(
+        "SELECT operation FROM change_log WHERE table_name = 'grades' ORDER BY seq"
+    ).fetchall()
+
+
+def test_batch_inserts_then_updates_in_place(db, service):
+    service.save_batch_grades([Grade(1, 1, 1.0), Grade(1, 2, 4.0)])
+    first_ids = {g.criteria_id: g.grade_id for g in service.get_grades_by_intern(1)}
+
+    service.save_batch_grades([Grade(1, 1, 1.5), Grade(1, 2, 4.0)])
+
+    grades = service.get_grades_by_intern(1)
+    assert [(g.criteria_id, g.value) for g in grades] == [(1, 1.5), (2, 4.0)]
+    assert {g.criteria_id: g.grade_id for g in grades} == first_ids
+    # The unchanged grade was not rewritten.
+    assert [row["operation"] for row in grade_changes(db)] == ["I", "I", "U"]
+
+
+def test_invalid_grade_discards_the_batch(service):
+    with pytest.raises(ValueError):
+        service.save_batch_grades([Grade(1, 1, 1.0), Grade(1, 2, 9.0)])
+    assert service.get_grades_by_intern(1) == []
@@ -0,0 +1,141 @@
+import csv
+import shutil
+import sqlite3
+
+import pytest
+
+from config import MIGRATIONS_DIR
+from data.database import DatabaseConnector
+from data.migrations import apply_migrations
+from repository.document_repo import DocumentRepository
+from repository.intern_repo import InternRepository
+from repository.intern_summary_repo import InternSummaryRepository
+from repository.venue_repo import VenueRepository
+from services.document_service import DocumentService
+from services.import_service import ImportService
+from services.intern_service import InternService
+from services.venue_service import VenueService
+from utils.text import normalize_name
+
+HEADER = [
+    "nome",
+    "ra",
+    "periodo",
+    "local",
+    "nome_supervisor",
+    "data_inicio",
+    "data_fim",
+]
+
+
+@pytest.fixture
+def db():
+    db = DatabaseConnector(db_path=":memory:")
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def importer(db):
+    return ImportService(
+        InternService(InternRepository(db), InternSummaryRepository(db)),
+        VenueService(VenueRepository(db)),
+        DocumentService(DocumentRepository(db)),
+    )
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, delimiter=";")
+        writer.writerow(HEADER)
+        writer.writerows(rows)
+    return path
+
+
+def row(name, ra, venue="Hospital São Lucas"):
+    return [name, ra, "5", venue, "Dra. Ana", "01/02/2026", "30/06/2026"]
+
+
+def test_normalize_name():
+    assert normalize_name("  José  da SILVA ") == "jose da silva"
+    assert normalize_name("Hospital São Lucas") == "hospital sao lucas"
+
+
+def test_import_matches_existing_records(db, importer, tmp_path):
+    importer.read_file(
+        write_csv(
+            tmp_path / "first.csv",
+            [row("José da Silva", "100"), row("Maria Souza", "200", "Clínica Vida")],
+        )
+    )
+
+    interns = InternRepository(db)
+    venues = VenueRepository(db)
+    assert len(interns.get_all()) == 2
+    assert len(venues.get_all()) == 2
+    assert len(DocumentRepository(db).get_by_intern_id(1)) > 0
+
+    # Same people and venues, typed differently; one intern got a new RA.
+    importer.read_file(
+        write_csv(
+            tmp_path / "second.csv",
+            [
+                row("JOSE DA SILVA", "101", "hospital sao lucas"),
+                row("Maria Souza", "200", "CLINICA VIDA"),
+                row("Ana Lima", "300", "Clínica Vida"),
+            ],
+        )
+    )
+
+    assert len(venues.get_all()) == 2
+    jose = interns.get_by_name("José da Silva")
+    assert jose.intern_id == 1
+    assert jose.registration_number == "101"
+    assert (
+        interns.get_by_name("ana lima").venue_id
+        == venues.get_by_name("Clínica Vida").venue_id
+    )
+
+
+def test_import_lookups_do_not_grow_with_rows(db, importer, tmp_path):
+    path = write_csv(
+        tmp_path / "many.csv",
+        [row(f"Aluno {i}", str(i), f"Local {i % 3}") for i in range(60)],
+    )
+    importer.read_file(path)
+
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+    importer.read_file(path)
+    db.conn.set_trace_callback(None)
+
+    name_lookups = [s for s in statements if "normalized_name IN" in s]
+    ra_lookups = [s for s in statements if "registration_number IN" in s]
+    assert len(name_lookups) == 2
+    assert len(ra_lookups) == 1
+
+
+def test_migration_backfills_normalized_names(tmp_path):
+    # A database created before the normalized names existed.
+    old_migrations = tmp_path / "migrations"
+    old_migrations.mkdir()
+    for script in sorted(MIGRATIONS_DIR.glob("*.sql")):
+        if script.name < "0009":
+            shutil.copy(script, old_migrations)
+
+    conn = sqlite3.connect(":memory:")
+    apply_migrations(conn, old_migrations)
+    conn.execute("INSERT INTO venues (venue_name) VALUES ('Clínica Vida')")
+    conn.execute(
+        "INSERT INTO interns (name, registration_number, term) "
+        "VALUES ('Érica  Araújo', '1', '5')"
+    )
+
+    apply_migrations(conn, MIGRATIONS_DIR)
+    assert conn.execute("SELECT normalized_name FROM interns").fetchall() == [
+        ("erica araujo",)
+    ]
+    assert conn.execute("SELECT normalized_name FROM venues").fetchall() == [
+        ("clinica vida",)
+    ]
+    conn.close()
@@ -0,0 +1,127 @@
+import sqlite3
+
+import pytest
+
+from data.database import DatabaseConnector
+from data.recovery import (
+    is_corruption_error,
+    recover_database,
+    recover_in_place,
+    recovery_marker,
+    request_recovery,
+)
+from repository.maintenance_repo import MaintenanceRepository
+from services.integrity_service import IntegrityService
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return tmp_path / "interns.db"
+
+
+@pytest.fixture
+def db(db_path):
+    connector = DatabaseConnector(db_path=db_path)
+    yield connector
+    connector.close()
+
+
+def populate(db, count=3):
+    venue_id = db.execute("INSERT INTO venues (venue_name) VALUES ('Local')").lastrowid
+    for i in range(count):
+        intern_id = db.execute(
+            "INSERT INTO interns (name, registration_number, term, venue_id) "
+            "VALUES (?, ?, '2026.1', ?)",
+            (f"Aluno {i}", f"RA{i}", venue_id),
+        ).lastrowid
+        db.execute(
+            "INSERT INTO documents (intern_id, document_name) VALUES (?, 'TCE')",
+            (intern_id,),
+        )
+        db.execute(
+            "INSERT INTO observations (intern_id, observation) VALUES (?, 'Chegou atrasado')",
+            (intern_id,),
+        )
+    db.commit()
+
+
+def test_check_reports_progress_and_records_a_healthy_database(db, db_path):
+    service = IntegrityService(MaintenanceRepository(db))
+    assert service.is_due()
+
+    progress = []
+    with service.reader():
+        run = service.check(on_progress=lambda done, total: progress.append(done))
+
+    assert run.result == "ok"
+    assert progress and progress == list(range(1, len(progress) + 1))
+    assert service.record(run)
+    assert not service.is_due()
+    assert not recovery_marker(db_path).exists()
+
+
+def test_check_can_be_cancelled(db):
+    service = IntegrityService(MaintenanceRepository(db))
+    assert service.check(is_cancelled=lambda: True) is None
+
+
+def test_failed_check_flags_the_database_for_recovery(db, db_path):
+    service = IntegrityService(MaintenanceRepository(db))
+    run = service.check()
+    run.result = "interns: row 1 missing from index"
+
+    assert not service.record(run)
+    assert recovery_marker(db_path).exists()
+
+
+def test_recovery_copies_rows_and_rebuilds_derived_data(db, db_path, tmp_path):
+    populate(db)
+    db.close()
+
+    target = tmp_path / "recovered.db"
+    report = recover_database(db_path, target)
+
+    assert report.errors == []
+    assert report.rows["interns"] == 3
+    assert report.rows["documents"] == 3
+    assert "intern_summary" not in report.rows
+
+    recovered = DatabaseConnector(db_path=target)
+    try:
+        summary = recovered.execute(
+            "SELECT count(*) FROM intern_summary WHERE total_docs = 1"
+        ).fetchone()[0]
+        matches = recovered.execute(
+            "SELECT count(*) FROM observations_fts WHERE observations_fts MATCH 'atrasado'"
+        ).fetchone()[0]
+        changes = recovered.execute("SELECT count(*) FROM change_log").fetchone()[0]
+    finally:
+        recovered.close()
+    assert (summary, matches, changes) == (3, 3, 0)
+
+
+def test_recover_in_place_keeps_the_damaged_file(db, db_path):
+    populate(db)
+    db.close()
+    request_recovery(db_path)
+
+    report = recover_in_place(db_path)
+
+    assert report.target == db_path
+    assert report.damaged_copy.exists()
+    assert not recovery_marker(db_path).exists()
+    reopened = DatabaseConnector(db_path=db_path)
+    try:
+        assert reopened.execute("SELECT count(*) FROM interns").fetchone()[0] == 3
+    finally:
+        reopened.close()
+
+
+def test_garbage_file_is_a_corruption_error(tmp_path):
+    path = tmp_path / "garbage.db"
+    path.write_bytes(b"not a database" * 512)
+
+    with pytest.raises(sqlite3.DatabaseError) as excinfo:
+        DatabaseConnector(db_path=path)
+    assert is_corruption_error(excinfo.value)
+    assert not is_corruption_error(sqlite3.OperationalError("database is locked"))
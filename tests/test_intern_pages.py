@@ -0,0 +1,143 @@
+import pytest
+
+from core.models.intern import Intern
+from core.models.intern_filter import InternFilter
+from core.models.intern_row import InternRow
+from core.models.venue import Venue
+from data.database import DatabaseConnector
+from repository.intern_repo import InternRepository
+from repository.venue_repo import VenueRepository
+
+
+@pytest.fixture
+def db():
+    connector = DatabaseConnector(db_path=":memory:")
+    yield connector
+    connector.close()
+
+
+@pytest.fixture
+def repo(db):
+    venue_id = db.execute("INSERT INTO venues (venue_name) VALUES ('Local')").lastrowid
+    rows = [
+        # Equal names (in any case) are ordered by ID.
+        ("ana", "2026.1", None, venue_id),
+        ("Ana", "2026.1", "2000-01-31", None),
+        ("Bruno", "2026.2", "2999-12-31", venue_id),
+        ("carla", "2026.1", "31/01/2000", None),  # Not ISO: 'Ativo'
+        ("Daniel", "2026.2", "2001-06-30", venue_id),
+    ]
+    db.executemany(
+        "INSERT INTO interns (name, registration_number, term, end_date, venue_id) "
+        "VALUES (?, ?, ?, ?, ?)",
+        [
+            (name, f"RA{i}", term, end, venue)
+            for i, (name, term, end, venue) in enumerate(rows)
+        ],
+    )
+    return InternRepository(db)
+
+
+def read_pages(repo, filters=None, limit=2):
+    pages, after = [], None
+    while True:
+        page = repo.get_page(filters, after, limit)
+        pages.append([intern.intern_id for intern in page])
+        if len(page) < limit:
+            return pages
+        after = (page[-1].name, page[-1].intern_id)
+
+
+def test_pages_follow_the_list_order(repo):
+    assert read_pages(repo) == [[1, 2], [3, 4], [5]]
+    assert sum(read_pages(repo, limit=10), []) == [i.intern_id for i in repo.get_all()]
+
+
+@pytest.mark.parametrize(
+    "filters, expected",
+    [
+        (InternFilter(term="2026.1"), [1, 2, 4]),
+        (InternFilter(venue_id=1), [1, 3, 5]),
+        (InternFilter(venue_id=0), [2, 4]),
+        (InternFilter(status="Concluído"), [2, 5]),
+        (InternFilter(status="Ativo", term="2026.1"), [1, 4]),
+    ],
+)
+def test_filters_apply_to_pages_and_count(repo, filters, expected):
+    assert sum(read_pages(repo, filters), []) == expected
+    assert repo.count(filters) == len(expected)
+
+    # Same rule as the model's `status` property.
+    if filters.status:
+        for intern in repo.get_page(filters, limit=10):
+            assert intern.status == filters.status
+
+
+def test_unknown_status_is_rejected(repo):
+    with pytest.raises(ValueError):
+        repo.get_page(InternFilter(status="Trancado"))
+
+
+@pytest.mark.parametrize("filters", [None, InternFilter(venue_id=1)])
+def test_list_rows_match_the_interns(repo, filters):
+    venue_names = {v.venue_id: v.venue_name for v in VenueRepository(repo.db).get_all()}
+    expected = [
+        InternRow(
+            intern.intern_id,
+            intern.name,
+            venue_names.get(intern.venue_id),
+            intern.registration_number,
+            intern.status,
+        )
+        for intern in repo.get_page(filters, limit=10)
+    ]
+
+    assert repo.list_rows(filters, limit=10) == expected
+    assert (
+        repo.list_rows(
+            filters, after=(expected[0].name, expected[0].intern_id), limit=10
+        )
+        == expected[1:]
+    )
+    assert repo.get_row(expected[-1].intern_id) == expected[-1]
+    assert repo.get_row(99) is None
+
+
+@pytest.mark.parametrize(
+    "search, expected",
+    [
+        ("jose", ["José Ávila"]),
+        ("  ÁVILA ", ["José Ávila"]),
+        ("sao lucas", ["Ana_Lima", "José Ávila"]),
+        ("ra-2", ["Márcia 100%"]),
+        ("_", ["Ana_Lima"]),
+        ("100%", ["Márcia 100%"]),
+        ("nada", []),
+    ],
+)
+def test_search_filter(db, search, expected):
+    venue_id = VenueRepository(db).save(Venue(venue_name="Hospital São Lucas"))
+    repo = InternRepository(db)
+    for i, (name, venue) in enumerate(
+        [("José Ávila", venue_id), ("Ana_Lima", venue_id), ("Márcia 100%", None)]
+    ):
+        repo.save(
+            Intern(name=name, registration_number=f"RA-{i}", term="1", venue_id=venue)
+        )
+
+    filters = InternFilter(search=search)
+    assert [row.name for row in repo.list_rows(filters, limit=10)] == sorted(expected)
+    assert [i.name for i in repo.get_page(filters, limit=10)] == sorted(expected)
+    assert repo.count(filters) == len(expected)
+
+
+def test_list_key_sorts_like_the_list(db):
+    db.executemany(
+        "INSERT INTO interns (name, registration_number, term) VALUES (?, ?, '1')",
+        [
+            (name, str(i))
+            for i, name in enumerate(["Zé", "ágata", "Ágata", "ana", "Ana", "Bia"])
+        ],
+    )
+    rows = InternRepository(db).list_rows(limit=10)
+    assert sorted(rows, key=lambda row: row.list_key) == rows
@@ -0,0 +1,116 @@
+import shutil
+import sqlite3
+
+import pytest
+
+from config import MIGRATIONS_DIR
+from data.database import DatabaseConnector
+from data.migrations import apply_migrations
+from repository.intern_summary_repo import InternSummaryRepository
+
+# The counters recomputed from the base tables.
+EXPECTED_SUMMARY = """
+SELECT i.intern_id,
+       (SELECT COUNT(*) FROM documents d WHERE d.intern_id = i.intern_id),
+       (SELECT COUNT(*) FROM documents d
+        WHERE d.intern_id = i.intern_id AND d.status IS NOT 'Aprovado'),
+       (SELECT COUNT(*) FROM meetings m WHERE m.intern_id = i.intern_id),
+       (SELECT COALESCE(SUM(is_intern_present), 0) FROM meetings m
+        WHERE m.intern_id = i.intern_id),
+       (SELECT COALESCE(SUM(value), 0.0) FROM grades g WHERE g.intern_id = i.intern_id)
+FROM interns i
+ORDER BY i.intern_id
+"""
+
+
+def summary_rows(conn):
+    return [
+        tuple(row)
+        for row in conn.execute(
+            "SELECT intern_id, total_docs, pending_docs, total_meetings, "
+            "present_meetings, grade_total FROM intern_summary ORDER BY intern_id"
+        )
+    ]
+
+
+def populate(conn):
+    conn.execute("INSERT INTO evaluation_criteria (criteria_id, name) VALUES (1, 'A')")
+    conn.execute("INSERT INTO evaluation_criteria (criteria_id, name) VALUES (2, 'B')")
+    for intern_id in (1, 2, 3):
+        conn.execute(
+            "INSERT INTO interns (intern_id, name, registration_number, term) "
+            "VALUES (?, 'Aluno', ?, '2026/1')",
+            (intern_id, f"RA{intern_id}"),
+        )
+    conn.executemany(
+        "INSERT INTO documents (intern_id, document_name, status) VALUES (?, 'Doc', ?)",
+        [(1, "Pendente"), (1, "Aprovado"), (2, "Aprovado"), (2, None)],
+    )
+    conn.executemany(
+        "INSERT INTO meetings (intern_id, meeting_date, is_intern_present) "
+        "VALUES (?, '2026-03-01', ?)",
+        [(1, 1), (1, 0), (2, 1)],
+    )
+    conn.executemany(
+        "INSERT INTO grades (intern_id, criteria_id, value) VALUES (?, ?, ?)",
+        [(1, 1, 2.5), (1, 2, 1.0), (3, 1, 4.0)],
+    )
+    conn.commit()
+
+
+@pytest.fixture
+def db():
+    connector = DatabaseConnector(db_path=":memory:")
+    yield connector
+    connector.close()
+
+
+def test_triggers_keep_the_summary_in_sync(db):
+    populate(db.conn)
+    db.execute("UPDATE documents SET status = 'Aprovado' WHERE intern_id = 1")
+    db.execute("UPDATE documents SET intern_id = 3 WHERE status IS NULL")
+    db.execute("UPDATE meetings SET is_intern_present = 1 WHERE intern_id = 1")
+    db.execute("UPDATE grades SET value = 3.0 WHERE intern_id = 1 AND criteria_id = 1")
+    db.execute("DELETE FROM grades WHERE intern_id = 3")
+    db.execute("DELETE FROM meetings WHERE intern_id = 2")
+    db.execute("DELETE FROM interns WHERE intern_id = 2")
+    db.commit()
+
+    assert summary_rows(db.conn) == [
+        tuple(r) for r in db.conn.execute(EXPECTED_SUMMARY)
+    ]
+
+
+def test_counts_for_the_dashboard(db):
+    populate(db.conn)
+    repo = InternSummaryRepository(db)
+
+    # Intern 1: one pending, intern 2: one without status, intern 3: no documents.
+    assert repo.count_pending_items() == 3
+    assert repo.count_document_compliance() == (0, 3)
+
+    db.execute("UPDATE documents SET status = 'Aprovado'")
+    db.commit()
+    assert repo.count_pending_items() == 1
+    assert repo.count_document_compliance() == (2, 1)
+
+    summary = repo.get_by_intern_id(1)
+    assert summary.grade_total == 3.5
+    assert summary.last_activity is not None
+
+
+def test_migration_backfills_existing_interns(tmp_path):
+    # A database created before the summary existed.
+    old_migrations = tmp_path / "migrations"
+    old_migrations.mkdir()
+    for script in sorted(MIGRATIONS_DIR.glob("*.sql")):
+        if script.name < "0007":
+            shutil.copy(script, old_migrations)
+
+    conn = sqlite3.connect(":memory:")
+    apply_migrations(conn, old_migrations)
+    populate(conn)
+
+    apply_migrations(conn, MIGRATIONS_DIR)
+    assert summary_rows(conn) == [tuple(r) for r in conn.execute(EXPECTED_SUMMARY)]
+    conn.close()
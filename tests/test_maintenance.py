@@ -0,0 +1,67 @@
+import sqlite3
+
+import pytest
+
+from data.database import DatabaseConnector
+from repository.maintenance_repo import MaintenanceRepository
+from services.maintenance_service import MaintenanceService
+
+
+@pytest.fixture
+def db(tmp_path):
+    connector = DatabaseConnector(db_path=tmp_path / "maintenance.db")
+    yield connector
+    connector.close()
+
+
+@pytest.fixture
+def service(db):
+    return MaintenanceService(MaintenanceRepository(db))
+
+
+def test_new_database_uses_incremental_auto_vacuum(service):
+    assert service.repo.get_auto_vacuum() == 2
+
+
+def test_run_records_due_tasks_once(service):
+    first = {run.task: run.result for run in service.run(budget_ms=5000)}
+    assert first == {"optimize": "ok", "analyze": "ok"}
+
+    # ANALYZE is not due again right away.
+    second = [run.task for run in service.run(budget_ms=5000)]
+    assert second == ["optimize"]
+    assert len(service.get_history()) == 3
+
+
+def test_incremental_vacuum_releases_free_pages(db, service):
+    with db.transaction():
+        db.executemany(
+            "INSERT INTO maintenance_runs (task, started_at, duration_ms, result) "
+            "VALUES ('filler', '2000-01-01', 0, ?)",
+            [("x" * 2000,) for _ in range(500)],
+        )
+    db.execute("DELETE FROM maintenance_runs")
+    db.commit()
+    assert service.repo.get_freelist_count() > 0
+
+    runs = {run.task: run.result for run in service.run(budget_ms=5000)}
+
+    assert runs["incremental_vacuum"].startswith("ok:")
+    assert service.repo.get_freelist_count() == 0
+
+
+def test_no_budget_runs_nothing(service):
+    assert service.run(budget_ms=0) == []
+
+
+def test_time_limit_interrupts_long_statements(db):
+    slow_query = """
+    WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n)
+    SELECT count(*) FROM n
+    """
+    with pytest.raises(sqlite3.OperationalError, match="interrupt"):
+        with db.time_limit(20):
+            db.execute(slow_query).fetchall()
+
+    # The handler is removed when the block exits.
+    assert db.execute("SELECT 1").fetchone()[0] == 1
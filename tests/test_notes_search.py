@@ -0,0 +1,78 @@
+import pytest
+
+from core.models.document import Document
+from core.models.observation import Observation
+from data.database import DatabaseConnector
+from repository.document_repo import DocumentRepository
+from repository.observation_repo import ObservationRepository
+from services.document_service import DocumentService
+from services.observation_service import ObservationService
+
+
+@pytest.fixture
+def db():
+    connector = DatabaseConnector(db_path=":memory:")
+    connector.execute(
+        "INSERT INTO interns (intern_id, name, registration_number, term) "
+        "VALUES (1, 'Aluno', 'RA1', '2026/1')"
+    )
+    connector.commit()
+    yield connector
+    connector.close()
+
+
+@pytest.fixture
+def observations(db):
+    return ObservationService(ObservationRepository(db))
+
+
+@pytest.fixture
+def documents(db):
+    return DocumentService(DocumentRepository(db))
+
+
+def test_search_ignores_accents_and_matches_prefixes(observations):
+    observations.add_new_observation(
+        Observation(intern_id=1, observation="Ótima avaliação no plantão")
+    )
+    observations.add_new_observation(
+        Observation(intern_id=1, observation="Faltou à reunião")
+    )
+
+    results = observations.search_observations("avaliacao plant")
+    assert len(results) == 1
+    assert results[0].intern_id == 1
+    assert "[avaliação]" in results[0].snippet
+
+
+def test_index_follows_updates_and_deletes(observations):
+    obs_id = observations.add_new_observation(
+        Observation(intern_id=1, observation="texto antigo")
+    )
+    obs = observations.get_by_id(obs_id)
+    obs.observation = "texto novo"
+    observations.update_observation(obs)
+
+    assert observations.search_observations("antigo") == []
+    assert len(observations.search_observations("novo")) == 1
+
+    observations.delete_observation(obs)
+    assert observations.search_observations("novo") == []
+
+
+def test_feedback_search(documents):
+    doc_id = documents.add_new_document(
+        Document(intern_id=1, document_name="TCE", status="Pendente")
+    )
+    doc = documents.get_document_by_id(doc_id)
+    doc.feedback = "Falta assinatura do supervisor"
+    documents.update_document(doc)
+
+    results = documents.search_feedback("assinatura")
+    assert [r.source_id for r in results] == [doc_id]
+
+
+def test_operators_in_the_input_are_plain_words(observations, documents):
+    assert observations.search_observations('"') == []
+    assert observations.search_observations("NOT OR (") == []
+    assert documents.search_feedback("") == []
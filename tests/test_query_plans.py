@@ -0,0 +1,331 @@
+"""
+Query plans of the repository reads.
+
+Every read issued by a repository is captured from the connection and run
+through `EXPLAIN QUERY PLAN`, so a dropped index or a query rewritten into a
+full scan (or an extra sort) fails here instead of showing up as a slow UI.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from data.database import DatabaseConnector
+from repository.change_log_repo import ChangeLogRepository
+from repository.document_repo import DocumentRepository
+from repository.evaluation_criteria_repo import EvaluationCriteriaRepository
+from repository.grade_repo import GradeRepository
+from repository.intern_repo import InternRepository
+from repository.intern_summary_repo import InternSummaryRepository
+from repository.meeting_repo import MeetingRepository
+from repository.observation_repo import ObservationRepository
+from repository.venue_repo import VenueRepository
+
+
+@pytest.fixture
+def db():
+    connector = DatabaseConnector(db_path=":memory:")
+    yield connector
+    connector.close()
+
+
+@pytest.fixture
+def repos(db):
+    return SimpleNamespace(
+        intern=InternRepository(db),
+        venue=VenueRepository(db),
+        document=DocumentRepository(db),
+        observation=ObservationRepository(db),
+        criteria=EvaluationCriteriaRepository(db),
+        grade=GradeRepository(db),
+        meeting=MeetingRepository(db),
+        change_log=ChangeLogRepository(db),
+        summary=InternSummaryRepository(db),
+    )
+
+
+def query_plans(db, call):
+    """Runs `call` and returns the plan of every SELECT it issued."""
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+    try:
+        call()
+    finally:
+        db.conn.set_trace_callback(None)
+
+    # The trace callback receives the statements with the parameters bound.
+    # FTS5 reads its shadow tables (`'main'.'<name>_config'`) with statements
+    # of its own; those are not repository reads.
+    return [
+        [row[3] for row in db.conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+        for sql in statements
+        if sql.lstrip().upper().startswith("SELECT") and "'main'." not in sql
+    ]
+
+
+QUERY_PLANS = {
+    # --- Interns ---
+    "intern.get_all": (
+        lambda r: r.intern.get_all(),
+        ["SCAN interns USING INDEX idx_interns_name_nocase"],
+    ),
+    "intern.get_by_id": (
+        lambda r: r.intern.get_by_id(1),
+        ["SEARCH interns USING INTEGER PRIMARY KEY (rowid=?)"],
+    ),
+    "intern.get_by_registration_number": (
+        lambda r: r.intern.get_by_registration_number("RA"),
+        [
+            "SEARCH interns USING INDEX sqlite_autoindex_interns_1 "
+            "(registration_number=?)"
+        ],
+    ),
+    "intern.get_by_name": (
+        lambda r: r.intern.get_by_name("Maria"),
+        ["SEARCH interns USING INDEX idx_interns_normalized_name (normalized_name=?)"],
+    ),
+    "intern.get_by_registration_numbers": (
+        lambda r: r.intern.get_by_registration_numbers(["RA1", "RA2"]),
+        [
+            "SEARCH interns USING INDEX sqlite_autoindex_interns_1 "
+            "(registration_number=?)",
+            "LIST SUBQUERY 1",
+            "SCAN json_each VIRTUAL TABLE INDEX 1:",
+        ],
+    ),
+    "intern.get_by_normalized_names": (
+        lambda r: r.intern.get_by_normalized_names(["maria"]),
+        [
+            "SEARCH interns USING INDEX idx_interns_normalized_name (normalized_name=?)",
+            "LIST SUBQUERY 1",
+            "SCAN json_each VIRTUAL TABLE INDEX 1:",
+            "USE TEMP B-TREE FOR ORDER BY",
+        ],
+    ),
+    "intern.get_page": (
+        lambda r: r.intern.get_page(limit=50),
+        ["SCAN interns USING INDEX idx_interns_name_nocase"],
+    ),
+    # Later pages seek to the (name, intern_id) key instead of skipping rows.
+    "intern.get_page_after": (
+        lambda r: r.intern.get_page(after=("Maria", 7), limit=50),
+        ["SEARCH interns USING INDEX idx_interns_name_nocase (name>?)"],
+    ),
+    # The venue name is one primary-key lookup per row of the page.
+    "intern.list_rows": (
+        lambda r: r.intern.list_rows(limit=50),
+        [
+            "SCAN interns USING INDEX idx_interns_name_nocase",
+            "SEARCH venues USING INTEGER PRIMARY KEY (rowid=?) LEFT-JOIN",
+        ],
+    ),
+    "intern.list_rows_after": (
+        lambda r: r.intern.list_rows(after=("Maria", 7), limit=50),
+        [
+            "SEARCH interns USING INDEX idx_interns_name_nocase (name>?)",
+            "SEARCH venues USING INTEGER PRIMARY KEY (rowid=?) LEFT-JOIN",
+        ],
+    ),
+    "intern.get_row": (
+        lambda r: r.intern.get_row(1),
+        [
+            "SEARCH interns USING INTEGER PRIMARY KEY (rowid=?)",
+            "SEARCH venues USING INTEGER PRIMARY KEY (rowid=?) LEFT-JOIN",
+        ],
+    ),
+    "intern.count": (
+        lambda r: r.intern.count(),
+        ["SCAN interns USING COVERING INDEX idx_interns_venue_id"],
+    ),
+    # --- Venues ---
+    "venue.get_all": (
+        lambda r: r.venue.get_all(),
+        ["SCAN venues USING INDEX idx_venues_name_nocase"],
+    ),
+    "venue.get_by_id": (
+        lambda r: r.venue.get_by_id(1),
+        ["SEARCH venues USING INTEGER PRIMARY KEY (rowid=?)"],
+    ),
+    "venue.get_by_name": (
+        lambda r: r.venue.get_by_name("Local"),
+        ["SEARCH venues USING INDEX idx_venues_normalized_name (normalized_name=?)"],
+    ),
+    "venue.get_by_normalized_names": (
+        lambda r: r.venue.get_by_normalized_names(["local"]),
+        [
+            "SEARCH venues USING INDEX idx_venues_normalized_name (normalized_name=?)",
+            "LIST SUBQUERY 1",
+            "SCAN json_each VIRTUAL TABLE INDEX 1:",
+            "USE TEMP B-TREE FOR ORDER BY",
+        ],
+    ),
+    # --- Documents ---
+    "document.get_by_intern_id": (
+        lambda r: r.document.get_by_intern_id(1),
+        ["SEARCH documents USING INDEX idx_documents_intern_id (intern_id=?)"],
+    ),
+    "document.get_by_id": (
+        lambda r: r.document.get_by_id(1),
+        ["SEARCH documents USING INTEGER PRIMARY KEY (rowid=?)"],
+    ),
+    # Batched loaders: one index lookup per key of the bound JSON array; the
+    # ORDER BY within the groups sorts the fetched rows only.
+    "document.get_by_intern_ids": (
+        lambda r: r.document.get_by_intern_ids([1, 2]),
+        [
+            "SEARCH documents USING INDEX idx_documents_intern_id (intern_id=?)",
+            "LIST SUBQUERY 1",
+            "SCAN json_each VIRTUAL TABLE INDEX 1:",
+        ],
+    ),
+    "document.count_pending": (
+        lambda r: r.document.count_pending(),
+        ["SCAN documents USING INDEX idx_documents_pending"],
+    ),
+    "document.get_status_histogram": (
+        lambda r: r.document.get_status_histogram(),
+        ["SCAN documents USING COVERING INDEX idx_documents_name_status"],
+    ),
+    "document.count_pending_by_intern": (
+        lambda r: r.document.count_pending_by_intern(),
+        ["SCAN documents USING INDEX idx_documents_pending"],
+    ),
+    # Interns in rowid order, so the GROUP BY needs no sort.
+    "document.count_interns_by_approval": (
+        lambda r: r.document.count_interns_by_approval(["TCE"]),
+        [
+            "CO-ROUTINE (subquery-2)",
+            "SCAN i",
+            "SEARCH d USING INDEX idx_documents_intern_id (intern_id=?) LEFT-JOIN",
+            "LIST SUBQUERY 1",
+            "SCAN json_each VIRTUAL TABLE INDEX 1:",
+            "SCAN (subquery-2)",
+        ],
+    ),
+    "document.search_feedback": (
+        lambda r: r.document.search_feedback('"x"*'),
+        [
+            "SCAN documents_fts VIRTUAL TABLE INDEX 32:M1",
+            "SEARCH d USING INTEGER PRIMARY KEY (rowid=?)",
+        ],
+    ),
+    # --- Evaluation criteria ---
+    # A handful of rows: sorting them is cheaper than maintaining an index.
+    "criteria.get_all": (
+        lambda r: r.criteria.get_all(),
+        ["SCAN evaluation_criteria", "USE TEMP B-TREE FOR ORDER BY"],
+    ),
+    "criteria.get_by_id": (
+        lambda r: r.criteria.get_by_id(1),
+        ["SEARCH evaluation_criteria USING INTEGER PRIMARY KEY (rowid=?)"],
+    ),
+    # --- Grades ---
+    "grade.get_all": (
+        lambda r: r.grade.get_all(),
+        ["SCAN grades USING INDEX idx_grades_last_update"],
+    ),
+    "grade.get_by_intern_id": (
+        lambda r: r.grade.get_by_intern_id(1),
+        ["SEARCH grades USING INDEX sqlite_autoindex_grades_1 (intern_id=?)"],
+    ),
+    "grade.get_by_id": (
+        lambda r: r.grade.get_by_id(1),
+        ["SEARCH grades USING INTEGER PRIMARY KEY (rowid=?)"],
+    ),
+    "grade.get_by_intern_ids": (
+        lambda r: r.grade.get_by_intern_ids([1, 2]),
+        [
+            "SEARCH grades USING INDEX sqlite_autoindex_grades_1 (intern_id=?)",
+            "LIST SUBQUERY 1",
+            "SCAN json_each VIRTUAL TABLE INDEX 1:",
+            "USE TEMP B-TREE FOR ORDER BY",
+        ],
+    ),
+    # --- Meetings ---
+    "meeting.get_all": (
+        lambda r: r.meeting.get_all(),
+        ["SCAN meetings USING INDEX idx_meetings_meeting_date"],
+    ),
+    "meeting.get_by_intern_id": (
+        lambda r: r.meeting.get_by_intern_id(1),
+        ["SEARCH meetings USING INDEX idx_meetings_intern_id (intern_id=?)"],
+    ),
+    "meeting.count_between": (
+        lambda r: r.meeting.count_between("2026-03-01", "2026-04-01"),
+        [
+            "SEARCH meetings USING COVERING INDEX idx_meetings_meeting_date "
+            "(meeting_date>? AND meeting_date<?)"
+        ],
+    ),
+    "meeting.get_by_intern_ids": (
+        lambda r: r.meeting.get_by_intern_ids([1, 2]),
+        [
+            "SEARCH meetings USING INDEX idx_meetings_intern_id (intern_id=?)",
+            "LIST SUBQUERY 1",
+            "SCAN json_each VIRTUAL TABLE INDEX 1:",
+            "USE TEMP B-TREE FOR ORDER BY",
+        ],
+    ),
+    # --- Observations ---
+    "observation.get_all": (
+        lambda r: r.observation.get_all(),
+        ["SCAN observations USING INDEX idx_observations_last_update"],
+    ),
+    "observation.get_by_id": (
+        lambda r: r.observation.get_by_id(1),
+        ["SEARCH observations USING INTEGER PRIMARY KEY (rowid=?)"],
+    ),
+    "observation.get_by_intern_id": (
+        lambda r: r.observation.get_by_intern_id(1),
+        ["SEARCH observations USING INDEX idx_observations_intern_id (intern_id=?)"],
+    ),
+    "observation.get_by_intern_ids": (
+        lambda r: r.observation.get_by_intern_ids([1, 2]),
+        [
+            "SEARCH observations USING INDEX idx_observations_intern_id (intern_id=?)",
+            "LIST SUBQUERY 1",
+            "SCAN json_each VIRTUAL TABLE INDEX 1:",
+            "USE TEMP B-TREE FOR ORDER BY",
+        ],
+    ),
+    # Ranked by FTS5 itself (the built-in `rank` column): no sort step.
+    "observation.search": (
+        lambda r: r.observation.search('"x"*'),
+        [
+            "SCAN observations_fts VIRTUAL TABLE INDEX 32:M1",
+            "SEARCH o USING INTEGER PRIMARY KEY (rowid=?)",
+        ],
+    ),
+    # --- Intern summary ---
+    "summary.get_by_intern_id": (
+        lambda r: r.summary.get_by_intern_id(1),
+        ["SEARCH intern_summary USING INTEGER PRIMARY KEY (rowid=?)"],
+    ),
+    # One narrow row per intern: a scan replaces a query per intern.
+    "summary.count_pending_items": (
+        lambda r: r.summary.count_pending_items(),
+        ["SCAN intern_summary"],
+    ),
+    # --- Change feed ---
+    "change_log.get_changes_since": (
+        lambda r: r.change_log.get_changes_since(0),
+        ["SEARCH change_log USING INTEGER PRIMARY KEY (rowid>?)"],
+    ),
+}
+
+
+@pytest.mark.parametrize("name", QUERY_PLANS)
+def test_repository_query_plan(db, repos, name):
+    call, expected = QUERY_PLANS[name]
+    assert query_plans(db, lambda: call(repos)) == [expected]
+
+
+def test_pending_count_uses_partial_index(db):
+    indexes = {
+        row["name"]
+        for row in db.conn.execute(
+            "SELECT name FROM sqlite_master WHERE tbl_name = 'documents'"
+        )
+    }
+    assert "idx_documents_pending" in indexes
+    assert "idx_documents_status" not in indexes
@@ -0,0 +1,100 @@
+import pytest
+
+from core.models.evaluation_criteria import EvaluationCriteria
+from core.models.intern import Intern
+from data.database import DatabaseConnector
+from data.session import Session
+from repository.evaluation_criteria_repo import EvaluationCriteriaRepository
+from repository.intern_repo import InternRepository
+from repository.intern_summary_repo import InternSummaryRepository
+from services.evaluation_criteria_service import EvaluationCriteriaService
+from services.intern_service import InternService
+
+
+@pytest.fixture
+def db():
+    db = DatabaseConnector(db_path=":memory:")
+    db.executemany(
+        "INSERT INTO interns (intern_id, name, registration_number, term, "
+        "start_date, end_date) VALUES (?, ?, ?, '5', '2026-02-01', '2026-06-30')",
+        [(1, "Ana", "1"), (2, "Bia", "2")],
+    )
+    db.execute("INSERT INTO evaluation_criteria (name, weight) VALUES ('Diário', 3.0)")
+    db.commit()
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def session(db):
+    return Session(db)
+
+
+@pytest.fixture
+def service(db, session):
+    return InternService(InternRepository(db), InternSummaryRepository(db), session)
+
+
+def selects(db, call):
+    statements = []
+    db.conn.set_trace_callback(statements.append)
+    try:
+        result = call()
+    finally:
+        db.conn.set_trace_callback(None)
+    return result, [s for s in statements if s.lstrip().startswith("SELECT")]
+
+
+def test_same_instance_without_reading_again(db, service):
+    first = service.get_by_id(1)
+    again, statements = selects(db, lambda: service.get_by_id(1))
+    assert again is first
+    assert statements == []
+
+    assert service.get_by_id(99) is None
+    assert service.get_by_id(2) is not first
+
+
+def test_update_keeps_session_current(db, service):
+    intern = service.get_by_id(1)
+    intern.name = "Ana Lima"
+    service.update_intern(intern)
+    assert service.get_by_id(1) is intern
+    assert InternRepository(db).get_by_id(1).name == "Ana Lima"
+
+    # A rejected edit does not leave the modified instance behind.
+    intern.registration_number = "2"
+    with pytest.raises(ValueError):
+        service.update_intern(intern)
+    fresh = service.get_by_id(1)
+    assert fresh is not intern
+    assert fresh.registration_number == "1"
+
+
+def test_delete_and_rollback_evict(db, service):
+    service.delete_intern(service.get_by_id(2))
+    assert service.get_by_id(2) is None
+
+    intern = service.get_by_id(1)
+    with pytest.raises(RuntimeError), service.transaction():
+        intern.name = "Outro Nome"
+        service.update_intern(intern)
+        raise RuntimeError("abort")
+    assert service.get_by_id(1).name == "Ana"
+
+
+def test_criteria_list_is_reused_until_a_write(db, session):
+    service = EvaluationCriteriaService(EvaluationCriteriaRepository(db), session)
+    first = service.list_active_criteria()
+    again, statements = selects(db, service.list_active_criteria)
+    assert statements == []
+    assert again == first and again[0] is first[0]
+
+    service.add_new_criteria(EvaluationCriteria(name="Reuniões", weight=2.0))
+    assert len(service.list_active_criteria()) == 2
+
+
+def test_without_session_reads_every_time(db):
+    service = InternService(InternRepository(db), InternSummaryRepository(db))
+    assert service.get_by_id(1) is not service.get_by_id(1)
+    assert isinstance(service.get_by_id(1), Intern)